@@ -1,14 +1,114 @@
 from pathlib import Path
 import asyncio
+import concurrent.futures
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import weakref
+from collections import OrderedDict
 from dataclasses import asdict
+from datetime import datetime
+from typing import Literal, Optional, Tuple, Union
 from crawl4ai.async_logger import AsyncLogger
 from crawl4ai.async_crawler_strategy import AsyncCrawlerStrategy
 from crawl4ai.models import AsyncCrawlResponse, ScrapingResult
 from crawl4ai.content_scraping_strategy import ContentScrapingStrategy
 from .processor import (
     NaivePDFProcessorStrategy,
+    PDFMetadata,
+    PDFPage,
+    PDFProcessResult,
 )  # Assuming your current PDF code is in pdf_processor.py
 
+# Max PDF size: 100 MB
+MAX_PDF_BYTES = 100 * 1024 * 1024
+
+# 256 KiB per read/write keeps the syscall count low on large downloads
+PDF_DOWNLOAD_CHUNK_SIZE = 256 * 1024
+
+# Connection timeout: 20s, Read timeout: 600s (10 minutes for large PDFs)
+PDF_CONNECT_TIMEOUT = 20.0
+PDF_READ_TIMEOUT = 60 * 10.0
+
+# Downloads with a known size up to this stay in memory instead of a temp file
+PDF_IN_MEMORY_MAX_BYTES = 10 * 1024 * 1024
+
+# Number of processed PDFs kept in memory, keyed by content digest
+PDF_RESULT_CACHE_SIZE = 32
+
+# Number of processed PDFs kept on disk when disk_cache is enabled
+PDF_DISK_CACHE_SIZE = 256
+
+# Chunk size for the blocking os.write download path
+PDF_WRITE_BUFFER_SIZE = 1 << 20
+
+_O_BINARY = getattr(os, "O_BINARY", 0)  # Windows only
+
+# Fixed pieces of the combined cleaned_html document
+_HTML_PREFIX = '<html><head><meta name="pdf-pages" content="%d"></head><body>'
+_HTML_SUFFIX = "</body></html>"
+_PAGE_DIV = '<div class="pdf-page" data-page="%d">%s</div>'
+
+
+_SHARED_CLIENT = None  # Module-wide sync httpx.Client, created on first use
+_SHARED_CLIENT_LOCK = threading.Lock()
+
+
+def _new_http_client(async_: bool = False):
+    """Keep-alive, HTTP/2 client so repeat downloads skip TCP/TLS setup."""
+    import httpx
+
+    cls = httpx.AsyncClient if async_ else httpx.Client
+    return cls(
+        http2=True,
+        follow_redirects=True,
+        timeout=httpx.Timeout(PDF_CONNECT_TIMEOUT, read=PDF_READ_TIMEOUT),
+        limits=httpx.Limits(max_keepalive_connections=64),
+    )
+
+
+def _get_http_client():
+    global _SHARED_CLIENT
+    if _SHARED_CLIENT is None:
+        with _SHARED_CLIENT_LOCK:
+            if _SHARED_CLIENT is None:
+                _SHARED_CLIENT = _new_http_client()
+    return _SHARED_CLIENT
+
+
+def _result_to_json(result: PDFProcessResult) -> str:
+    """Serialize a processed PDF as plain JSON for the disk cache."""
+    data = asdict(result)
+    for key in ("created", "modified"):
+        value = data["metadata"][key]
+        if value is not None:
+            data["metadata"][key] = value.isoformat()
+    return json.dumps(data)
+
+
+def _result_from_json(raw: str) -> PDFProcessResult:
+    """Inverse of _result_to_json; only rebuilds the known dataclasses."""
+    data = json.loads(raw)
+    metadata = data["metadata"]
+    for key in ("created", "modified"):
+        if metadata.get(key) is not None:
+            metadata[key] = datetime.fromisoformat(metadata[key])
+    return PDFProcessResult(
+        metadata=PDFMetadata(**metadata),
+        pages=[PDFPage(**page) for page in data["pages"]],
+        processing_time=data["processing_time"],
+        version=data["version"],
+    )
+
+
+def _write_all(fd: int, data: memoryview) -> None:
+    """os.write may write fewer bytes than requested; loop until done."""
+    while data:
+        written = os.write(fd, data)
+        data = data[written:]
+
 
 class PDFCrawlerStrategy(AsyncCrawlerStrategy):
     def __init__(self, logger: AsyncLogger = None):
@@ -40,6 +140,13 @@ class PDFContentScrapingStrategy(ContentScrapingStrategy):
         save_images_locally (bool): Whether to save images locally.
         extract_images (bool): Whether to extract images from PDF.
         image_save_dir (str): Directory to save extracted images.
+        batch_size (int | "auto"): Pages processed concurrently. "auto" sizes
+            batches from available memory and the PDF's average page size.
+        workers (int): If set, parse pages in a process pool of this size
+            instead of a thread pool.
+        disk_cache (bool): Persist processed PDFs on disk, keyed by content
+            hash and processing options, so repeat crawls of the same PDF
+            skip processing.
         logger (AsyncLogger): Logger instance for recording events and errors.
 
     Methods:
@@ -47,6 +154,9 @@ class PDFContentScrapingStrategy(ContentScrapingStrategy):
             Scrap content from a PDF file.
         ascrap(url: str, html: str, **kwargs) -> ScrapingResult:
             Asynchronous version of scrap.
+        close() -> None:
+            Release the HTTP client and worker pool; also run on exiting
+            `async with strategy:`.
 
     Usage:
         strategy = PDFContentScrapingStrategy(
@@ -63,7 +173,9 @@ class PDFContentScrapingStrategy(ContentScrapingStrategy):
         save_images_locally: bool = False,
         extract_images: bool = False,
         image_save_dir: str = None,
-        batch_size: int = 4,
+        batch_size: Union[int, Literal["auto"]] = "auto",
+        workers: int = None,
+        disk_cache: bool = False,
         logger: AsyncLogger = None,
     ):
         self.logger = logger
@@ -73,7 +185,114 @@ class PDFContentScrapingStrategy(ContentScrapingStrategy):
             image_save_dir=image_save_dir,
             batch_size=batch_size,
         )
+        self.workers = workers
+        self._pool = None  # Created lazily on first use when workers is set
         self._temp_files = []  # Track temp files for cleanup
+        self._async_client = None  # httpx.AsyncClient, bound to one event loop
+        self._async_client_loop = None
+        # SHA-256 -> processed PDF, so repeat downloads skip reprocessing
+        self._processed = OrderedDict()
+        self._lock = threading.Lock()
+        self.disk_cache = disk_cache
+        if disk_cache:
+            self.cache_dir = (
+                Path(os.getenv("CRAWL4_AI_BASE_DIRECTORY", Path.home()))
+                / ".crawl4ai"
+                / "pdf_cache"
+            )
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    def _process_pdf(self, source: Union[str, bytes], digest: Optional[str] = None):
+        """Process a PDF given as a local path or in-memory bytes.
+
+        digest is the SHA-256 of a downloaded PDF; when given, results are
+        served from / stored in the processed-PDF caches.
+        """
+        pdf_source = source if isinstance(source, bytes) else Path(source)
+        if digest is not None:
+            with self._lock:
+                cached = self._processed.get(digest)
+                if cached is not None:
+                    self._processed.move_to_end(digest)
+                    return cached
+            if self.disk_cache:
+                cached = self._disk_cache_get(digest)
+                if cached is not None:
+                    self._remember(digest, cached)
+                    return cached
+
+        if not self.workers:
+            result = self.pdf_processor.process_batch(pdf_source)
+        else:
+            with self._lock:
+                if self._pool is None:
+                    self._pool = concurrent.futures.ProcessPoolExecutor(
+                        max_workers=self.workers
+                    )
+                    weakref.finalize(self, self._pool.shutdown, wait=False)
+            result = self.pdf_processor.process_batch_in_pool(
+                pdf_source, self._pool, self.workers
+            )
+
+        if digest is not None:
+            self._remember(digest, result)
+            if self.disk_cache:
+                self._disk_cache_set(digest, result)
+        return result
+
+    def _remember(self, digest: str, result) -> None:
+        with self._lock:
+            self._processed[digest] = result
+            if len(self._processed) > PDF_RESULT_CACHE_SIZE:
+                self._processed.popitem(last=False)
+
+    def _disk_cache_path(self, digest: str) -> Path:
+        # The cache dir is shared by every instance, so the options that shape
+        # the result are part of the key alongside the content digest
+        processor = self.pdf_processor
+        options = (
+            digest,
+            processor.extract_images,
+            processor.save_images_locally,
+            str(processor.image_save_dir or ""),
+            processor.image_dpi,
+            processor.image_quality,
+        )
+        key = hashlib.sha256(repr(options).encode()).hexdigest()
+        return self.cache_dir / f"{key}.json"
+
+    def _disk_cache_get(self, digest: str):
+        path = self._disk_cache_path(digest)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                result = _result_from_json(f.read())
+            os.utime(path)  # Mark as recently used for LRU eviction
+            return result
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            if self.logger:
+                self.logger.warning(f"Ignoring unreadable PDF cache entry {path}: {e}")
+            return None
+
+    def _disk_cache_set(self, digest: str, result) -> None:
+        path = self._disk_cache_path(digest)
+        try:
+            # Write then rename so readers never see a partial entry
+            tmp_path = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                f.write(_result_to_json(result))
+            os.replace(tmp_path, path)
+
+            # Evict least recently used entries beyond the size limit
+            entries = sorted(
+                self.cache_dir.glob("*.json"), key=lambda p: p.stat().st_mtime
+            )
+            for stale in entries[:-PDF_DISK_CACHE_SIZE]:
+                stale.unlink(missing_ok=True)
+        except Exception as e:
+            if self.logger:
+                self.logger.warning(f"Failed to write PDF cache entry {path}: {e}")
 
     def scrap(self, url: str, html: str, **params) -> ScrapingResult:
         """
@@ -88,157 +307,257 @@ class PDFContentScrapingStrategy(ContentScrapingStrategy):
             ScrapingResult: The scraped content.
         """
         # Download if URL or use local path
-        pdf_path = self._get_pdf_path(url)
+        source, digest = self._get_pdf_source(url)
         try:
             # Process PDF
             # result = self.pdf_processor.process(Path(pdf_path))
-            result = self.pdf_processor.process_batch(Path(pdf_path))
-
-            # Combine page HTML
-            cleaned_html = f"""
-        <html>
-            <head><meta name="pdf-pages" content="{len(result.pages)}"></head>
-            <body>
-                {
-                "".join(
-                    f'<div class="pdf-page" data-page="{i + 1}">{page.html}</div>'
-                    for i, page in enumerate(result.pages)
-                )
-            }
-            </body>
-        </html>
+            result = self._process_pdf(source, digest)
+            return self._build_scraping_result(result)
+        finally:
+            self._cleanup_temp_file(url, source)
+
+    async def ascrap(self, url: str, html: str, **kwargs) -> ScrapingResult:
         """
+        Asynchronous version of scrap.
 
-            # Accumulate media and links with page numbers
-            media = {"images": []}
-            links = {"urls": []}
-
-            for page in result.pages:
-                # Add page number to each image
-                for img in page.images:
-                    img["page"] = page.page_number
-                    media["images"].append(img)
-
-                # Add page number to each link
-                for link in page.links:
-                    links["urls"].append({"url": link, "page": page.page_number})
-
-            return ScrapingResult(
-                cleaned_html=cleaned_html,
-                success=True,
-                media=media,
-                links=links,
-                metadata=asdict(result.metadata),
-            )
+        The download runs natively on the event loop; only the CPU-bound PDF
+        processing is dispatched to a worker thread.
+        """
+        source, digest = await self._aget_pdf_source(url)
+        try:
+            result = await asyncio.to_thread(self._process_pdf, source, digest)
+            return self._build_scraping_result(result)
         finally:
-            # Cleanup temp file if downloaded
-            if url.startswith(("http://", "https://")):
-                try:
-                    Path(pdf_path).unlink(missing_ok=True)
-                    if pdf_path in self._temp_files:
-                        self._temp_files.remove(pdf_path)
-                except Exception as e:
-                    if self.logger:
-                        self.logger.warning(
-                            f"Failed to cleanup temp file {pdf_path}: {e}"
-                        )
+            self._cleanup_temp_file(url, source)
+
+    def _build_scraping_result(self, result) -> ScrapingResult:
+        # Walk the pages once, collecting page HTML, images and links together.
+        # The document wrapper goes into the same parts list so the final
+        # HTML is materialized by a single join, with no intermediate copy.
+        num_pages = len(result.pages)
+        parts = [None] * (num_pages + 2)
+        parts[0] = _HTML_PREFIX % num_pages
+        parts[-1] = _HTML_SUFFIX
+        images = []
+        urls = []
+
+        for i, page in enumerate(result.pages):
+            parts[i + 1] = _PAGE_DIV % (i + 1, page.html)
+
+            # Add page number to each image
+            for img in page.images:
+                img["page"] = page.page_number
+            images.extend(page.images)
+
+            # Add page number to each link
+            urls.extend({"url": link, "page": page.page_number} for link in page.links)
+
+        cleaned_html = "".join(parts)
+
+        return ScrapingResult(
+            cleaned_html=cleaned_html,
+            success=True,
+            media={"images": images},
+            links={"urls": urls},
+            metadata=asdict(result.metadata),
+        )
 
-    async def ascrap(self, url: str, html: str, **kwargs) -> ScrapingResult:
-        # For simple cases, you can use the sync version
-        return await asyncio.to_thread(self.scrap, url, html, **kwargs)
+    def _cleanup_temp_file(self, url: str, pdf_path: Union[str, bytes]) -> None:
+        # Cleanup temp file if downloaded (small PDFs never touch disk)
+        if url.startswith(("http://", "https://")) and isinstance(pdf_path, str):
+            try:
+                Path(pdf_path).unlink(missing_ok=True)
+                if pdf_path in self._temp_files:
+                    self._temp_files.remove(pdf_path)
+            except Exception as e:
+                if self.logger:
+                    self.logger.warning(
+                        f"Failed to cleanup temp file {pdf_path}: {e}"
+                    )
 
-    def _get_pdf_path(self, url: str) -> str:
-        # Max PDF size: 100 MB
-        MAX_PDF_BYTES = 100 * 1024 * 1024
+    def _new_temp_path(self) -> str:
+        # Create temp file with .pdf extension and immediately close it
+        # (required for Windows compatibility - allows reopening)
+        temp_file = tempfile.NamedTemporaryFile(suffix=".pdf", delete=False)
+        temp_path = temp_file.name
+        temp_file.close()
+
+        # Track temp file for cleanup
+        self._temp_files.append(temp_path)
+        return temp_path
+
+    def _discard_temp_path(self, temp_path: Optional[str]) -> None:
+        if temp_path is None:
+            return
+        Path(temp_path).unlink(missing_ok=True)
+        if temp_path in self._temp_files:
+            self._temp_files.remove(temp_path)
+
+    @classmethod
+    def _precheck_head(cls, response) -> None:
+        # Servers that reject HEAD or omit the type get the full GET check
+        if response.status_code >= 400:
+            return
+        content_type = response.headers.get("content-type")
+        if content_type:
+            cls._check_pdf_headers(content_type, response.headers.get("content-length"))
+
+    @staticmethod
+    def _check_pdf_headers(content_type: str, content_length) -> int:
+        # Validate content type
+        content_type = (content_type or "").lower()
+        if "pdf" not in content_type:
+            raise ValueError(
+                f"URL does not point to a PDF file (Content-Type: {content_type})"
+            )
 
-        if url.startswith(("http://", "https://")):
-            import tempfile
-            import requests
+        # Check content length and enforce size limit
+        if content_length:
+            total_size = int(content_length)
+            if total_size > MAX_PDF_BYTES:
+                raise ValueError(
+                    f"PDF file too large: {total_size / (1024 * 1024):.1f} MB "
+                    f"(max: {MAX_PDF_BYTES / (1024 * 1024):.0f} MB)"
+                )
+            return total_size
+        return 0
+
+    async def _get_async_http_client(self):
+        """Per-instance pooled AsyncClient, rebuilt if the event loop changed."""
+        loop = asyncio.get_running_loop()
+        if self._async_client is None or self._async_client_loop is not loop:
+            # Swap in the new client before closing the old one, so concurrent
+            # callers never pick up a client that is being closed
+            old_client, old_loop = self._async_client, self._async_client_loop
+            self._async_client = _new_http_client(async_=True)
+            self._async_client_loop = loop
+            if old_client is not None:
+                await self._close_async_client(old_client, old_loop)
+        return self._async_client
+
+    async def _close_async_client(self, client, loop) -> None:
+        # A client must be closed on the loop its connections belong to
+        try:
+            if loop is not asyncio.get_running_loop() and loop.is_running():
+                asyncio.run_coroutine_threadsafe(client.aclose(), loop)
+            else:
+                await client.aclose()
+        except Exception as e:
+            if self.logger:
+                self.logger.warning(f"Failed to close PDF HTTP client: {e}")
+
+    async def close(self) -> None:
+        """Close the pooled HTTP client and the worker process pool."""
+        client, loop = self._async_client, self._async_client_loop
+        self._async_client = self._async_client_loop = None
+        if client is not None:
+            await self._close_async_client(client, loop)
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=False)
 
-            # Create temp file with .pdf extension and immediately close it
-            # (required for Windows compatibility - allows reopening)
-            temp_file = tempfile.NamedTemporaryFile(suffix=".pdf", delete=False)
-            temp_path = temp_file.name
-            temp_file.close()
+    async def __aenter__(self):
+        return self
 
-            # Track temp file for cleanup
-            self._temp_files.append(temp_path)
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+    def _get_pdf_source(self, url: str) -> Tuple[Union[str, bytes], Optional[str]]:
+        """Blocking download, kept as a fallback for the sync scrap() path.
+
+        Returns:
+            (source, digest): source is a local path, or the PDF bytes when a
+            download is small enough to stay in memory; digest is the SHA-256
+            of downloaded content (None for local files).
+        """
+        if url.startswith(("http://", "https://")):
+            import httpx
+
+            temp_path = None
 
             try:
                 if self.logger:
                     self.logger.info(f"Downloading PDF from {url}...")
 
-                # Download PDF with streaming, timeout, and context manager
-                # Connection timeout: 20s, Read timeout: 600s (10 minutes for large PDFs)
-                with requests.get(url, stream=True, timeout=(20, 60 * 10)) as response:
-                    response.raise_for_status()
+                client = _get_http_client()
 
-                    # Validate content type
-                    content_type = response.headers.get("content-type", "").lower()
-                    if "pdf" not in content_type:
-                        raise ValueError(
-                            f"URL does not point to a PDF file (Content-Type: {content_type})"
-                        )
+                # Cheap HEAD first: misrouted URLs fail before any body transfer
+                try:
+                    self._precheck_head(client.head(url))
+                except httpx.HTTPError:
+                    pass  # HEAD unsupported; the GET headers are checked below
 
-                    # Check content length and enforce size limit
-                    content_length = response.headers.get("content-length")
-                    if content_length:
-                        total_size = int(content_length)
-                        if total_size > MAX_PDF_BYTES:
-                            raise ValueError(
-                                f"PDF file too large: {total_size / (1024 * 1024):.1f} MB "
-                                f"(max: {MAX_PDF_BYTES / (1024 * 1024):.0f} MB)"
-                            )
-                    else:
-                        total_size = 0
+                # Stream over the shared keep-alive/HTTP2 client
+                with client.stream("GET", url) as response:
+                    response.raise_for_status()
+
+                    total_size = self._check_pdf_headers(
+                        response.headers.get("content-type"),
+                        response.headers.get("content-length"),
+                    )
 
                     # Stream download with progress logging
-                    downloaded = 0
-                    last_logged_percent = -10  # Initialize to ensure first log at 0%
-
-                    with open(temp_path, "wb") as f:
-                        for chunk in response.iter_content(chunk_size=8192):
-                            if chunk:
-                                f.write(chunk)
-                                downloaded += len(chunk)
-
-                                # Enforce max size during download
-                                if downloaded > MAX_PDF_BYTES:
-                                    raise ValueError(
-                                        f"PDF download exceeded size limit: "
-                                        f"{downloaded / (1024 * 1024):.1f} MB"
-                                    )
-
-                                # Log progress every 10%
-                                if self.logger and total_size > 0:
-                                    percent = int((downloaded / total_size) * 100)
-                                    if percent >= last_logged_percent + 10:
-                                        self.logger.debug(
-                                            f"PDF download progress: {percent}%"
-                                        )
-                                        last_logged_percent = percent
+                    progress = _DownloadProgress(self.logger, total_size)
+
+                    if 0 < total_size <= PDF_IN_MEMORY_MAX_BYTES:
+                        # Small PDF: keep it in memory, skip the filesystem
+                        chunks = []
+                        for chunk in response.iter_bytes(PDF_DOWNLOAD_CHUNK_SIZE):
+                            chunks.append(chunk)
+                            progress.update(chunk)
+                        data = b"".join(chunks)
+                        if self.logger:
+                            self.logger.info(
+                                f"PDF downloaded into memory "
+                                f"({progress.downloaded / 1024:.1f} KB)"
+                            )
+                        return data, progress.hexdigest()
+
+                    # Hand large chunks straight to os.write, bypassing the
+                    # buffered file object
+                    temp_path = self._new_temp_path()
+                    fd = os.open(
+                        temp_path,
+                        os.O_WRONLY | os.O_CREAT | os.O_TRUNC | _O_BINARY,
+                        0o600,
+                    )
+                    try:
+                        if total_size > 0 and hasattr(os, "posix_fallocate"):
+                            # Reserve the extents up front when the size is known
+                            try:
+                                os.posix_fallocate(fd, 0, total_size)
+                            except OSError:
+                                pass  # Not supported by this filesystem
+                        for chunk in response.iter_bytes(PDF_WRITE_BUFFER_SIZE):
+                            view = memoryview(chunk)
+                            _write_all(fd, view)
+                            progress.update(view)
+                        # Drop any preallocated tail if the server lied about length
+                        if total_size > 0 and progress.downloaded != total_size:
+                            os.ftruncate(fd, progress.downloaded)
+                    finally:
+                        os.close(fd)
 
                 if self.logger:
                     self.logger.info(
                         f"PDF downloaded successfully: {temp_path} "
-                        f"({downloaded / 1024:.1f} KB)"
+                        f"({progress.downloaded / 1024:.1f} KB)"
                     )
 
-                return temp_path
+                return temp_path, progress.hexdigest()
 
             except (
-                requests.exceptions.Timeout,
-                requests.exceptions.RequestException,
+                httpx.TimeoutException,
+                httpx.HTTPError,
                 ValueError,
                 IOError,
             ) as e:
                 # Clean up temp file if download fails
-                Path(temp_path).unlink(missing_ok=True)
-                if temp_path in self._temp_files:
-                    self._temp_files.remove(temp_path)
+                self._discard_temp_path(temp_path)
 
                 # Re-raise with appropriate error type
-                if isinstance(e, requests.exceptions.Timeout):
+                if isinstance(e, httpx.TimeoutException):
                     raise RuntimeError(f"Timeout downloading PDF from {url}") from e
                 elif isinstance(e, ValueError):
                     raise RuntimeError(f"Invalid PDF: {e}") from e
@@ -246,9 +565,121 @@ class PDFContentScrapingStrategy(ContentScrapingStrategy):
                     raise RuntimeError(f"Failed to download PDF from {url}") from e
 
         elif url.startswith("file://"):
-            return url[7:]  # Strip file:// prefix
+            return url[7:], None  # Strip file:// prefix
+
+        return url, None  # Assume local path
+
+    async def _aget_pdf_source(
+        self, url: str
+    ) -> Tuple[Union[str, bytes], Optional[str]]:
+        """Non-blocking counterpart of _get_pdf_source using httpx + aiofiles."""
+        if not url.startswith(("http://", "https://")):
+            return self._get_pdf_source(url)
+
+        import aiofiles
+        import httpx
+
+        temp_path = None
+
+        try:
+            if self.logger:
+                self.logger.info(f"Downloading PDF from {url}...")
+
+            client = await self._get_async_http_client()
+
+            # Cheap HEAD first: misrouted URLs fail before any body transfer
+            try:
+                self._precheck_head(await client.head(url))
+            except httpx.HTTPError:
+                pass  # HEAD unsupported; the GET headers are checked below
+
+            async with client.stream("GET", url) as response:
+                response.raise_for_status()
+
+                total_size = self._check_pdf_headers(
+                    response.headers.get("content-type"),
+                    response.headers.get("content-length"),
+                )
+                progress = _DownloadProgress(self.logger, total_size)
+
+                if 0 < total_size <= PDF_IN_MEMORY_MAX_BYTES:
+                    # Small PDF: keep it in memory, skip the filesystem
+                    chunks = []
+                    async for chunk in response.aiter_bytes(PDF_DOWNLOAD_CHUNK_SIZE):
+                        chunks.append(chunk)
+                        progress.update(chunk)
+                    if self.logger:
+                        self.logger.info(
+                            f"PDF downloaded into memory "
+                            f"({progress.downloaded / 1024:.1f} KB)"
+                        )
+                    return b"".join(chunks), progress.hexdigest()
+
+                temp_path = self._new_temp_path()
+                async with aiofiles.open(temp_path, "wb") as f:
+                    async for chunk in response.aiter_bytes(PDF_DOWNLOAD_CHUNK_SIZE):
+                        await f.write(chunk)
+                        progress.update(chunk)
+
+            if self.logger:
+                self.logger.info(
+                    f"PDF downloaded successfully: {temp_path} "
+                    f"({progress.downloaded / 1024:.1f} KB)"
+                )
+
+            return temp_path, progress.hexdigest()
+
+        except (
+            httpx.TimeoutException,
+            httpx.HTTPError,
+            ValueError,
+            IOError,
+        ) as e:
+            # Clean up temp file if download fails
+            self._discard_temp_path(temp_path)
+
+            if isinstance(e, httpx.TimeoutException):
+                raise RuntimeError(f"Timeout downloading PDF from {url}") from e
+            elif isinstance(e, ValueError):
+                raise RuntimeError(f"Invalid PDF: {e}") from e
+            else:
+                raise RuntimeError(f"Failed to download PDF from {url}") from e
+
+
+class _DownloadProgress:
+    """Tracks downloaded bytes, enforces MAX_PDF_BYTES and logs every 10%.
+
+    The body is also fed through SHA-256 as it streams by, so the content
+    digest is available without re-reading the file afterwards.
+    """
+
+    def __init__(self, logger: AsyncLogger, total_size: int):
+        self.logger = logger
+        self.total_size = total_size
+        self.downloaded = 0
+        self.last_logged_percent = -10  # Initialize to ensure first log at 0%
+        self._sha256 = hashlib.sha256()
+
+    def update(self, chunk) -> None:
+        self.downloaded += len(chunk)
+        self._sha256.update(chunk)
+
+        # Enforce max size during download
+        if self.downloaded > MAX_PDF_BYTES:
+            raise ValueError(
+                f"PDF download exceeded size limit: "
+                f"{self.downloaded / (1024 * 1024):.1f} MB"
+            )
+
+        # Log progress every 10%
+        if self.logger and self.total_size > 0:
+            percent = int((self.downloaded / self.total_size) * 100)
+            if percent >= self.last_logged_percent + 10:
+                self.logger.debug(f"PDF download progress: {percent}%")
+                self.last_logged_percent = percent
 
-        return url  # Assume local path
+    def hexdigest(self) -> str:
+        return self._sha256.hexdigest()
 
 
 __all__ = ["PDFCrawlerStrategy", "PDFContentScrapingStrategy"]
@@ -1,12 +1,14 @@
 import logging
+import os
 import re
 from abc import ABC, abstractmethod
 from datetime import datetime
 from pathlib import Path
 from time import time
 from dataclasses import dataclass, asdict, field
-from typing import Dict, List, Optional, Any, Union
+from typing import Dict, List, Literal, Optional, Any, Union
 import base64
+import io
 import tempfile
 from .utils import *
 from .utils import (
@@ -21,6 +23,29 @@ from .utils import (
 
 logger = logging.getLogger(__name__)
 
+# A PDF to process: a path on disk, or the raw bytes of an in-memory download
+PDFSource = Union[Path, bytes]
+
+
+def _open_pdf(source: PDFSource):
+    """Open a PDF source as a binary file object (each call is independent)."""
+    if isinstance(source, (bytes, bytearray)):
+        # BytesIO over bytes shares the buffer, so per-thread readers are cheap
+        return io.BytesIO(source)
+    return open(source, 'rb')
+
+
+def _pdf_size(source: PDFSource) -> int:
+    if isinstance(source, (bytes, bytearray)):
+        return len(source)
+    return Path(source).stat().st_size
+
+# A PDF page can expand 5-10x its on-disk share in RAM while being parsed
+PDF_PAGE_MEMORY_EXPANSION = 10
+# Fraction of available memory "auto" batch sizing may plan to use
+PDF_BATCH_MEMORY_FRACTION = 0.25
+PDF_MAX_AUTO_BATCH_SIZE = 64
+
 @dataclass
 class PDFMetadata:
     title: Optional[str] = None
@@ -51,12 +76,13 @@ class PDFProcessResult:
 
 class PDFProcessorStrategy(ABC):
     @abstractmethod
-    def process(self, pdf_path: Path) -> PDFProcessResult:
+    def process(self, pdf_path: PDFSource) -> PDFProcessResult:
         pass
 
 class NaivePDFProcessorStrategy(PDFProcessorStrategy):
     def __init__(self, image_dpi: int = 144, image_quality: int = 85, extract_images: bool = True, 
-                 save_images_locally: bool = False, image_save_dir: Optional[Path] = None, batch_size: int = 4):
+                 save_images_locally: bool = False, image_save_dir: Optional[Path] = None,
+                 batch_size: Union[int, Literal["auto"]] = 4):
         # Import check at initialization time
         try:
             import PyPDF2
@@ -72,7 +98,7 @@ class NaivePDFProcessorStrategy(PDFProcessorStrategy):
         self.batch_size = batch_size
         self._temp_dir = None
 
-    def process(self, pdf_path: Path) -> PDFProcessResult:
+    def process(self, pdf_path: PDFSource) -> PDFProcessResult:
         # Import inside method to allow dependency to be optional
         try:
             from PyPDF2 import PdfReader
@@ -87,7 +113,7 @@ class NaivePDFProcessorStrategy(PDFProcessorStrategy):
         )
 
         try:
-            with pdf_path.open('rb') as file:
+            with _open_pdf(pdf_path) as file:
                 reader = PdfReader(file)
                 result.metadata = self._extract_metadata(pdf_path, reader)
                 
@@ -121,7 +147,7 @@ class NaivePDFProcessorStrategy(PDFProcessorStrategy):
         result.processing_time = time() - start_time
         return result
 
-    def process_batch(self, pdf_path: Path) -> PDFProcessResult:
+    def process_batch(self, pdf_path: PDFSource) -> PDFProcessResult:
         """Like process() but processes PDF pages in parallel batches"""
         # Import inside method to allow dependency to be optional
         try:
@@ -146,7 +172,7 @@ class NaivePDFProcessorStrategy(PDFProcessorStrategy):
 
         try:
             # Get metadata and page count from main thread
-            with pdf_path.open('rb') as file:
+            with _open_pdf(pdf_path) as file:
                 reader = PdfReader(file)
                 result.metadata = self._extract_metadata(pdf_path, reader)
                 total_pages = len(reader.pages)
@@ -163,14 +189,17 @@ class NaivePDFProcessorStrategy(PDFProcessorStrategy):
 
             def process_page_safely(page_num: int):
                 # Each thread opens its own file handle
-                with pdf_path.open('rb') as file:
+                with _open_pdf(pdf_path) as file:
                     thread_reader = PdfReader(file)
                     page = thread_reader.pages[page_num]
                     self.current_page_number = page_num + 1
                     return self._process_page(page, image_dir)
 
-            # Process pages in parallel batches
-            with concurrent.futures.ThreadPoolExecutor(max_workers=self.batch_size) as executor:
+            # Process pages in parallel batches; the batch size bounds the pages
+            # in flight, but never run more threads than there are CPUs
+            batch_size = self._resolve_batch_size(pdf_path, total_pages)
+            max_workers = min(batch_size, os.cpu_count() or 1)
+            with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
                 futures = []
                 for page_num in range(total_pages):
                     future = executor.submit(process_page_safely, page_num)
@@ -201,6 +230,105 @@ class NaivePDFProcessorStrategy(PDFProcessorStrategy):
         result.processing_time = time() - start_time
         return result
 
+    def process_batch_in_pool(self, pdf_path: PDFSource, executor, workers: int = 1) -> PDFProcessResult:
+        """Like process_batch() but spreads page ranges across a process pool.
+
+        Page parsing is CPU-bound, so threads are serialized by the GIL. Each
+        range of ``batch_size`` pages is parsed in a worker process and the
+        returned pages are merged back in page order.
+        """
+        try:
+            from PyPDF2 import PdfReader
+        except ImportError:
+            raise ImportError("PyPDF2 is required for PDF processing. Install with 'pip install crawl4ai[pdf]'")
+
+        start_time = time()
+        result = PDFProcessResult(
+            metadata=PDFMetadata(),
+            pages=[],
+            version="1.1"
+        )
+
+        try:
+            with _open_pdf(pdf_path) as file:
+                reader = PdfReader(file)
+                result.metadata = self._extract_metadata(pdf_path, reader)
+                total_pages = len(reader.pages)
+
+            # Handle image directory setup
+            image_dir = None
+            if self.extract_images and self.save_images_locally:
+                if self.image_save_dir:
+                    image_dir = Path(self.image_save_dir)
+                    image_dir.mkdir(exist_ok=True, parents=True)
+                else:
+                    self._temp_dir = tempfile.mkdtemp(prefix='pdf_images_')
+                    image_dir = Path(self._temp_dir)
+
+            # Never hand out fewer ranges than there are workers
+            step = min(
+                self._resolve_batch_size(pdf_path, total_pages),
+                -(-total_pages // max(1, workers)),
+            )
+            step = max(1, step)
+            ranges = [(lo, min(lo + step, total_pages)) for lo in range(0, total_pages, step)]
+            config = self._pool_config()
+            futures = [
+                executor.submit(_process_page_range, config, pdf_path, lo, hi, image_dir)
+                for lo, hi in ranges
+            ]
+
+            # Collect results in order
+            for future in futures:
+                result.pages.extend(future.result())
+
+        except Exception as e:
+            logger.error(f"Failed to process PDF: {str(e)}")
+            raise
+        finally:
+            # Cleanup temp directory if it was created
+            if self._temp_dir and not self.image_save_dir:
+                import shutil
+                try:
+                    shutil.rmtree(self._temp_dir)
+                except Exception as e:
+                    logger.error(f"Failed to cleanup temp directory: {str(e)}")
+
+        result.processing_time = time() - start_time
+        return result
+
+    def _resolve_batch_size(self, pdf_path: PDFSource, total_pages: int) -> int:
+        """Return the configured batch size, or derive one from free memory.
+
+        With ``batch_size="auto"`` the per-page footprint is estimated from the
+        file's average page size times PDF_PAGE_MEMORY_EXPANSION, and as many
+        pages are batched as fit in PDF_BATCH_MEMORY_FRACTION of available RAM.
+        """
+        if self.batch_size != "auto":
+            return max(1, int(self.batch_size))
+
+        try:
+            import psutil
+            available = psutil.virtual_memory().available
+        except Exception:
+            return 4
+
+        per_page_bytes = max(1, _pdf_size(pdf_path) // max(1, total_pages))
+        per_page_bytes *= PDF_PAGE_MEMORY_EXPANSION
+        batch_size = int(available * PDF_BATCH_MEMORY_FRACTION / per_page_bytes)
+        return max(1, min(PDF_MAX_AUTO_BATCH_SIZE, total_pages, batch_size))
+
+    def _pool_config(self) -> Dict[str, Any]:
+        # Constructor arguments needed to rebuild this strategy in a worker process
+        return {
+            "image_dpi": self.image_dpi,
+            "image_quality": self.image_quality,
+            "extract_images": self.extract_images,
+            "save_images_locally": self.save_images_locally,
+            "image_save_dir": self.image_save_dir,
+            "batch_size": self.batch_size,
+        }
+
     def _process_page(self, page, image_dir: Optional[Path]) -> PDFPage:
         pdf_page = PDFPage(
             page_number=self.current_page_number,
@@ -412,12 +540,12 @@ class NaivePDFProcessorStrategy(PDFProcessorStrategy):
                 print(f"Link error: {str(e)}")
         return links
 
-    def _extract_metadata(self, pdf_path: Path, reader = None) -> PDFMetadata:
+    def _extract_metadata(self, pdf_path: PDFSource, reader = None) -> PDFMetadata:
         # Import inside method to allow dependency to be optional 
         if reader is None:
             try:
                 from PyPDF2 import PdfReader
-                reader = PdfReader(pdf_path)
+                reader = PdfReader(io.BytesIO(pdf_path) if isinstance(pdf_path, bytes) else pdf_path)
             except ImportError:
                 raise ImportError("PyPDF2 is required for PDF processing. Install with 'pip install crawl4ai[pdf]'")
 
@@ -433,7 +561,7 @@ class NaivePDFProcessorStrategy(PDFProcessorStrategy):
             modified=modified,
             pages=len(reader.pages),
             encrypted=reader.is_encrypted,
-            file_size=pdf_path.stat().st_size
+            file_size=_pdf_size(pdf_path)
         )
 
     def _parse_pdf_date(self, date_str: str) -> Optional[datetime]:
@@ -453,6 +581,20 @@ class NaivePDFProcessorStrategy(PDFProcessorStrategy):
         except:
             return None
 
+def _process_page_range(config: Dict[str, Any], pdf_path: PDFSource, lo: int, hi: int,
+                        image_dir: Optional[Path]) -> List[PDFPage]:
+    """Process pages [lo, hi) of a PDF. Runs inside a worker process."""
+    from PyPDF2 import PdfReader
+
+    strategy = NaivePDFProcessorStrategy(**config)
+    pages = []
+    with _open_pdf(pdf_path) as file:
+        reader = PdfReader(file)
+        for page_num in range(lo, hi):
+            strategy.current_page_number = page_num + 1
+            pages.append(strategy._process_page(reader.pages[page_num], image_dir))
+    return pages
+
 # Usage example
 if __name__ == "__main__":
     import json
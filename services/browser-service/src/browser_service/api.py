@@ -1,12 +1,15 @@
 """Browser service API endpoints."""
 
+import asyncio
+import base64
 import time
-from typing import Optional
-from fastapi import APIRouter, HTTPException, Request
-from pydantic import BaseModel
-from crawl4ai_schemas import BrowserRequest, BrowserResponse
+from typing import List, Optional
+from fastapi import APIRouter, HTTPException, Request, Response
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel, ValidationError
+from crawl4ai_schemas import BrowserBatchRequest, BrowserRequest, BrowserResponse
 
-router = APIRouter(tags=["browser"])
+router = APIRouter(tags=["browser"], default_response_class=ORJSONResponse)
 
 
 class SessionCreateRequest(BaseModel):
@@ -26,19 +29,15 @@ class SessionResponse(BaseModel):
     message: str
 
 
-@router.post("/navigate", response_model=BrowserResponse)
-async def navigate(request: BrowserRequest, app_request: Request) -> BrowserResponse:
-    """Navigate to a URL and perform actions.
+async def _navigate_one(request: BrowserRequest, app_request: Request) -> BrowserResponse:
+    """Run one navigation and build its response.
 
     Args:
         request: Browser request with URL and actions
         app_request: FastAPI request object
 
     Returns:
-        Browser response with HTML and metadata
-
-    Raises:
-        HTTPException: If navigation fails
+        Browser response; failures are reported with success=False
     """
     start_time = time.time()
     browser_manager = app_request.app.state.browser_manager
@@ -59,13 +58,35 @@ async def navigate(request: BrowserRequest, app_request: Request) -> BrowserResp
             proxy=request.proxy,
         )
 
+        html = result.get("html")
+        screenshot = result.get("screenshot")
+        html_url = None
+        screenshot_url = None
+
+        if request.artifacts:
+            # Keep large payloads out of the JSON body; serve them raw instead
+            if html is not None:
+                token = browser_manager.store_artifact(
+                    html.encode("utf-8"), "text/html; charset=utf-8"
+                )
+                html_url = str(app_request.url_for("get_artifact", token=token))
+                html = None
+            if screenshot is not None:
+                token = browser_manager.store_artifact(screenshot, "image/png")
+                screenshot_url = str(app_request.url_for("get_artifact", token=token))
+                screenshot = None
+        elif screenshot is not None:
+            screenshot = base64.b64encode(screenshot).decode()
+
         duration_ms = (time.time() - start_time) * 1000
 
-        return BrowserResponse(
+        response = BrowserResponse(
             success=True,
             url=result.get("url", str(request.url)),
-            html=result.get("html"),
-            screenshot=result.get("screenshot"),
+            html=html,
+            html_url=html_url,
+            screenshot=screenshot,
+            screenshot_url=screenshot_url,
             javascript_result=result.get("javascript_result"),
             cookies=result.get("cookies"),
             duration_ms=duration_ms,
@@ -74,7 +95,7 @@ async def navigate(request: BrowserRequest, app_request: Request) -> BrowserResp
 
     except Exception as e:
         duration_ms = (time.time() - start_time) * 1000
-        return BrowserResponse(
+        response = BrowserResponse(
             success=False,
             url=str(request.url),
             error=str(e),
@@ -82,6 +103,83 @@ async def navigate(request: BrowserRequest, app_request: Request) -> BrowserResp
             metadata=request.metadata,
         )
 
+    return response
+
+
+@router.post("/navigate", response_model=BrowserResponse)
+async def navigate(request: BrowserRequest, app_request: Request) -> ORJSONResponse:
+    """Navigate to a URL and perform actions.
+
+    Args:
+        request: Browser request with URL and actions
+        app_request: FastAPI request object
+
+    Returns:
+        Browser response with HTML and metadata, already encoded with orjson
+        so FastAPI does not validate and serialize the model a second time
+    """
+    response = await _navigate_one(request, app_request)
+    return ORJSONResponse(response.model_dump())
+
+
+@router.post("/navigate_batch", response_model=List[BrowserResponse])
+async def navigate_batch(
+    request: BrowserBatchRequest, app_request: Request
+) -> ORJSONResponse:
+    """Navigate to several URLs sharing one configuration.
+
+    Navigations run concurrently; responses are returned in request order and
+    a failing URL does not fail the batch.
+
+    Args:
+        request: Batch of URLs plus the BrowserRequest fields they share
+        app_request: FastAPI request object
+
+    Returns:
+        One browser response per URL, encoded with orjson
+
+    Raises:
+        HTTPException: If the shared config is not a valid BrowserRequest
+    """
+    try:
+        requests = [
+            BrowserRequest(**{**request.config, "url": url}) for url in request.urls
+        ]
+    except ValidationError as e:
+        raise HTTPException(status_code=422, detail=e.errors(include_url=False))
+
+    responses = await asyncio.gather(
+        *(_navigate_one(req, app_request) for req in requests)
+    )
+    return ORJSONResponse([response.model_dump() for response in responses])
+
+
+@router.get("/artifact/{token}", name="get_artifact")
+async def get_artifact(token: str, app_request: Request) -> Response:
+    """Fetch the raw HTML or screenshot produced by an artifacts navigate.
+
+    Artifacts can be fetched once; they are dropped from memory on retrieval
+    and expire if not fetched in time.
+
+    Args:
+        token: Artifact token from html_url / screenshot_url
+        app_request: FastAPI request object
+
+    Returns:
+        Raw artifact bytes with their original content type
+
+    Raises:
+        HTTPException: If the artifact is unknown, expired or already fetched
+    """
+    browser_manager = app_request.app.state.browser_manager
+
+    artifact = browser_manager.pop_artifact(token)
+    if artifact is None:
+        raise HTTPException(status_code=404, detail=f"Artifact not found: {token}")
+
+    data, media_type = artifact
+    return Response(content=data, media_type=media_type)
+
 
 @router.post("/sessions", response_model=SessionResponse)
 async def create_session(
@@ -2,14 +2,75 @@
 
 import asyncio
 import logging
+import time
 import uuid
-from datetime import datetime, timedelta
-from typing import Any, Dict, Optional
+from collections import OrderedDict
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
 from playwright.async_api import async_playwright, Browser, BrowserContext, Page
 
 logger = logging.getLogger(__name__)
 
 
+def _to_playwright_cookies(cookies: Dict[str, str], url: str) -> List[Dict[str, str]]:
+    """Build the list Playwright's add_cookies expects from a name->value map."""
+    return [{"name": name, "value": value, "url": url} for name, value in cookies.items()]
+
+
+def _cookie_map(cookies: List[Dict[str, Any]]) -> Dict[str, str]:
+    """Collapse Playwright cookie records into a name->value map in one pass."""
+    return {cookie["name"]: cookie["value"] for cookie in cookies}
+
+
+async def _do_navigate(
+    page: Page, javascript: Optional[str], selector: Optional[str]
+) -> Dict[str, Any]:
+    return {"html": await page.content()}
+
+
+async def _do_screenshot(
+    page: Page, javascript: Optional[str], selector: Optional[str]
+) -> Dict[str, Any]:
+    # Raw PNG bytes; the API layer decides how to ship them
+    return {"screenshot": await page.screenshot(full_page=True)}
+
+
+async def _do_execute_js(
+    page: Page, javascript: Optional[str], selector: Optional[str]
+) -> Dict[str, Any]:
+    if not javascript:
+        return await _do_navigate(page, javascript, selector)
+    js_result = await page.evaluate(javascript)
+    return {"javascript_result": js_result, "html": await page.content()}
+
+
+async def _do_click(
+    page: Page, javascript: Optional[str], selector: Optional[str]
+) -> Dict[str, Any]:
+    if selector:
+        await page.click(selector)
+    return {"html": await page.content()}
+
+
+async def _do_scroll(
+    page: Page, javascript: Optional[str], selector: Optional[str]
+) -> Dict[str, Any]:
+    await page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
+    await page.wait_for_timeout(1000)  # Wait for lazy load
+    return {"html": await page.content()}
+
+
+# Page action -> handler; unknown actions fall back to a plain navigate
+_ACTIONS = {
+    "navigate": _do_navigate,
+    "get_html": _do_navigate,
+    "screenshot": _do_screenshot,
+    "execute_js": _do_execute_js,
+    "click": _do_click,
+    "scroll": _do_scroll,
+}
+
+
 class SessionInfo:
     """Information about a browser session."""
 
@@ -18,30 +79,45 @@ class SessionInfo:
         self.session_id = session_id
         self.context = context
         self.created_at = datetime.utcnow()
-        self.last_used = datetime.utcnow()
+        self.last_used = time.monotonic_ns()
         self.page_count = 0
 
     def touch(self):
-        """Update last used timestamp."""
-        self.last_used = datetime.utcnow()
+        """Update last used timestamp (monotonic nanoseconds)."""
+        self.last_used = time.monotonic_ns()
 
 
 class BrowserManager:
     """Manages Playwright browser instances and page actions."""
 
-    def __init__(self, session_ttl_minutes: int = 30):
+    def __init__(
+        self,
+        session_ttl_minutes: int = 30,
+        max_artifacts: int = 256,
+        max_artifact_bytes: int = 256 * 1024 * 1024,
+        artifact_ttl_seconds: int = 300,
+    ):
         """Initialize the browser manager.
 
         Args:
             session_ttl_minutes: Session time-to-live in minutes
+            max_artifacts: Maximum number of unfetched artifacts kept in memory
+            max_artifact_bytes: Maximum total size of unfetched artifacts
+            artifact_ttl_seconds: Time after which unfetched artifacts expire
         """
         self.playwright = None
         self.browser: Optional[Browser] = None
         self._active_pages = 0
         self._sessions: Dict[str, SessionInfo] = {}
         self._sessions_lock = asyncio.Lock()
-        self._session_ttl = timedelta(minutes=session_ttl_minutes)
+        self._session_ttl_ns = session_ttl_minutes * 60 * 1_000_000_000
         self._cleanup_task: Optional[asyncio.Task] = None
+        # token -> (data, media_type, expiry in monotonic ns), oldest first
+        self._artifacts: "OrderedDict[str, Tuple[bytes, str, int]]" = OrderedDict()
+        self._artifact_bytes = 0
+        self._max_artifacts = max_artifacts
+        self._max_artifact_bytes = max_artifact_bytes
+        self._artifact_ttl_ns = artifact_ttl_seconds * 1_000_000_000
 
     async def start(self):
         """Start the browser manager and launch browser."""
@@ -64,12 +140,12 @@ class BrowserManager:
             except asyncio.CancelledError:
                 pass
 
-        # Close all sessions
-        async with self._sessions_lock:
-            session_ids = list(self._sessions.keys())
+        # Close all sessions (list() snapshot is atomic under the GIL)
+        session_ids = list(self._sessions)
 
-        for session_id in session_ids:
-            await self.close_session(session_id)
+        await self._gather_closes(
+            [self.close_session(session_id) for session_id in session_ids]
+        )
 
         if self.browser:
             await self.browser.close()
@@ -82,26 +158,37 @@ class BrowserManager:
         while True:
             try:
                 await asyncio.sleep(60)  # Check every minute
-                now = datetime.utcnow()
+                now_ns = time.monotonic_ns()
 
-                # Collect expired session IDs while holding the lock
-                async with self._sessions_lock:
-                    expired = [
-                        session_id
-                        for session_id, session_info in self._sessions.items()
-                        if now - session_info.last_used > self._session_ttl
-                    ]
+                # Snapshot sessions without the lock; list() is atomic
+                expired = [
+                    session_id
+                    for session_id, session_info in list(self._sessions.items())
+                    if now_ns - session_info.last_used > self._session_ttl_ns
+                ]
 
-                # Close sessions outside the lock to avoid deadlock
                 for session_id in expired:
                     logger.info(f"Cleaning up expired session: {session_id}")
-                    await self.close_session(session_id)
+
+                await self._gather_closes(
+                    [self.close_session(session_id) for session_id in expired]
+                )
+
+                self._expire_artifacts(now_ns)
 
             except asyncio.CancelledError:
                 break
             except Exception:
                 logger.exception("Error in session cleanup")
 
+    async def _gather_closes(self, closes: List[Any]):
+        """Run close coroutines concurrently and log any failures."""
+        if not closes:
+            return
+        for error in await asyncio.gather(*closes, return_exceptions=True):
+            if isinstance(error, Exception):
+                logger.warning(f"Error closing browser context: {error}")
+
     def active_count(self) -> int:
         """Get count of active pages."""
         return self._active_pages
@@ -110,6 +197,70 @@ class BrowserManager:
         """Get count of active sessions."""
         return len(self._sessions)
 
+    def store_artifact(self, data: bytes, media_type: str) -> str:
+        """Keep raw page output in memory until it is fetched once.
+
+        Unfetched artifacts expire after the artifact TTL. The oldest are
+        evicted first once the count or total size limit is exceeded; the
+        newest artifact is always kept.
+
+        Args:
+            data: Raw bytes (HTML or PNG)
+            media_type: Content type to serve the bytes with
+
+        Returns:
+            Token to retrieve the artifact with
+        """
+        now_ns = time.monotonic_ns()
+        self._expire_artifacts(now_ns)
+
+        token = uuid.uuid4().hex
+        self._artifacts[token] = (data, media_type, now_ns + self._artifact_ttl_ns)
+        self._artifact_bytes += len(data)
+
+        # Evict the oldest unfetched artifacts beyond the limits
+        while len(self._artifacts) > 1 and (
+            len(self._artifacts) > self._max_artifacts
+            or self._artifact_bytes > self._max_artifact_bytes
+        ):
+            _, (evicted, _, _) = self._artifacts.popitem(last=False)
+            self._artifact_bytes -= len(evicted)
+        return token
+
+    def pop_artifact(self, token: str) -> Optional[Tuple[bytes, str]]:
+        """Retrieve and forget an artifact.
+
+        Args:
+            token: Token returned by store_artifact
+
+        Returns:
+            Tuple of (data, media_type), or None if unknown, expired or
+            already fetched
+        """
+        artifact = self._artifacts.pop(token, None)
+        if artifact is None:
+            return None
+        data, media_type, expires_ns = artifact
+        self._artifact_bytes -= len(data)
+        if time.monotonic_ns() >= expires_ns:
+            return None
+        return data, media_type
+
+    def _expire_artifacts(self, now_ns: int):
+        """Drop unfetched artifacts whose TTL has passed.
+
+        Artifacts share one TTL, so insertion order is expiry order.
+
+        Args:
+            now_ns: Current time in monotonic nanoseconds
+        """
+        while self._artifacts:
+            data, _, expires_ns = next(iter(self._artifacts.values()))
+            if expires_ns > now_ns:
+                break
+            self._artifacts.popitem(last=False)
+            self._artifact_bytes -= len(data)
+
     async def create_session(
         self,
         user_agent: Optional[str] = None,
@@ -161,22 +312,33 @@ class BrowserManager:
         Raises:
             ValueError: If session_id is not found
         """
+        # Pop first so concurrent callers cannot close the same context twice
         async with self._sessions_lock:
-            if session_id not in self._sessions:
-                raise ValueError(f"Session not found: {session_id}")
+            session_info = self._sessions.pop(session_id, None)
 
-            session_info = self._sessions[session_id]
+        if session_info is None:
+            raise ValueError(f"Session not found: {session_id}")
 
         # Close context outside the lock to avoid blocking other operations
         await session_info.context.close()
 
-        async with self._sessions_lock:
-            # Remove from dict after closing
-            if session_id in self._sessions:
-                del self._sessions[session_id]
-
         logger.info(f"Closed session: {session_id}")
 
+    def _get_session(self, session_id: str) -> SessionInfo:
+        """Look up a session and mark it used.
+
+        Reads need no lock: dict.get is atomic and nothing awaits in between.
+        Only inserts (create_session) and removals (close_session) lock.
+
+        Raises:
+            ValueError: If session_id is not found
+        """
+        session_info = self._sessions.get(session_id)
+        if session_info is None:
+            raise ValueError(f"Session not found: {session_id}")
+        session_info.touch()
+        return session_info
+
     async def add_cookies(self, session_id: str, cookies: Dict[str, str], url: str):
         """Add cookies to a session.
 
@@ -185,17 +347,8 @@ class BrowserManager:
             cookies: Cookies to add
             url: URL for cookie context
         """
-        async with self._sessions_lock:
-            if session_id not in self._sessions:
-                raise ValueError(f"Session not found: {session_id}")
-
-            session_info = self._sessions[session_id]
-            session_info.touch()
-
-        # Add cookies outside the lock to avoid blocking
-        await session_info.context.add_cookies(
-            [{"name": k, "value": v, "url": url} for k, v in cookies.items()]
-        )
+        session_info = self._get_session(session_id)
+        await session_info.context.add_cookies(_to_playwright_cookies(cookies, url))
 
     async def get_cookies(self, session_id: str) -> Dict[str, str]:
         """Get cookies from a session.
@@ -206,16 +359,8 @@ class BrowserManager:
         Returns:
             Dictionary of cookies
         """
-        async with self._sessions_lock:
-            if session_id not in self._sessions:
-                raise ValueError(f"Session not found: {session_id}")
-
-            session_info = self._sessions[session_id]
-            session_info.touch()
-
-        # Get cookies outside the lock to avoid blocking
-        cookies = await session_info.context.cookies()
-        return {cookie["name"]: cookie["value"] for cookie in cookies}
+        session_info = self._get_session(session_id)
+        return _cookie_map(await session_info.context.cookies())
 
     async def navigate(
         self,
@@ -264,18 +409,14 @@ class BrowserManager:
 
             # Use existing session or create temporary context
             if session_id:
-                async with self._sessions_lock:
-                    if session_id not in self._sessions:
-                        raise ValueError(f"Session not found: {session_id}")
-
-                    session_info = self._sessions[session_id]
-                    session_info.touch()
-                    session_info.page_count += 1
+                session_info = self._get_session(session_id)
+                session_info.page_count += 1
 
                 context = session_info.context
                 should_close_context = False
             else:
-                # Create temporary context with options
+                # Create a fresh context: pages must not share storage, cache
+                # or permissions across unrelated requests
                 context_options = {}
                 if user_agent:
                     context_options["user_agent"] = user_agent
@@ -288,12 +429,7 @@ class BrowserManager:
 
                 # Set cookies if provided
                 if cookies:
-                    await context.add_cookies(
-                        [
-                            {"name": k, "value": v, "url": url}
-                            for k, v in cookies.items()
-                        ]
-                    )
+                    await context.add_cookies(_to_playwright_cookies(cookies, url))
 
             # Create new page
             page = await context.new_page()
@@ -316,44 +452,25 @@ class BrowserManager:
             if wait_time > 0:
                 await page.wait_for_timeout(int(wait_time * 1000))
 
-            result = {"url": page.url, "title": await page.title()}
-
             # Perform action
-            if action == "get_html":
-                result["html"] = await page.content()
-
-            elif action == "screenshot":
-                screenshot_bytes = await page.screenshot(full_page=True)
-                import base64
-
-                result["screenshot"] = base64.b64encode(screenshot_bytes).decode()
-
-            elif action == "execute_js" and javascript:
-                result["javascript_result"] = await page.evaluate(javascript)
-                result["html"] = await page.content()
+            handler = _ACTIONS.get(action, _do_navigate)
+            result = await handler(page, javascript, wait_for_selector)
 
-            elif action == "click" and wait_for_selector:
-                await page.click(wait_for_selector)
-                result["html"] = await page.content()
-
-            elif action == "scroll":
-                await page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
-                await page.wait_for_timeout(1000)  # Wait for lazy load
-                result["html"] = await page.content()
-
-            else:  # navigate
-                result["html"] = await page.content()
+            # Read page state once, after the action; each title() is a CDP
+            # round-trip
+            title = await page.title()
+            current_url = page.url
+            result["url"] = current_url
+            result["title"] = title
 
             # Get cookies
-            result["cookies"] = {
-                cookie["name"]: cookie["value"] for cookie in await context.cookies()
-            }
+            result["cookies"] = _cookie_map(await context.cookies())
 
             # Get page metadata
             result["metadata"] = {
                 "viewport": page.viewport_size,
-                "url": page.url,
-                "title": await page.title(),
+                "url": current_url,
+                "title": title,
             }
 
             return result
@@ -365,8 +482,19 @@ class BrowserManager:
             logger.error(f"Error navigating to {url}: {e}")
             raise
         finally:
+            # Plain int counter: no await between read and write, so no lock
             self._active_pages -= 1
+
+            # Close the page before its context, so the context is only torn
+            # down once nothing is still using it; log errors instead of
+            # masking the navigate result
             if page:
-                await page.close()
+                try:
+                    await page.close()
+                except Exception as e:
+                    logger.warning(f"Error closing page: {e}")
             if context and should_close_context:
-                await context.close()
+                try:
+                    await context.close()
+                except Exception as e:
+                    logger.warning(f"Error closing browser context: {e}")
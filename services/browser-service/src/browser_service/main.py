@@ -3,6 +3,7 @@
 import logging
 from contextlib import asynccontextmanager
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 from crawl4ai_core.config import get_settings
 
@@ -37,6 +38,7 @@ def create_app() -> FastAPI:
         description="Browser management microservice for web scraping",
         version="0.1.0",
         lifespan=lifespan,
+        default_response_class=ORJSONResponse,
     )
 
     # Add CORS middleware
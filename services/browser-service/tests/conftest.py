@@ -1,8 +1,31 @@
 """Pytest configuration for browser service tests."""
 
 import pytest
+import pytest_asyncio
+from browser_service.browser_manager import BrowserManager
 
 
 def pytest_configure(config):
     """Configure pytest."""
     config.addinivalue_line("markers", "asyncio: mark test as requiring asyncio")
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def manager():
+    """Browser manager started once and shared by the whole test session."""
+    manager = BrowserManager()
+    await manager.start()
+
+    yield manager
+
+    await manager.stop()
+
+
+@pytest_asyncio.fixture(loop_scope="session")
+async def session_id(manager):
+    """Per-test browser session on the shared manager, closed afterwards."""
+    session_id = await manager.create_session()
+
+    yield session_id
+
+    await manager.close_session(session_id)
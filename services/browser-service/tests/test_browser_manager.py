@@ -5,7 +5,7 @@ import asyncio
 from browser_service.browser_manager import BrowserManager
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="session")
 async def test_browser_start_stop():
     """Test browser startup and shutdown."""
     manager = BrowserManager()
@@ -17,12 +17,9 @@ async def test_browser_start_stop():
     await manager.stop()
 
 
-@pytest.mark.asyncio
-async def test_session_creation():
+@pytest.mark.asyncio(loop_scope="session")
+async def test_session_creation(manager):
     """Test browser session creation and cleanup."""
-    manager = BrowserManager()
-    await manager.start()
-
     # Create session
     session_id = await manager.create_session(user_agent="TestAgent/1.0")
 
@@ -33,15 +30,10 @@ async def test_session_creation():
     await manager.close_session(session_id)
     assert manager.session_count() == 0
 
-    await manager.stop()
-
 
-@pytest.mark.asyncio
-async def test_navigate_basic():
+@pytest.mark.asyncio(loop_scope="session")
+async def test_navigate_basic(manager):
     """Test basic navigation functionality."""
-    manager = BrowserManager()
-    await manager.start()
-
     result = await manager.navigate(
         url="https://example.com",
         action="get_html",
@@ -52,18 +44,10 @@ async def test_navigate_basic():
     assert "html" in result
     assert len(result["html"]) > 0
 
-    await manager.stop()
-
 
-@pytest.mark.asyncio
-async def test_navigate_with_session():
+@pytest.mark.asyncio(loop_scope="session")
+async def test_navigate_with_session(manager, session_id):
     """Test navigation with persistent session."""
-    manager = BrowserManager()
-    await manager.start()
-
-    # Create session
-    session_id = await manager.create_session()
-
     # Navigate with session
     result = await manager.navigate(
         url="https://example.com",
@@ -83,18 +67,10 @@ async def test_navigate_with_session():
 
     assert "url" in result2
 
-    await manager.close_session(session_id)
-    await manager.stop()
 
-
-@pytest.mark.asyncio
-async def test_cookie_management():
+@pytest.mark.asyncio(loop_scope="session")
+async def test_cookie_management(manager, session_id):
     """Test cookie add and get functionality."""
-    manager = BrowserManager()
-    await manager.start()
-
-    session_id = await manager.create_session()
-
     # Add cookies
     await manager.add_cookies(
         session_id=session_id,
@@ -106,16 +82,10 @@ async def test_cookie_management():
     cookies = await manager.get_cookies(session_id)
     assert isinstance(cookies, dict)
 
-    await manager.close_session(session_id)
-    await manager.stop()
 
-
-@pytest.mark.asyncio
-async def test_concurrent_pages():
+@pytest.mark.asyncio(loop_scope="session")
+async def test_concurrent_pages(manager):
     """Test handling multiple concurrent page operations."""
-    manager = BrowserManager()
-    await manager.start()
-
     # Create multiple navigation tasks
     tasks = [
         manager.navigate(
@@ -131,4 +101,39 @@ async def test_concurrent_pages():
     for result in results:
         assert "html" in result
 
-    await manager.stop()
+
+def test_artifact_eviction():
+    """Test that unfetched artifacts are evicted oldest first by count and size."""
+    manager = BrowserManager(max_artifacts=3, max_artifact_bytes=10)
+
+    first = manager.store_artifact(b"1234", "text/html")
+    second = manager.store_artifact(b"5678", "text/html")
+    third = manager.store_artifact(b"90", "image/png")
+    assert manager.pop_artifact(third) == (b"90", "image/png")
+
+    # 4 + 4 + 4 bytes exceed the budget, so the oldest artifact goes
+    fourth = manager.store_artifact(b"abcd", "text/html")
+    assert manager.pop_artifact(first) is None
+    assert manager.pop_artifact(second) == (b"5678", "text/html")
+    assert manager.pop_artifact(fourth) == (b"abcd", "text/html")
+
+    # Count limit, and the newest artifact is kept even when oversized
+    tokens = [manager.store_artifact(b"x", "text/html") for _ in range(4)]
+    assert manager.pop_artifact(tokens[0]) is None
+    big = manager.store_artifact(b"x" * 20, "image/png")
+    assert manager.pop_artifact(tokens[-1]) is None
+    assert manager.pop_artifact(big) == (b"x" * 20, "image/png")
+    assert manager._artifact_bytes == 0
+
+
+def test_artifact_expiry():
+    """Test that unfetched artifacts expire after the artifact TTL."""
+    manager = BrowserManager(artifact_ttl_seconds=0)
+
+    token = manager.store_artifact(b"<html/>", "text/html")
+    assert manager.pop_artifact(token) is None
+
+    manager.store_artifact(b"<html/>", "text/html")
+    manager.store_artifact(b"<html/>", "text/html")
+    # Storing drops the artifacts that have already expired
+    assert len(manager._artifacts) == 1
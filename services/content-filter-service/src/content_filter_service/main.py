@@ -1,14 +1,20 @@
 """FastAPI application for content filtering service."""
 
+import asyncio
 import logging
-from typing import List
-import math
-
-from fastapi import FastAPI, HTTPException
+import os
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import asynccontextmanager
+from typing import Iterable, List
+
+import numpy as np
+from fastapi import FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
-from bs4 import BeautifulSoup
+from selectolax.lexbor import LexborHTMLParser
 
 from shared.schemas.content_filter_schemas import (
+    ContentFilterBatchRequest,
     ContentFilterRequest,
     ContentFilterResponse,
     FilteredBlock,
@@ -22,11 +28,39 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Tags considered content blocks when keep_only_tags is not given
+DEFAULT_CONTENT_TAGS = [
+    "p",
+    "h1",
+    "h2",
+    "h3",
+    "h4",
+    "h5",
+    "h6",
+    "li",
+    "div",
+    "article",
+    "section",
+]
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Application lifespan manager."""
+    # Parsing and scoring are CPU-bound, so run them off the event loop
+    app.state.executor = ProcessPoolExecutor(max_workers=os.cpu_count())
+
+    yield
+
+    app.state.executor.shutdown(wait=False, cancel_futures=True)
+
+
 # Create FastAPI app
 app = FastAPI(
     title="Content Filtering Service",
     description="Microservice for filtering and ranking content with BM25",
     version="0.1.0",
+    lifespan=lifespan,
 )
 
 # Add CORS middleware
@@ -38,42 +72,43 @@ app.add_middleware(
 )
 
 
-def calculate_bm25_score(query_terms: List[str], document_terms: List[str]) -> float:
-    """Calculate BM25 score for a document given query terms.
+def calculate_bm25_scores(
+    query_terms: Iterable[str],
+    term_freqs: List[Counter],
+    doc_lens: List[int],
+    k1: float = 1.5,
+    b: float = 0.75,
+) -> np.ndarray:
+    """Calculate BM25 scores for a corpus of documents given query terms.
 
-    Simplified BM25 implementation without corpus statistics.
+    Scoring is vectorized over a documents x query-terms frequency matrix,
+    with avgdl and IDF taken from the corpus itself.
 
     Args:
-        query_terms: List of query terms.
-        document_terms: List of document terms.
+        query_terms: Distinct query terms.
+        term_freqs: Term frequencies of each document.
+        doc_lens: Number of terms in each document.
+        k1: Term frequency saturation parameter.
+        b: Length normalization parameter.
 
     Returns:
-        BM25 score.
+        BM25 score of each document.
     """
-    k1 = 1.5  # Term frequency saturation parameter
-    b = 0.75  # Length normalization parameter
+    terms = list(query_terms)
+    tf = np.array(
+        [[doc_term_freq.get(term, 0) for term in terms] for doc_term_freq in term_freqs],
+        dtype=np.float64,
+    ).reshape(len(term_freqs), len(terms))
+    lens = np.asarray(doc_lens, dtype=np.float64)
 
-    # Count term frequencies
-    doc_term_freq = {}
-    for term in document_terms:
-        doc_term_freq[term] = doc_term_freq.get(term, 0) + 1
+    n_docs = len(term_freqs)
+    df = np.count_nonzero(tf, axis=0)
+    idf = np.log((n_docs - df + 0.5) / (df + 0.5) + 1)
 
-    # Average document length (simplified)
-    avgdl = len(document_terms)
-    doc_len = len(document_terms)
+    avgdl = lens.mean() if n_docs else 0.0
+    norm = k1 * (1 - b + b * lens / avgdl) if avgdl else np.full(n_docs, k1)
 
-    score = 0.0
-    for term in query_terms:
-        if term in doc_term_freq:
-            tf = doc_term_freq[term]
-            # Simplified IDF (assuming single document)
-            idf = 1.0
-            # BM25 formula
-            numerator = tf * (k1 + 1)
-            denominator = tf + k1 * (1 - b + b * (doc_len / avgdl))
-            score += idf * (numerator / denominator)
-
-    return score
+    return (tf * (k1 + 1) / (tf + norm[:, None]) * idf).sum(axis=1)
 
 
 @app.get("/health", response_model=HealthResponse)
@@ -82,12 +117,98 @@ async def health_check() -> HealthResponse:
     return HealthResponse(status="healthy", service="content-filter-service")
 
 
+def _filter_sync(request: ContentFilterRequest) -> ContentFilterResponse:
+    """Filter and rank HTML content synchronously.
+
+    Args:
+        request: Content filter request.
+
+    Returns:
+        ContentFilterResponse with filtered blocks.
+    """
+    logger.info(f"Filtering content (query: {request.query})")
+
+    tree = LexborHTMLParser(request.html)
+
+    # Remove excluded tags
+    if request.exclude_tags:
+        tree.strip_tags(request.exclude_tags)
+
+    # Get text blocks in a single traversal
+    selector = ",".join(request.keep_only_tags or DEFAULT_CONTENT_TAGS)
+    elements = tree.css(selector)
+
+    # Process query for BM25
+    query_terms = []
+    if request.query:
+        query_terms = request.query.lower().split()
+
+    # Rank lightweight records first so only surviving blocks are serialized
+    records = []
+    term_freqs = []
+    for element in elements:
+        text = element.text(strip=True)
+        if not text:
+            continue
+
+        # Count words, tokenizing lowercased text only when scoring
+        words = text.lower().split() if query_terms else text.split()
+        word_count = len(words)
+
+        # Filter by word count
+        if word_count < request.min_word_count:
+            continue
+
+        records.append((text, element, word_count))
+        if query_terms:
+            term_freqs.append(Counter(words))
+
+    # Score blocks with BM25, treating the kept blocks as the corpus
+    if query_terms and records:
+        scores = calculate_bm25_scores(
+            set(query_terms), term_freqs, [record[2] for record in records]
+        )
+        order = np.argsort(-scores, kind="stable")[: request.top_k]
+        ranked = [
+            (records[i][0], records[i][1], float(scores[i]), records[i][2])
+            for i in order
+        ]
+    else:
+        ranked = [
+            (text, element, None, word_count)
+            for text, element, word_count in records[: request.top_k]
+        ]
+
+    blocks = [
+        FilteredBlock(
+            text=text,
+            html=element.html,
+            score=score,
+            word_count=word_count,
+        )
+        for text, element, score, word_count in ranked
+    ]
+
+    total_words = sum(block.word_count for block in blocks)
+
+    logger.info(f"Filtered to {len(blocks)} blocks ({total_words} words)")
+
+    return ContentFilterResponse(
+        blocks=blocks,
+        total_blocks=len(blocks),
+        total_words=total_words,
+    )
+
+
 @app.post("/filter", response_model=ContentFilterResponse)
-async def filter_content(request: ContentFilterRequest) -> ContentFilterResponse:
+async def filter_content(
+    request: ContentFilterRequest, app_request: Request
+) -> ContentFilterResponse:
     """Filter and rank HTML content.
 
     Args:
         request: Content filter request.
+        app_request: FastAPI request object.
 
     Returns:
         ContentFilterResponse with filtered blocks.
@@ -95,89 +216,53 @@ async def filter_content(request: ContentFilterRequest) -> ContentFilterResponse
     Raises:
         HTTPException: If filtering fails.
     """
+    loop = asyncio.get_running_loop()
+
     try:
-        logger.info(f"Filtering content (query: {request.query})")
-
-        soup = BeautifulSoup(request.html, "lxml")
-
-        # Remove excluded tags
-        if request.exclude_tags:
-            for tag in request.exclude_tags:
-                for element in soup.find_all(tag):
-                    element.decompose()
-
-        # Get text blocks
-        if request.keep_only_tags:
-            # Only keep specified tags
-            elements = []
-            for tag in request.keep_only_tags:
-                elements.extend(soup.find_all(tag))
-        else:
-            # Get common content tags
-            content_tags = [
-                "p",
-                "h1",
-                "h2",
-                "h3",
-                "h4",
-                "h5",
-                "h6",
-                "li",
-                "div",
-                "article",
-                "section",
-            ]
-            elements = soup.find_all(content_tags)
-
-        # Process query for BM25
-        query_terms = []
-        if request.query:
-            query_terms = request.query.lower().split()
-
-        blocks = []
-        for element in elements:
-            text = element.get_text(strip=True)
-            if not text:
-                continue
-
-            # Count words
-            words = text.split()
-            word_count = len(words)
-
-            # Filter by word count
-            if word_count < request.min_word_count:
-                continue
-
-            # Calculate score if query provided
-            score = None
-            if query_terms:
-                doc_terms = [w.lower() for w in words]
-                score = calculate_bm25_score(query_terms, doc_terms)
-
-            block = FilteredBlock(
-                text=text,
-                html=str(element),
-                score=score,
-                word_count=word_count,
-            )
-            blocks.append(block)
+        return await loop.run_in_executor(
+            app_request.app.state.executor, _filter_sync, request
+        )
 
-        # Sort by score if query provided
-        if query_terms:
-            blocks.sort(key=lambda x: x.score or 0, reverse=True)
+    except Exception as e:
+        logger.exception("Error in content filtering")
+        raise HTTPException(
+            status_code=500, detail=f"Content filtering failed: {str(e)}"
+        )
+
+
+@app.post("/filter_batch", response_model=List[ContentFilterResponse])
+async def filter_content_batch(
+    request: ContentFilterBatchRequest, app_request: Request
+) -> List[ContentFilterResponse]:
+    """Filter and rank several HTML documents in one round-trip.
 
-        total_words = sum(block.word_count for block in blocks)
+    Documents are filtered concurrently on the worker process pool, at most
+    one per CPU core at a time.
 
-        logger.info(f"Filtered to {len(blocks)} blocks ({total_words} words)")
+    Args:
+        request: Batch of content filter requests.
+        app_request: FastAPI request object.
+
+    Returns:
+        One ContentFilterResponse per item, in request order.
 
-        return ContentFilterResponse(
-            blocks=blocks,
-            total_blocks=len(blocks),
-            total_words=total_words,
+    Raises:
+        HTTPException: If filtering any item fails.
+    """
+    loop = asyncio.get_running_loop()
+    executor = app_request.app.state.executor
+
+    try:
+        logger.info(f"Filtering batch of {len(request.items)} documents")
+        return await asyncio.gather(
+            *(
+                loop.run_in_executor(executor, _filter_sync, item)
+                for item in request.items
+            )
         )
 
     except Exception as e:
-        logger.exception("Error in content filtering")
+        logger.exception("Error in batch content filtering")
         raise HTTPException(
             status_code=500, detail=f"Content filtering failed: {str(e)}"
         )
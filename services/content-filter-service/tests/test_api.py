@@ -0,0 +1,85 @@
+"""Tests for content filter service API."""
+
+import httpx
+import pytest
+import pytest_asyncio
+from content_filter_service.main import app
+
+
+@pytest_asyncio.fixture(scope="class", loop_scope="class")
+async def client():
+    """Create an async client, running the app lifespan once per class."""
+    async with app.router.lifespan_context(app):
+        async with httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app), base_url="http://test"
+        ) as client:
+            yield client
+
+
+@pytest.mark.asyncio(loop_scope="class")
+class TestContentFilterAPI:
+    """Test content filter service API endpoints."""
+
+    async def test_health_check(self, client):
+        """Test health check endpoint."""
+        response = await client.get("/health")
+
+        assert response.status_code == 200
+        assert response.json()["service"] == "content-filter-service"
+
+    async def test_filter(self, client):
+        """Test filtering a single document."""
+        request_data = {
+            "html": "<p>apple pie</p><p>plain text</p>",
+            "query": "apple",
+            "min_word_count": 1,
+            "keep_only_tags": ["p"],
+            "top_k": 1,
+        }
+
+        response = await client.post("/filter", json=request_data)
+
+        assert response.status_code == 200
+        data = response.json()
+        assert [block["text"] for block in data["blocks"]] == ["apple pie"]
+        assert data["blocks"][0]["score"] > 0
+
+    async def test_filter_batch_order(self, client):
+        """Test that batch results come back in request order."""
+        items = [
+            {
+                "html": "<p>" + " ".join(["word"] * size) + f" doc{index}</p>",
+                "min_word_count": 1,
+                "keep_only_tags": ["p"],
+            }
+            # Larger documents first, so later items tend to finish earlier
+            for index, size in enumerate([2000, 500, 50, 1])
+        ]
+
+        response = await client.post("/filter_batch", json={"items": items})
+
+        assert response.status_code == 200
+        data = response.json()
+        assert len(data) == len(items)
+        for index, result in enumerate(data):
+            assert result["blocks"][0]["text"].endswith(f"doc{index}")
+
+    async def test_filter_batch_matches_filter(self, client):
+        """Test that each batch result equals the single-document result."""
+        items = [
+            {"html": "<p>apple pie</p>", "query": "apple", "min_word_count": 1},
+            {"html": "<p>cherry tart</p>", "min_word_count": 1},
+        ]
+
+        response = await client.post("/filter_batch", json={"items": items})
+
+        assert response.status_code == 200
+        for item, result in zip(items, response.json()):
+            single = await client.post("/filter", json=item)
+            assert single.json() == result
+
+    async def test_filter_batch_rejects_empty(self, client):
+        """Test that an empty batch is rejected."""
+        response = await client.post("/filter_batch", json={"items": []})
+
+        assert response.status_code == 422
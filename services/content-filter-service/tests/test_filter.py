@@ -0,0 +1,142 @@
+"""Tests for BM25 scoring and content filtering."""
+
+import math
+from collections import Counter
+
+import pytest
+from content_filter_service.main import _filter_sync, calculate_bm25_scores
+
+from shared.schemas.content_filter_schemas import ContentFilterRequest
+
+
+def _request(paragraphs, **kwargs):
+    """Build a filter request over one <p> per paragraph."""
+    html = "".join(f"<p>{text}</p>" for text in paragraphs)
+    return ContentFilterRequest(
+        html=html, keep_only_tags=["p"], min_word_count=1, **kwargs
+    )
+
+
+class TestBM25:
+    """Test BM25 scoring against hand-computed values."""
+
+    # Three documents, avgdl 3: "apple" is in two, "cherry" in one
+    TERM_FREQS = [
+        Counter({"apple": 1, "x": 1}),
+        Counter({"apple": 2, "cherry": 1, "x": 1}),
+        Counter({"x": 3}),
+    ]
+    DOC_LENS = [2, 4, 3]
+
+    def test_idf_and_length_normalization(self):
+        """Test scores for a single query term."""
+        scores = calculate_bm25_scores(["apple"], self.TERM_FREQS, self.DOC_LENS)
+
+        # idf = ln((3 - 2 + 0.5) / (2 + 0.5) + 1); k1 = 1.5, b = 0.75
+        idf = math.log(1.6)
+        # norm = k1 * (1 - b + b * len / avgdl): 1.125 for len 2, 1.875 for len 4
+        assert scores[0] == pytest.approx(1 * 2.5 / (1 + 1.125) * idf)
+        assert scores[1] == pytest.approx(2 * 2.5 / (2 + 1.875) * idf)
+        assert scores[2] == 0.0
+
+    def test_rare_terms_weigh_more(self):
+        """Test that scores sum per-term contributions weighted by IDF."""
+        apple = calculate_bm25_scores(["apple"], self.TERM_FREQS, self.DOC_LENS)
+        both = calculate_bm25_scores(
+            ["apple", "cherry"], self.TERM_FREQS, self.DOC_LENS
+        )
+
+        # idf = ln((3 - 1 + 0.5) / (1 + 0.5) + 1) for "cherry"
+        cherry = 1 * 2.5 / (1 + 1.875) * math.log(8 / 3)
+        assert both[1] == pytest.approx(apple[1] + cherry)
+
+    def test_empty_corpus(self):
+        """Test that an empty corpus yields no scores."""
+        scores = calculate_bm25_scores(["apple"], [], [])
+
+        assert scores.shape == (0,)
+
+    def test_all_zero_term_frequencies(self):
+        """Test that absent query terms score zero rather than NaN."""
+        scores = calculate_bm25_scores(["missing"], self.TERM_FREQS, self.DOC_LENS)
+
+        assert scores.tolist() == [0.0, 0.0, 0.0]
+
+    def test_zero_length_documents(self):
+        """Test that a corpus of empty documents scores zero."""
+        scores = calculate_bm25_scores(["apple"], [Counter(), Counter()], [0, 0])
+
+        assert scores.tolist() == [0.0, 0.0]
+
+
+class TestFilter:
+    """Test block filtering, ranking and truncation."""
+
+    PARAGRAPHS = [
+        "nothing relevant here",
+        "apple pie",
+        "apple apple tart",
+        "plain apple pie",
+        "more filler text",
+    ]
+
+    def test_ranking_order(self):
+        """Test that blocks are ranked by score, ties in document order."""
+        response = _filter_sync(_request(self.PARAGRAPHS, query="Apple"))
+
+        texts = [block.text for block in response.blocks]
+        assert texts[:3] == ["apple apple tart", "apple pie", "plain apple pie"]
+        # Zero-score blocks tie and keep document order
+        assert texts[3:] == ["nothing relevant here", "more filler text"]
+
+        scores = [block.score for block in response.blocks]
+        assert scores == sorted(scores, reverse=True)
+        assert scores[3:] == [0.0, 0.0]
+
+    def test_stable_ties(self):
+        """Test that identical blocks keep document order."""
+        paragraphs = ["apple one", "apple two", "apple three"]
+        response = _filter_sync(_request(paragraphs, query="apple"))
+
+        assert [block.text for block in response.blocks] == paragraphs
+        assert len({block.score for block in response.blocks}) == 1
+
+    def test_top_k_with_query(self):
+        """Test that top_k keeps the best-scoring blocks."""
+        response = _filter_sync(_request(self.PARAGRAPHS, query="apple", top_k=2))
+
+        assert [block.text for block in response.blocks] == [
+            "apple apple tart",
+            "apple pie",
+        ]
+        assert response.total_blocks == 2
+        assert response.total_words == 5
+
+    def test_top_k_without_query(self):
+        """Test that top_k keeps the first blocks when nothing is scored."""
+        response = _filter_sync(_request(self.PARAGRAPHS, top_k=2))
+
+        assert [block.text for block in response.blocks] == self.PARAGRAPHS[:2]
+        assert all(block.score is None for block in response.blocks)
+
+    def test_min_word_count(self):
+        """Test that short blocks are dropped before ranking."""
+        request = _request(self.PARAGRAPHS, query="apple")
+        request.min_word_count = 3
+        response = _filter_sync(request)
+
+        assert [block.text for block in response.blocks] == [
+            "apple apple tart",
+            "plain apple pie",
+            "nothing relevant here",
+            "more filler text",
+        ]
+
+    def test_no_blocks(self):
+        """Test a query over a document without content blocks."""
+        response = _filter_sync(
+            ContentFilterRequest(html="<div></div>", query="apple", min_word_count=1)
+        )
+
+        assert response.blocks == []
+        assert response.total_words == 0
@@ -1,8 +1,11 @@
 """Content scraping service API endpoints."""
 
+import asyncio
 import time
-from fastapi import APIRouter, HTTPException
-from crawl4ai_schemas import ScrapingRequest, ScrapingResponse
+from concurrent.futures import Executor
+from typing import Any, Dict, List
+from fastapi import APIRouter, Request
+from crawl4ai_schemas import ScrapingBatchRequest, ScrapingRequest, ScrapingResponse
 
 from .scraper import ContentScraper, ExtractionRule
 
@@ -10,18 +13,30 @@ router = APIRouter(tags=["scraping"])
 scraper = ContentScraper()
 
 
-@router.post("/scrape", response_model=ScrapingResponse)
-async def scrape(request: ScrapingRequest) -> ScrapingResponse:
-    """Scrape content from HTML.
+def _do_scrape(kwargs: Dict[str, Any]) -> Dict[str, Any]:
+    """Run a scrape on this process's scraper.
+
+    Top-level so the scraping process pool can pickle it; each worker gets
+    its own module-level scraper when it imports this module.
 
     Args:
-        request: Scraping request with HTML and options
+        kwargs: Keyword arguments for ContentScraper.scrape
 
     Returns:
-        Scraping response with extracted content
+        Dictionary with extracted content
+    """
+    return scraper.scrape(**kwargs)
+
 
-    Raises:
-        HTTPException: If scraping fails
+async def _run_scrape(request: ScrapingRequest, executor: Executor) -> ScrapingResponse:
+    """Scrape one request on the given executor.
+
+    Args:
+        request: Scraping request with HTML and options
+        executor: Process pool the parse runs on
+
+    Returns:
+        Scraping response; failures are reported with success=False
     """
     start_time = time.time()
 
@@ -39,7 +54,7 @@ async def scrape(request: ScrapingRequest) -> ScrapingResponse:
                 for rule in request.custom_rules
             ]
 
-        result = scraper.scrape(
+        kwargs = dict(
             html=request.html,
             extract_links=request.extract_links,
             extract_images=request.extract_images,
@@ -51,6 +66,9 @@ async def scrape(request: ScrapingRequest) -> ScrapingResponse:
             base_url=request.base_url,
             clean_text=request.clean_text,
         )
+        result = await asyncio.get_running_loop().run_in_executor(
+            executor, _do_scrape, kwargs
+        )
 
         duration_ms = (time.time() - start_time) * 1000
 
@@ -78,6 +96,45 @@ async def scrape(request: ScrapingRequest) -> ScrapingResponse:
         )
 
 
+@router.post("/scrape", response_model=ScrapingResponse)
+async def scrape(request: ScrapingRequest, app_request: Request) -> ScrapingResponse:
+    """Scrape content from HTML.
+
+    Parsing runs on the application's process pool so it does not block the
+    event loop.
+
+    Args:
+        request: Scraping request with HTML and options
+        app_request: FastAPI request object
+
+    Returns:
+        Scraping response with extracted content
+    """
+    return await _run_scrape(request, app_request.app.state.executor)
+
+
+@router.post("/scrape_batch", response_model=List[ScrapingResponse])
+async def scrape_batch(
+    request: ScrapingBatchRequest, app_request: Request
+) -> List[ScrapingResponse]:
+    """Scrape several documents in one call.
+
+    Items are fanned out across the process pool together; responses are
+    returned in request order and a failing item does not fail the batch.
+
+    Args:
+        request: Batch of scraping requests
+        app_request: FastAPI request object
+
+    Returns:
+        One scraping response per item
+    """
+    executor = app_request.app.state.executor
+    return list(
+        await asyncio.gather(*(_run_scrape(item, executor) for item in request.items))
+    )
+
+
 @router.get("/status")
 async def status():
     """Get scraping service status.
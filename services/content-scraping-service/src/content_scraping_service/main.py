@@ -1,8 +1,12 @@
 """Content scraping service main application."""
 
 import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from crawl4ai_core.config import get_settings
 
 from .api import router
@@ -11,12 +15,26 @@ logger = logging.getLogger(__name__)
 settings = get_settings()
 
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Application lifespan manager."""
+    # Startup: parsing is CPU-bound, so run it off the event loop
+    app.state.executor = ProcessPoolExecutor(max_workers=os.cpu_count())
+
+    yield
+
+    # Shutdown
+    app.state.executor.shutdown(wait=False, cancel_futures=True)
+
+
 def create_app() -> FastAPI:
     """Create and configure the FastAPI application."""
     app = FastAPI(
         title="Crawl4AI Content Scraping Service",
         description="Content scraping microservice for extracting data from HTML",
         version="0.1.0",
+        lifespan=lifespan,
+        default_response_class=ORJSONResponse,
     )
 
     # Add CORS middleware
@@ -3,13 +3,109 @@
 import copy
 import logging
 import re
-from typing import Any, Dict, List, Optional, Set
-from urllib.parse import urljoin, urlparse
+from functools import cached_property, lru_cache
+from typing import Any, Callable, Dict, List, Optional
+from urllib.parse import urljoin, urlparse, urlsplit
 from lxml import html as lxml_html, etree
 from bs4 import BeautifulSoup
 
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
 logger = logging.getLogger(__name__)
 
+_WS_RE = re.compile(r"\s+")
+_ABS_URL_PREFIXES = ("http://", "https://")
+
+
+@lru_cache(maxsize=1024)
+def _compile_css(selector: str):
+    """Compile a CSS selector, reusing it across scrapes.
+
+    Args:
+        selector: CSS selector
+
+    Returns:
+        Compiled lxml CSSSelector
+    """
+    from lxml.cssselect import CSSSelector
+
+    return CSSSelector(selector)
+
+
+@lru_cache(maxsize=1024)
+def _compile_xpath(selector: str) -> etree.XPath:
+    """Compile an XPath expression, reusing it across scrapes.
+
+    Args:
+        selector: XPath expression
+
+    Returns:
+        Compiled lxml XPath
+    """
+    return etree.XPath(selector)
+
+
+def _url_resolver(base_url: Optional[str]) -> Callable[[str], str]:
+    """Build a function resolving URLs against a base URL parsed once.
+
+    Against an http(s) base with a netloc, absolute, protocol-relative and
+    plain root-relative URLs are resolved with string operations. Anything
+    urljoin would rewrite or reject (dot or empty segments, empty queries,
+    fragments and params, tabs and newlines, brackets or non-ASCII
+    characters) falls back to urljoin, so results always match it.
+
+    Args:
+        base_url: Base URL, or None to leave URLs unchanged
+
+    Returns:
+        Function mapping a possibly relative URL to an absolute one
+    """
+    if not base_url:
+        return lambda url: url
+
+    parts = urlsplit(base_url)
+    if parts.scheme not in ("http", "https") or not parts.netloc:
+        return lambda url: urljoin(base_url, url)
+    origin = f"{parts.scheme}://{parts.netloc}"
+
+    def resolve(url: str) -> str:
+        if (
+            url.isascii()
+            and "?#" not in url
+            and not url.endswith(("?", "#"))
+            and ";" not in url
+            and "[" not in url
+            and "]" not in url
+            and "\t" not in url
+            and "\n" not in url
+            and "\r" not in url
+        ):
+            if url.startswith(_ABS_URL_PREFIXES):
+                if url[url.index("//") + 2 :][:1] not in ("", "/", "?", "#"):
+                    return url
+            elif url.startswith("//"):
+                if url[2:3] not in ("", "/", "?", "#"):
+                    return f"{parts.scheme}:{url}"
+            elif url.startswith("/") and "/." not in url and "//" not in url:
+                return origin + url
+        return urljoin(base_url, url)
+
+    return resolve
+
+
+# Elements dropped before extracting plain text
+EXCLUDE_TAGS = frozenset({"script", "style", "noscript", "iframe", "svg"})
+
+# Precompiled XPaths for the built-in extractors
+_XP_A_HREF = etree.XPath(".//a[@href]")
+_XP_SOURCE_SRC = etree.XPath(".//source/@src")
+_XP_TITLE = etree.XPath(".//title/text()")
+_XP_CANONICAL = etree.XPath(".//link[@rel='canonical']/@href")
+_XP_HTML_LANG = etree.XPath(".//html/@lang")
+
 
 class ExtractionRule:
     """Rule for extracting specific content."""
@@ -34,21 +130,45 @@ class ExtractionRule:
         self.attribute = attribute
         self.multiple = multiple
 
+    @cached_property
+    def compiled(self) -> Callable:
+        """Compiled selector, built on first use.
 
-class ContentScraper:
-    """Scrapes content from HTML using lxml and BeautifulSoup."""
-
-    def __init__(self):
-        """Initialize the content scraper."""
-        self._link_patterns: Set[str] = set()
-        self._exclude_selectors: List[str] = [
-            "script",
-            "style",
-            "noscript",
-            "iframe",
-            "svg",
+        Compiling lazily keeps rules picklable for the process pool and
+        reports invalid selectors when the rule is applied.
+        """
+        if self.selector.startswith(("//", ".//")):
+            return _compile_xpath(self.selector)
+        return _compile_css(self.selector)
+
+
+class ParsedDoc:
+    """Parsed HTML tree with lazily computed, per-request lookups."""
+
+    def __init__(self, tree):
+        """Wrap a parsed tree.
+
+        Args:
+            tree: lxml HTML tree
+        """
+        self.tree = tree
+
+    @cached_property
+    def all_h(self) -> List[tuple]:
+        """(level, element) for every h1-h6 heading, in document order."""
+        return [
+            (int(element.tag[1]), element)
+            for element in self.tree.iter("h1", "h2", "h3", "h4", "h5", "h6")
         ]
 
+
+class ContentScraper:
+    """Scrapes content from HTML using lxml and BeautifulSoup.
+
+    The scraper holds no per-instance state, so one instance can be shared by
+    all requests in a process.
+    """
+
     def scrape(
         self,
         html: str,
@@ -79,17 +199,69 @@ class ContentScraper:
         Returns:
             Dictionary with extracted content
         """
-        result: Dict[str, Any] = {}
-
         try:
             # Parse with lxml for performance
             tree = lxml_html.fromstring(html)
+        except Exception as e:
+            logger.error(f"Error scraping content: {e}")
+            return {"error": str(e)}
+
+        return self.scrape_tree(
+            tree,
+            extract_links=extract_links,
+            extract_images=extract_images,
+            extract_media=extract_media,
+            extract_metadata=extract_metadata,
+            extract_tables=extract_tables,
+            extract_structured_data=extract_structured_data,
+            custom_rules=custom_rules,
+            base_url=base_url,
+            clean_text=clean_text,
+        )
+
+    def scrape_tree(
+        self,
+        tree,
+        extract_links: bool = False,
+        extract_images: bool = False,
+        extract_media: bool = False,
+        extract_metadata: bool = False,
+        extract_tables: bool = False,
+        extract_structured_data: bool = False,
+        custom_rules: Optional[List[ExtractionRule]] = None,
+        base_url: Optional[str] = None,
+        clean_text: bool = True,
+    ) -> Dict[str, Any]:
+        """Scrape content from an already parsed HTML tree.
+
+        The tree is not modified, so a parsed document can be scraped
+        repeatedly.
+
+        Args:
+            tree: lxml HTML tree
+            extract_links: Extract all links
+            extract_images: Extract all images
+            extract_media: Extract media elements
+            extract_metadata: Extract page metadata
+            extract_tables: Extract table data
+            extract_structured_data: Extract JSON-LD and schema.org data
+            custom_rules: Custom extraction rules
+            base_url: Base URL for resolving relative URLs
+            clean_text: Whether to clean extracted text
+
+        Returns:
+            Dictionary with extracted content
+        """
+        result: Dict[str, Any] = {}
+
+        try:
+            doc = ParsedDoc(tree)
 
             # Extract plain text
             result["text"] = self._extract_text(tree, clean=clean_text)
 
             # Extract headings structure
-            result["headings"] = self._extract_headings(tree)
+            result["headings"] = self._extract_headings(doc)
 
             # Extract links
             if extract_links:
@@ -127,7 +299,8 @@ class ContentScraper:
 
         return result
 
-    def _extract_text(self, tree, clean: bool = True) -> str:
+    @staticmethod
+    def _extract_text(tree, clean: bool = True) -> str:
         """Extract plain text from HTML tree.
 
         Args:
@@ -140,53 +313,45 @@ class ContentScraper:
         # Deep copy tree to avoid modifying original
         tree = copy.deepcopy(tree)
 
-        # Remove unwanted elements
-        for selector in self._exclude_selectors:
-            for element in tree.xpath(f".//{selector}"):
-                parent = element.getparent()
-                if parent is not None:
-                    parent.remove(element)
+        # Remove unwanted elements, keeping the text that follows them
+        etree.strip_elements(tree, *EXCLUDE_TAGS, with_tail=False)
 
         # Get text content
         text = tree.text_content()
 
         if clean:
-            # Clean up whitespace
-            lines = (line.strip() for line in text.splitlines())
-            chunks = (phrase.strip() for line in lines for phrase in line.split("  "))
-            text = " ".join(chunk for chunk in chunks if chunk)
-
-            # Remove excessive whitespace
-            text = re.sub(r"\s+", " ", text).strip()
+            # Collapse all runs of whitespace, including newlines
+            text = _WS_RE.sub(" ", text).strip()
 
         return text
 
-    def _extract_headings(self, tree) -> List[Dict[str, Any]]:
-        """Extract heading structure from HTML tree.
+    @staticmethod
+    def _extract_headings(doc: ParsedDoc) -> List[Dict[str, Any]]:
+        """Extract heading structure from a parsed document.
 
         Args:
-            tree: lxml HTML tree
+            doc: Parsed document
 
         Returns:
-            List of headings with level and text
+            List of headings with level and text, in document order
         """
         headings = []
 
-        for level in range(1, 7):  # h1 to h6
-            for element in tree.xpath(f".//h{level}"):
-                text = element.text_content().strip()
-                if text:
-                    headings.append(
-                        {
-                            "level": level,
-                            "text": text,
-                            "id": element.get("id"),
-                        }
-                    )
+        for level, element in doc.all_h:
+            text = element.text_content().strip()
+            if text:
+                headings.append(
+                    {
+                        "level": level,
+                        "text": text,
+                        "id": element.get("id"),
+                    }
+                )
 
         return headings
 
-    def _extract_links(self, tree, base_url: Optional[str] = None) -> List[str]:
+    @staticmethod
+    def _extract_links(tree, base_url: Optional[str] = None) -> List[str]:
         """Extract all links from HTML tree.
 
         Args:
@@ -196,21 +361,20 @@ class ContentScraper:
         Returns:
             List of absolute URLs
         """
-        links = []
+        # Insertion-ordered set: removes duplicates, keeps page order
+        links: Dict[str, None] = {}
+        resolve = _url_resolver(base_url)
 
-        for element in tree.xpath(".//a[@href]"):
+        for element in _XP_A_HREF(tree):
             href = element.get("href")
             if href:
                 # Resolve relative URLs
-                if base_url:
-                    href = urljoin(base_url, href)
-                links.append(href)
+                links[resolve(href)] = None
 
-        return list(set(links))  # Remove duplicates
+        return list(links)
 
-    def _extract_images(
-        self, tree, base_url: Optional[str] = None
-    ) -> List[Dict[str, str]]:
+    @staticmethod
+    def _extract_images(tree, base_url: Optional[str] = None) -> List[Dict[str, str]]:
         """Extract all images from HTML tree.
 
         Args:
@@ -221,13 +385,13 @@ class ContentScraper:
             List of image dictionaries with src, alt, etc.
         """
         images = []
+        resolve = _url_resolver(base_url)
 
         for element in tree.xpath(".//img[@src]"):
             src = element.get("src")
             if src:
                 # Resolve relative URLs
-                if base_url:
-                    src = urljoin(base_url, src)
+                src = resolve(src)
 
                 images.append(
                     {
@@ -239,9 +403,8 @@ class ContentScraper:
 
         return images
 
-    def _extract_media(
-        self, tree, base_url: Optional[str] = None
-    ) -> List[Dict[str, str]]:
+    @staticmethod
+    def _extract_media(tree, base_url: Optional[str] = None) -> List[Dict[str, str]]:
         """Extract media elements (video, audio) from HTML tree.
 
         Args:
@@ -252,37 +415,23 @@ class ContentScraper:
             List of media dictionaries
         """
         media = []
+        resolve = _url_resolver(base_url)
 
-        # Extract videos
-        for element in tree.xpath(".//video"):
-            src = element.get("src") or (element.xpath(".//source/@src") or [None])[0]
-            if src:
-                if base_url:
-                    src = urljoin(base_url, src)
-                media.append(
-                    {
-                        "type": "video",
-                        "src": src,
-                        "poster": element.get("poster", ""),
-                    }
-                )
+        # Extract videos and audio in one pass, in document order
+        for element in tree.iter("video", "audio"):
+            src = element.get("src") or (_XP_SOURCE_SRC(element) or [None])[0]
+            if not src:
+                continue
 
-        # Extract audio
-        for element in tree.xpath(".//audio"):
-            src = element.get("src") or (element.xpath(".//source/@src") or [None])[0]
-            if src:
-                if base_url:
-                    src = urljoin(base_url, src)
-                media.append(
-                    {
-                        "type": "audio",
-                        "src": src,
-                    }
-                )
+            item = {"type": element.tag, "src": resolve(src)}
+            if element.tag == "video":
+                item["poster"] = element.get("poster", "")
+            media.append(item)
 
         return media
 
-    def _extract_metadata(self, tree) -> Dict[str, Any]:
+    @staticmethod
+    def _extract_metadata(tree) -> Dict[str, Any]:
         """Extract page metadata from HTML tree.
 
         Args:
@@ -294,30 +443,31 @@ class ContentScraper:
         metadata = {}
 
         # Extract title
-        title = tree.xpath(".//title/text()")
+        title = _XP_TITLE(tree)
         if title:
             metadata["title"] = title[0].strip()
 
         # Extract meta tags
-        for element in tree.xpath(".//meta"):
+        for element in tree.iter("meta"):
             name = element.get("name") or element.get("property")
             content = element.get("content")
             if name and content:
                 metadata[name] = content
 
         # Extract canonical URL
-        canonical = tree.xpath(".//link[@rel='canonical']/@href")
+        canonical = _XP_CANONICAL(tree)
         if canonical:
             metadata["canonical"] = canonical[0]
 
         # Extract language
-        lang = tree.xpath(".//html/@lang")
+        lang = _XP_HTML_LANG(tree)
         if lang:
             metadata["language"] = lang[0]
 
         return metadata
 
-    def _extract_tables(self, tree) -> List[Dict[str, Any]]:
+    @staticmethod
+    def _extract_tables(tree) -> List[Dict[str, Any]]:
         """Extract table data from HTML tree.
 
         Args:
@@ -328,42 +478,43 @@ class ContentScraper:
         """
         tables = []
 
-        for table_idx, table in enumerate(tree.xpath(".//table")):
+        for table_idx, table in enumerate(tree.iter("table")):
             table_data = {
                 "index": table_idx,
                 "headers": [],
                 "rows": [],
             }
 
-            # Extract headers
-            headers = table.xpath(".//thead//th | .//tr[1]//th")
+            rows = list(table.iter("tr"))
+            if not rows:
+                continue
+
+            # Header cells come from the first row: th cells if it has any,
+            # otherwise its td cells. The row is kept as data only when it
+            # mixes th and td cells, as in key/value tables.
+            first = rows[0]
+            first_cells = [td.text_content().strip() for td in first.iter("td")]
+            headers = [th.text_content().strip() for th in first.iter("th")]
             if headers:
-                table_data["headers"] = [h.text_content().strip() for h in headers]
+                data_start = 0 if first_cells else 1
             else:
-                # Try first row as headers
-                first_row = table.xpath(".//tr[1]//td")
-                if first_row:
-                    table_data["headers"] = [
-                        cell.text_content().strip() for cell in first_row
-                    ]
+                headers = first_cells
+                data_start = 1
+            table_data["headers"] = headers
 
             # Extract rows
-            row_xpath = ".//tbody//tr" if table.xpath(".//tbody") else ".//tr"
-            start_idx = 2 if not headers and table_data["headers"] else 1
-
-            for row in table.xpath(f"{row_xpath}[position()>={start_idx}]"):
-                cells = row.xpath(".//td | .//th")
+            for row in rows[data_start:]:
+                cells = [cell.text_content().strip() for cell in row.iter("td", "th")]
                 if cells:
-                    table_data["rows"].append(
-                        [cell.text_content().strip() for cell in cells]
-                    )
+                    table_data["rows"].append(cells)
 
             if table_data["rows"]:
                 tables.append(table_data)
 
         return tables
 
-    def _extract_structured_data(self, tree) -> List[Dict[str, Any]]:
+    @staticmethod
+    def _extract_structured_data(tree) -> List[Dict[str, Any]]:
         """Extract structured data (JSON-LD, Microdata) from HTML tree.
 
         Args:
@@ -372,21 +523,19 @@ class ContentScraper:
         Returns:
             List of structured data objects
         """
-        import json
-
         structured_data = []
 
         # Extract JSON-LD
         for script in tree.xpath(".//script[@type='application/ld+json']"):
             try:
-                data = json.loads(script.text_content())
+                data = _json_loads(script.text_content())
                 structured_data.append(
                     {
                         "type": "json-ld",
                         "data": data,
                     }
                 )
-            except json.JSONDecodeError as e:
+            except ValueError as e:
                 logger.warning(f"Failed to parse JSON-LD: {e}")
 
         # Extract microdata (schema.org)
@@ -407,8 +556,8 @@ class ContentScraper:
 
         return structured_data
 
+    @staticmethod
     def _apply_custom_rules(
-        self,
         tree,
         rules: List[ExtractionRule],
         base_url: Optional[str] = None,
@@ -424,18 +573,12 @@ class ContentScraper:
             Dictionary with custom extracted data
         """
         result = {}
+        resolve = _url_resolver(base_url)
 
         for rule in rules:
             try:
-                # Use XPath selector
-                if rule.selector.startswith("//") or rule.selector.startswith(".//"):
-                    elements = tree.xpath(rule.selector)
-                else:
-                    # Convert CSS selector to XPath
-                    from lxml.cssselect import CSSSelector
-
-                    selector = CSSSelector(rule.selector)
-                    elements = selector(tree)
+                # XPath or CSS selector, compiled once per rule
+                elements = rule.compiled(tree)
 
                 if not elements:
                     result[rule.name] = [] if rule.multiple else None
@@ -448,7 +591,7 @@ class ContentScraper:
                         value = element.get(rule.attribute)
                         # Resolve URLs if needed
                         if base_url and rule.attribute in ["href", "src"]:
-                            value = urljoin(base_url, value) if value else None
+                            value = resolve(value) if value else None
                     else:
                         value = element.text_content().strip()
 
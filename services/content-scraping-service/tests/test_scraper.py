@@ -1,7 +1,15 @@
 """Tests for content scraper functionality."""
 
+import textwrap
+from urllib.parse import urljoin
+
 import pytest
-from content_scraping_service.scraper import ContentScraper, ExtractionRule
+from content_scraping_service.scraper import (
+    ContentScraper,
+    ExtractionRule,
+    _compile_xpath,
+    _url_resolver,
+)
 
 
 @pytest.fixture
@@ -10,46 +18,56 @@ def scraper():
     return ContentScraper()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_html():
     """Sample HTML for testing."""
-    return """
-    <!DOCTYPE html>
-    <html lang="en">
-    <head>
-        <title>Test Page</title>
-        <meta name="description" content="Test description">
-        <meta property="og:title" content="Test OG Title">
-    </head>
-    <body>
-        <h1>Main Heading</h1>
-        <h2>Subheading 1</h2>
-        <p>This is a test paragraph with <a href="/link1">a link</a>.</p>
-        <p>Another paragraph with <a href="https://example.com">external link</a>.</p>
-
-        <img src="/image1.jpg" alt="Test Image 1">
-        <img src="https://example.com/image2.jpg" alt="Test Image 2">
+    return textwrap.dedent(
+        """
+        <!DOCTYPE html>
+        <html lang="en">
+        <head>
+            <title>Test Page</title>
+            <meta name="description" content="Test description">
+            <meta property="og:title" content="Test OG Title">
+        </head>
+        <body>
+            <h1>Main Heading</h1>
+            <h2>Subheading 1</h2>
+            <p>This is a test paragraph with <a href="/link1">a link</a>.</p>
+            <p>Another paragraph with <a href="https://example.com">external link</a>.</p>
+
+            <img src="/image1.jpg" alt="Test Image 1">
+            <img src="https://example.com/image2.jpg" alt="Test Image 2">
+
+            <table>
+                <thead>
+                    <tr><th>Name</th><th>Age</th></tr>
+                </thead>
+                <tbody>
+                    <tr><td>Alice</td><td>30</td></tr>
+                    <tr><td>Bob</td><td>25</td></tr>
+                </tbody>
+            </table>
+
+            <script type="application/ld+json">
+            {
+                "@context": "https://schema.org",
+                "@type": "Article",
+                "headline": "Test Article"
+            }
+            </script>
+        </body>
+        </html>
+        """
+    )
 
-        <table>
-            <thead>
-                <tr><th>Name</th><th>Age</th></tr>
-            </thead>
-            <tbody>
-                <tr><td>Alice</td><td>30</td></tr>
-                <tr><td>Bob</td><td>25</td></tr>
-            </tbody>
-        </table>
 
-        <script type="application/ld+json">
-        {
-            "@context": "https://schema.org",
-            "@type": "Article",
-            "headline": "Test Article"
-        }
-        </script>
-    </body>
-    </html>
-    """
+@pytest.fixture(scope="session")
+def sample_parsed(sample_html):
+    """Sample HTML parsed once for the whole session."""
+    from lxml import html
+
+    return html.fromstring(sample_html)
 
 
 def test_extract_text(scraper, sample_html):
@@ -61,9 +79,9 @@ def test_extract_text(scraper, sample_html):
     assert "test paragraph" in result["text"]
 
 
-def test_extract_headings(scraper, sample_html):
+def test_extract_headings(scraper, sample_parsed):
     """Test heading extraction."""
-    result = scraper.scrape(sample_html)
+    result = scraper.scrape_tree(sample_parsed)
 
     assert "headings" in result
     assert len(result["headings"]) == 2
@@ -106,9 +124,9 @@ def test_extract_metadata(scraper, sample_html):
     assert result["metadata"]["language"] == "en"
 
 
-def test_extract_tables(scraper, sample_html):
+def test_extract_tables(scraper, sample_parsed):
     """Test table extraction."""
-    result = scraper.scrape(sample_html, extract_tables=True)
+    result = scraper.scrape_tree(sample_parsed, extract_tables=True)
 
     assert "tables" in result
     assert len(result["tables"]) == 1
@@ -120,9 +138,26 @@ def test_extract_tables(scraper, sample_html):
     assert table["rows"][1] == ["Bob", "25"]
 
 
-def test_extract_structured_data(scraper, sample_html):
+def test_extract_tables_key_value_rows(scraper):
+    """Test a first row mixing th and td cells is kept as data."""
+    html = textwrap.dedent(
+        """
+        <table>
+            <tr><th>Name</th><td>Alice</td></tr>
+            <tr><th>Age</th><td>30</td></tr>
+        </table>
+        """
+    )
+    result = scraper.scrape(html, extract_tables=True)
+
+    table = result["tables"][0]
+    assert table["headers"] == ["Name"]
+    assert table["rows"] == [["Name", "Alice"], ["Age", "30"]]
+
+
+def test_extract_structured_data(scraper, sample_parsed):
     """Test structured data extraction."""
-    result = scraper.scrape(sample_html, extract_structured_data=True)
+    result = scraper.scrape_tree(sample_parsed, extract_structured_data=True)
 
     assert "structured_data" in result
     assert len(result["structured_data"]) >= 1
@@ -134,7 +169,7 @@ def test_extract_structured_data(scraper, sample_html):
     assert json_ld["data"]["@type"] == "Article"
 
 
-def test_custom_extraction_rules(scraper, sample_html):
+def test_custom_extraction_rules(scraper, sample_parsed):
     """Test custom extraction rules."""
     rules = [
         ExtractionRule(
@@ -149,13 +184,28 @@ def test_custom_extraction_rules(scraper, sample_html):
         ),
     ]
 
-    result = scraper.scrape(sample_html, custom_rules=rules)
+    result = scraper.scrape_tree(sample_parsed, custom_rules=rules)
 
     assert "custom" in result
     assert "all_paragraphs" in result["custom"]
     assert len(result["custom"]["all_paragraphs"]) >= 2
     assert result["custom"]["first_heading"] == "Main Heading"
 
+    # Values come from the rule's compiled selector
+    assert result["custom"]["all_paragraphs"] == [
+        p.text_content().strip() for p in rules[0].compiled(sample_parsed)
+    ]
+
+    # Selectors are compiled once and reused, even by new rule objects
+    hits = _compile_xpath.cache_info().hits
+    fresh_rules = [
+        ExtractionRule(name=rule.name, selector=rule.selector, multiple=rule.multiple)
+        for rule in rules
+    ]
+    assert scraper.scrape_tree(sample_parsed, custom_rules=fresh_rules) == result
+    assert _compile_xpath.cache_info().hits == hits + 2
+    assert fresh_rules[0].compiled is rules[0].compiled
+
 
 def test_error_handling(scraper):
     """Test error handling with invalid HTML."""
@@ -181,3 +231,39 @@ def test_url_resolution(scraper):
     result = scraper.scrape(html, extract_links=True, base_url="https://example.com")
 
     assert result["links"][0] == "https://example.com/test"
+
+
+@pytest.mark.parametrize(
+    "base_url",
+    ["https://example.com/a/b", "http://example.com", "example.com/p", "/p/q"],
+)
+@pytest.mark.parametrize(
+    "url",
+    [
+        "https://b.com/y",
+        "//b.com/y",
+        "/x",
+        "/x/../y",
+        "/./x",
+        "../x",
+        "x?q=1",
+        "/x?",
+        "/x#",
+        "/x?#",
+        "/x;p",
+        "/x//y",
+        "/x\t/y",
+        "/x\ny",
+        "/x\r\ny",
+        "https://b.com/y?",
+        "https://b.com/y#",
+        "https://b.com/a\nb",
+        "https://[::1]/y",
+        "//b.com/y?",
+        "//b.com/y\t",
+        "http:///y",
+    ],
+)
+def test_url_resolver_matches_urljoin(base_url, url):
+    """Test the resolver's fast paths agree with urljoin."""
+    assert _url_resolver(base_url)(url) == urljoin(base_url, url)
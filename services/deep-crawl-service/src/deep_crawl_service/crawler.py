@@ -1,14 +1,18 @@
 """Deep crawl coordinator implementation."""
 
 import asyncio
+import heapq
+import itertools
 import re
 import time
-from typing import Dict, List, Optional, Set, Tuple
+from functools import lru_cache
+from typing import Any, AsyncIterator, Dict, List, Optional, Pattern, Sequence, Set, Tuple
 from urllib.parse import urlparse, urljoin
 from collections import deque
 import logging
 
 import httpx
+import orjson
 
 from shared.schemas.deep_crawl_schemas import (
     CrawlStrategy,
@@ -18,28 +22,308 @@ from shared.schemas.deep_crawl_schemas import (
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_BROWSER_SERVICE_URL = "http://browser-service:8000"
+DEFAULT_SCRAPING_SERVICE_URL = "http://content-scraping-service:8002"
+
+@lru_cache(maxsize=100_000)
+def _normalize_url(url: str, base_url: str = "") -> str:
+    """Normalize URL for comparison, memoized across crawls.
+
+    Args:
+        url: URL to normalize.
+        base_url: Base URL for resolving relative URLs.
+
+    Returns:
+        Normalized URL.
+    """
+    # Resolve relative URLs
+    if base_url and not url.startswith(("http://", "https://")):
+        url = urljoin(base_url, url)
+
+    # Remove fragment and trailing slashes
+    return url.split("#", 1)[0].rstrip("/")
+
+
+def _score_url(url: str, depth: int) -> float:
+    """Score a URL for best-first crawling, higher is better.
+
+    Favors shallow crawl depth and short paths, and penalizes query strings,
+    which tend to be listings, filters and other low-value variants. The
+    start page scores 1.0, typical depth-1 links about 0.6-0.75 and most
+    depth-3 links below 0.5.
+
+    Args:
+        url: Normalized absolute URL.
+        depth: Crawl depth the URL would be fetched at.
+
+    Returns:
+        Score in (0, 1].
+    """
+    parsed = urlparse(url)
+    segments = parsed.path.count("/")
+    score = 1.0 / (1 + 0.25 * depth) / (1 + 0.1 * segments)
+    if parsed.query:
+        score *= 0.8
+    return score
+
+
+# Links that can never be crawled: in-page anchors and non-HTTP schemes
+_UNCRAWLABLE_PREFIXES = ("#", "javascript:", "mailto:", "tel:", "data:")
+
+
+def _netloc(url: str) -> str:
+    """Return the network location of an absolute http(s) URL.
+
+    The netloc runs from after "//" up to the next "/", "?" or "#", so no
+    full parse is needed.
+
+    Args:
+        url: Absolute URL starting with http:// or https://.
+
+    Returns:
+        Network location of the URL.
+    """
+    return url.split("/", 3)[2].partition("?")[0].partition("#")[0]
+
+
+# Matches nothing; stands in for an invalid inclusion pattern
+_NEVER_MATCH = re.compile(r"(?!)")
+
+
+@lru_cache(maxsize=256)
+def _compile_filters(
+    url_pattern: Optional[str], exclude_patterns: Tuple[str, ...] = ()
+) -> Tuple[Optional[Pattern[str]], Tuple[Pattern[str], ...]]:
+    """Compile a crawl's inclusion and exclusion patterns.
+
+    Results are cached, so repeated crawls with the same filters share one
+    compiled bundle. Invalid patterns are logged and never match: an invalid
+    inclusion pattern admits no links and an invalid exclusion pattern
+    excludes none.
+
+    Args:
+        url_pattern: Optional inclusion pattern.
+        exclude_patterns: Exclusion patterns, as a tuple so they can be hashed.
+
+    Returns:
+        Tuple of (compiled inclusion pattern or None, compiled exclusions).
+    """
+
+    def compile_or_none(pattern: str) -> Optional[Pattern[str]]:
+        try:
+            return re.compile(pattern)
+        except re.error as e:
+            logger.warning(f"Invalid regex pattern: {pattern}, error: {e}")
+            return None
+
+    include_re = None
+    if url_pattern:
+        include_re = compile_or_none(url_pattern) or _NEVER_MATCH
+
+    exclude_res = tuple(
+        compiled
+        for compiled in map(compile_or_none, exclude_patterns)
+        if compiled is not None
+    )
+
+    return include_re, exclude_res
+
+
+class _HostSemaphores:
+    """Per-host concurrency limits for one crawl.
+
+    Semaphores are created on first use and live as long as the crawl, so
+    idle hosts are released with it.
+    """
+
+    def __init__(self, limit: int):
+        """Initialize the per-host limits.
+
+        Args:
+            limit: Maximum number of pages crawled at once per host.
+        """
+        self.limit = limit
+        self._semaphores: Dict[str, asyncio.Semaphore] = {}
+
+    @staticmethod
+    def host(url: str) -> str:
+        """Return the host a URL is crawled from.
+
+        Args:
+            url: URL to crawl.
+
+        Returns:
+            Network location of the URL.
+        """
+        if url.startswith(("http://", "https://")):
+            return _netloc(url)
+        return urlparse(url).netloc
+
+    def get(self, url: str) -> asyncio.Semaphore:
+        """Get the semaphore for a URL's host, creating it if needed.
+
+        Args:
+            url: URL to crawl.
+
+        Returns:
+            Semaphore bounding concurrent crawls of the URL's host.
+        """
+        host = self.host(url)
+        semaphore = self._semaphores.get(host)
+        if semaphore is None:
+            semaphore = self._semaphores[host] = asyncio.Semaphore(self.limit)
+        return semaphore
+
+    def chunks(self, urls: Sequence[str], size: int) -> List[List[str]]:
+        """Split URLs into ordered chunks that respect the per-host limit.
+
+        Args:
+            urls: URLs to crawl.
+            size: Maximum chunk size.
+
+        Returns:
+            Consecutive chunks of at most ``size`` URLs, none holding more
+            than ``limit`` URLs of one host.
+        """
+        chunks: List[List[str]] = []
+        chunk: List[str] = []
+        per_host: Dict[str, int] = {}
+        for url in urls:
+            host = self.host(url)
+            if len(chunk) >= size or per_host.get(host, 0) >= self.limit:
+                chunks.append(chunk)
+                chunk = []
+                per_host = {}
+            chunk.append(url)
+            per_host[host] = per_host.get(host, 0) + 1
+        if chunk:
+            chunks.append(chunk)
+        return chunks
+
+
+class _HttpBackend:
+    """JSON-over-HTTP client for calls to the browser and scraping services."""
+
+    def __init__(
+        self,
+        timeout: float = 30.0,
+        max_connections: int = 512,
+        max_keepalive_connections: int = 256,
+        client: Optional[httpx.AsyncClient] = None,
+    ):
+        """Initialize the backend.
+
+        Args:
+            timeout: Request timeout in seconds.
+            max_connections: Size of the shared connection pool.
+            max_keepalive_connections: Idle connections kept open for reuse.
+            client: Client to use instead of a pooled one built from the
+                other arguments, e.g. one with a mock transport.
+        """
+        self._client = client or httpx.AsyncClient(
+            timeout=httpx.Timeout(timeout, connect=5.0),
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive_connections,
+                keepalive_expiry=60.0,
+            ),
+            transport=httpx.AsyncHTTPTransport(retries=0),
+        )
+
+    async def warmup(self, urls: Sequence[str]):
+        """Open a pooled connection to each URL ahead of the first crawl.
+
+        Failures are ignored; an unreachable service is reported by the crawl
+        that needs it.
+
+        Args:
+            urls: URLs to GET, typically service health endpoints.
+        """
+        await asyncio.gather(
+            *(self._client.get(url) for url in urls), return_exceptions=True
+        )
+
+    async def supports(self, url: str) -> Optional[bool]:
+        """Check whether an endpoint exists on the remote service.
+
+        Args:
+            url: Endpoint URL to probe with HEAD.
+
+        Returns:
+            True if the service answers 2xx or 405 (a POST-only route answers
+            HEAD with 405), False if it answers 404, and None if the probe
+            failed and should be retried later.
+        """
+        try:
+            response = await self._client.head(url)
+        except httpx.HTTPError:
+            return None
+        if response.status_code == 405 or response.is_success:
+            return True
+        if response.status_code == 404:
+            return False
+        return None
+
+    async def post_json(self, url: str, payload: Any) -> Any:
+        """POST a JSON payload and return the decoded JSON response.
+
+        Args:
+            url: Endpoint URL.
+            payload: JSON-serializable request body.
+
+        Returns:
+            Decoded response body, an object or a list.
+
+        Raises:
+            httpx.HTTPStatusError: If the response status is an error.
+        """
+        response = await self._client.post(
+            url,
+            content=orjson.dumps(payload),
+            headers={"Content-Type": "application/json"},
+        )
+        response.raise_for_status()
+        return orjson.loads(response.content)
+
+    async def aclose(self):
+        """Close the underlying connection pool."""
+        await self._client.aclose()
+
 
 class DeepCrawlCoordinator:
     """Coordinates deep crawling by orchestrating browser and scraping services."""
 
     def __init__(
         self,
-        browser_service_url: str = "http://browser-service:8000",
-        scraping_service_url: str = "http://content-scraping-service:8002",
+        browser_service_url: str = DEFAULT_BROWSER_SERVICE_URL,
+        scraping_service_url: str = DEFAULT_SCRAPING_SERVICE_URL,
+        http_client: Optional[httpx.AsyncClient] = None,
     ):
         """Initialize deep crawl coordinator.
 
         Args:
             browser_service_url: URL of the browser service.
             scraping_service_url: URL of the content scraping service.
+            http_client: Optional client for service calls; by default a
+                pooled client is created.
         """
         self.browser_service_url = browser_service_url
         self.scraping_service_url = scraping_service_url
-        self.http_client = httpx.AsyncClient(timeout=30.0)
+        self._backend = _HttpBackend(timeout=30.0, client=http_client)
+        self._batch_supported: Optional[bool] = None
+
+    async def warmup(self):
+        """Pre-open connections to the browser and scraping services."""
+        await self._backend.warmup(
+            [
+                f"{self.browser_service_url}/health",
+                f"{self.scraping_service_url}/health",
+            ]
+        )
 
     async def close(self):
         """Close HTTP client."""
-        await self.http_client.aclose()
+        await self._backend.aclose()
 
     def _normalize_url(self, url: str, base_url: str = "") -> str:
         """Normalize URL for comparison.
@@ -51,88 +335,116 @@ class DeepCrawlCoordinator:
         Returns:
             Normalized URL.
         """
-        # Resolve relative URLs
-        if base_url and not url.startswith(("http://", "https://")):
-            url = urljoin(base_url, url)
-
-        # Remove fragment
-        url = url.split("#")[0]
+        return _normalize_url(url, base_url)
 
-        # Remove trailing slash
-        if url.endswith("/"):
-            url = url[:-1]
-
-        return url
-
-    def _is_same_domain(self, url1: str, url2: str) -> bool:
-        """Check if two URLs are from the same domain.
+    def _is_same_domain(self, url: str, base_netloc: str) -> bool:
+        """Check if a URL is on the given domain.
 
         Args:
-            url1: First URL.
-            url2: Second URL.
+            url: URL to check.
+            base_netloc: Network location of the crawl's start URL.
 
         Returns:
             True if same domain, False otherwise.
         """
-        try:
-            domain1 = urlparse(url1).netloc
-            domain2 = urlparse(url2).netloc
-            return domain1 == domain2
-        except Exception:
-            return False
-
-    def _matches_pattern(self, url: str, pattern: str) -> bool:
-        """Check if URL matches regex pattern.
-
-        Args:
-            url: URL to check.
-            pattern: Regex pattern.
+        # Absolute URLs (all normalized links) are sliced, not parsed
+        if url.startswith(("http://", "https://")):
+            return _netloc(url) == base_netloc
 
-        Returns:
-            True if matches, False otherwise.
-        """
         try:
-            return bool(re.search(pattern, url))
-        except Exception as e:
-            logger.warning(f"Invalid regex pattern: {pattern}, error: {e}")
+            return urlparse(url).netloc == base_netloc
+        except Exception:
             return False
 
     def _should_crawl_url(
         self,
         url: str,
-        start_url: str,
+        start_netloc: str,
         include_external: bool,
-        url_pattern: Optional[str],
-        exclude_patterns: Optional[List[str]],
+        include_re: Optional[Pattern[str]],
+        exclude_res: Sequence[Pattern[str]],
     ) -> bool:
         """Determine if a URL should be crawled.
 
         Args:
             url: URL to check.
-            start_url: Starting URL of the crawl.
+            start_netloc: Network location of the crawl's start URL.
             include_external: Whether to include external links.
-            url_pattern: Optional inclusion pattern.
-            exclude_patterns: Optional exclusion patterns.
+            include_re: Optional compiled inclusion pattern.
+            exclude_res: Compiled exclusion patterns.
 
         Returns:
             True if URL should be crawled, False otherwise.
         """
         # Check if external
-        if not include_external and not self._is_same_domain(url, start_url):
+        if not include_external and not self._is_same_domain(url, start_netloc):
             return False
 
         # Check exclusion patterns
-        if exclude_patterns:
-            for pattern in exclude_patterns:
-                if self._matches_pattern(url, pattern):
-                    return False
+        for pattern in exclude_res:
+            if pattern.search(url):
+                return False
 
         # Check inclusion pattern
-        if url_pattern:
-            return self._matches_pattern(url, url_pattern)
+        if include_re is not None:
+            return include_re.search(url) is not None
 
         return True
 
+    @staticmethod
+    def _build_result(
+        url: str,
+        browser_data: Dict,
+        scrape_data: Dict,
+        scraping_config: Optional[Dict],
+    ) -> CrawlResultItem:
+        """Build the result for a page that navigated successfully.
+
+        Args:
+            url: URL that was crawled.
+            browser_data: Browser service response for the page.
+            scrape_data: Scraping service response for the page.
+            scraping_config: Scraping configuration.
+
+        Returns:
+            CrawlResultItem with the result.
+        """
+        return CrawlResultItem(
+            url=url,
+            depth=0,  # Will be set by caller
+            success=True,
+            status_code=browser_data.get("status_code"),
+            title=scrape_data.get("title"),
+            html=browser_data.get("html", "")
+            if scraping_config and scraping_config.get("include_html")
+            else None,
+            markdown=scrape_data.get("markdown"),
+            links=scrape_data.get("links"),
+            metadata=scrape_data.get("metadata"),
+        )
+
+    async def _supports_batch(self) -> bool:
+        """Check once whether both services expose their batch endpoints.
+
+        A failed probe (unreachable service, 5xx) is not remembered, so a
+        transient outage does not disable batching for good.
+
+        Returns:
+            True if /navigate_batch and /scrape_batch are both available.
+        """
+        if self._batch_supported is None:
+            browser_ok, scraping_ok = await asyncio.gather(
+                self._backend.supports(f"{self.browser_service_url}/navigate_batch"),
+                self._backend.supports(f"{self.scraping_service_url}/scrape_batch"),
+            )
+            if browser_ok is False or scraping_ok is False:
+                self._batch_supported = False
+            elif browser_ok and scraping_ok:
+                self._batch_supported = True
+            else:
+                return False
+        return self._batch_supported
+
     async def _crawl_page(
         self,
         url: str,
@@ -152,12 +464,9 @@ class DeepCrawlCoordinator:
         try:
             # Step 1: Navigate to URL using browser service
             payload = {**(browser_config or {}), "url": url}
-            browser_response = await self.http_client.post(
-                f"{self.browser_service_url}/navigate",
-                json=payload,
+            browser_data = await self._backend.post_json(
+                f"{self.browser_service_url}/navigate", payload
             )
-            browser_response.raise_for_status()
-            browser_data = browser_response.json()
 
             if not browser_data.get("success"):
                 return CrawlResultItem(
@@ -171,26 +480,11 @@ class DeepCrawlCoordinator:
 
             # Step 2: Scrape content
             scrape_payload = {**(scraping_config or {}), "html": html, "url": url}
-            scrape_response = await self.http_client.post(
-                f"{self.scraping_service_url}/scrape",
-                json=scrape_payload,
+            scrape_data = await self._backend.post_json(
+                f"{self.scraping_service_url}/scrape", scrape_payload
             )
-            scrape_response.raise_for_status()
-            scrape_data = scrape_response.json()
 
-            return CrawlResultItem(
-                url=url,
-                depth=0,  # Will be set by caller
-                success=True,
-                status_code=browser_data.get("status_code"),
-                title=scrape_data.get("title"),
-                html=html
-                if scraping_config and scraping_config.get("include_html")
-                else None,
-                markdown=scrape_data.get("markdown"),
-                links=scrape_data.get("links"),
-                metadata=scrape_data.get("metadata"),
-            )
+            return self._build_result(url, browser_data, scrape_data, scraping_config)
 
         except httpx.HTTPStatusError as e:
             logger.error(f"HTTP error crawling {url}: {e}")
@@ -210,6 +504,288 @@ class DeepCrawlCoordinator:
                 error=str(e),
             )
 
+    async def _crawl_page_bounded(
+        self,
+        semaphore: asyncio.Semaphore,
+        host_semaphores: _HostSemaphores,
+        url: str,
+        browser_config: Optional[Dict] = None,
+        scraping_config: Optional[Dict] = None,
+    ) -> CrawlResultItem:
+        """Crawl a single page, holding a host slot and a crawl slot.
+
+        The host slot is taken first, so pages waiting on a busy host do not
+        hold crawl slots other hosts could use.
+
+        Args:
+            semaphore: Semaphore bounding concurrent page crawls.
+            host_semaphores: Per-host limits of the crawl.
+            url: URL to crawl.
+            browser_config: Browser configuration.
+            scraping_config: Scraping configuration.
+
+        Returns:
+            CrawlResultItem with the result.
+        """
+        async with host_semaphores.get(url), semaphore:
+            return await self._crawl_page(url, browser_config, scraping_config)
+
+    async def _crawl_batch_bounded(
+        self,
+        lock: asyncio.Lock,
+        semaphore: asyncio.Semaphore,
+        host_semaphores: _HostSemaphores,
+        urls: List[str],
+        browser_config: Optional[Dict] = None,
+        scraping_config: Optional[Dict] = None,
+    ) -> List[CrawlResultItem]:
+        """Crawl a batch of pages, holding a host slot and a crawl slot per page.
+
+        Slots are taken under ``lock``, host slots first, so concurrent
+        batches never each hold part of what they need while waiting on one
+        another.
+
+        Args:
+            lock: Lock serializing slot acquisition between batches.
+            semaphore: Semaphore bounding concurrent page crawls.
+            host_semaphores: Per-host limits of the crawl.
+            urls: URLs to crawl.
+            browser_config: Browser configuration shared by every URL.
+            scraping_config: Scraping configuration.
+
+        Returns:
+            One CrawlResultItem per URL, in order.
+        """
+        slots = [host_semaphores.get(url) for url in urls]
+        slots += [semaphore] * len(urls)
+        acquired: List[asyncio.Semaphore] = []
+        try:
+            async with lock:
+                for slot in slots:
+                    await slot.acquire()
+                    acquired.append(slot)
+            return await self._crawl_batch(urls, browser_config, scraping_config)
+        finally:
+            for slot in acquired:
+                slot.release()
+
+    async def _crawl_batch(
+        self,
+        urls: List[str],
+        browser_config: Optional[Dict] = None,
+        scraping_config: Optional[Dict] = None,
+    ) -> List[CrawlResultItem]:
+        """Crawl several pages with one browser call and one scraping call.
+
+        Args:
+            urls: URLs to crawl.
+            browser_config: Browser configuration shared by every URL.
+            scraping_config: Scraping configuration.
+
+        Returns:
+            One CrawlResultItem per URL, in order.
+        """
+        try:
+            browser_results = await self._backend.post_json(
+                f"{self.browser_service_url}/navigate_batch",
+                {"urls": urls, "config": browser_config or {}},
+            )
+
+            results: List[Optional[CrawlResultItem]] = [None] * len(urls)
+            navigated = []
+            for i, browser_data in enumerate(browser_results):
+                if browser_data.get("success"):
+                    navigated.append(i)
+                else:
+                    results[i] = CrawlResultItem(
+                        url=urls[i],
+                        depth=0,
+                        success=False,
+                        error=browser_data.get("error", "Browser navigation failed"),
+                    )
+
+            if navigated:
+                scraping_base = scraping_config or {}
+                scrape_results = await self._backend.post_json(
+                    f"{self.scraping_service_url}/scrape_batch",
+                    {
+                        "items": [
+                            {
+                                **scraping_base,
+                                "html": browser_results[i].get("html", ""),
+                                "url": urls[i],
+                            }
+                            for i in navigated
+                        ]
+                    },
+                )
+                for i, scrape_data in zip(navigated, scrape_results):
+                    results[i] = self._build_result(
+                        urls[i], browser_results[i], scrape_data, scraping_config
+                    )
+
+            return results
+
+        except httpx.HTTPStatusError as e:
+            logger.error(f"HTTP error crawling batch of {len(urls)} URLs: {e}")
+            status_code = e.response.status_code if e.response else None
+            error = f"HTTP {status_code}" if e.response else str(e)
+            return [
+                CrawlResultItem(
+                    url=url,
+                    depth=0,
+                    success=False,
+                    status_code=status_code,
+                    error=error,
+                )
+                for url in urls
+            ]
+        except Exception as e:
+            logger.exception(f"Error crawling batch of {len(urls)} URLs")
+            return [
+                CrawlResultItem(url=url, depth=0, success=False, error=str(e))
+                for url in urls
+            ]
+
+    async def _crawl_wave(
+        self,
+        semaphore: asyncio.Semaphore,
+        host_semaphores: _HostSemaphores,
+        concurrency: int,
+        urls: List[str],
+        browser_config: Optional[Dict] = None,
+        scraping_config: Optional[Dict] = None,
+    ) -> AsyncIterator[Tuple[int, CrawlResultItem]]:
+        """Crawl a wave of pages, yielding each result as soon as it lands.
+
+        With batch endpoints the wave goes out in chunks of up to
+        ``concurrency`` URLs within the per-host limit, two requests per
+        chunk, crawled concurrently under the semaphores; otherwise every
+        page is crawled on its own under them. Pages still in flight when
+        iteration stops are cancelled.
+
+        Args:
+            semaphore: Semaphore bounding concurrent page crawls.
+            host_semaphores: Per-host limits of the crawl.
+            concurrency: Maximum pages per batch call.
+            urls: URLs to crawl.
+            browser_config: Browser configuration.
+            scraping_config: Scraping configuration.
+
+        Yields:
+            Tuple of (index of the URL in ``urls``, its CrawlResultItem), in
+            completion order.
+        """
+        async def crawl_chunk(
+            start: int, chunk: List[str]
+        ) -> List[Tuple[int, CrawlResultItem]]:
+            results = await self._crawl_batch_bounded(
+                lock, semaphore, host_semaphores, chunk, browser_config, scraping_config
+            )
+            return list(enumerate(results, start))
+
+        async def crawl_page(i: int, url: str) -> List[Tuple[int, CrawlResultItem]]:
+            result = await self._crawl_page_bounded(
+                semaphore, host_semaphores, url, browser_config, scraping_config
+            )
+            return [(i, result)]
+
+        if await self._supports_batch():
+            lock = asyncio.Lock()
+            chunks = host_semaphores.chunks(urls, concurrency)
+            starts = itertools.accumulate((len(chunk) for chunk in chunks), initial=0)
+            tasks = [
+                asyncio.ensure_future(crawl_chunk(start, chunk))
+                for start, chunk in zip(starts, chunks)
+            ]
+        else:
+            tasks = [
+                asyncio.ensure_future(crawl_page(i, url)) for i, url in enumerate(urls)
+            ]
+
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                for item in await next_done:
+                    yield item
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    def _discover_links(
+        self,
+        result: CrawlResultItem,
+        page_url: str,
+        start_netloc: str,
+        include_external: bool,
+        include_re: Optional[Pattern[str]],
+        exclude_res: Sequence[Pattern[str]],
+        visited: Set[str],
+        stats: DeepCrawlStats,
+    ) -> List[str]:
+        """Collect the crawlable, not yet visited links of a crawled page.
+
+        Args:
+            result: Crawl result of the page.
+            page_url: Normalized URL of the page.
+            start_netloc: Network location of the crawl's start URL.
+            include_external: Include external links.
+            include_re: Compiled URL pattern filter.
+            exclude_res: Compiled URL exclusion patterns.
+            visited: URLs already visited.
+            stats: Crawl statistics, updated with skipped links.
+
+        Returns:
+            Normalized link URLs in page order.
+        """
+        internal_links = result.links.get("internal", ())
+        external_links = result.links.get("external", ()) if include_external else ()
+
+        # Hot loop over every candidate edge: bind lookups to locals and
+        # judge each distinct link of the page only once
+        normalize = _normalize_url
+        should_crawl = self._should_crawl_url
+        seen: Set[str] = set()
+
+        links = []
+        for link in itertools.chain(internal_links, external_links):
+            link_url = link.get("href")
+            if not link_url or link_url.startswith(_UNCRAWLABLE_PREFIXES):
+                continue
+
+            # Reject absolute off-domain links before paying for normalization
+            absolute = link_url.startswith(("http://", "https://"))
+            if (
+                not include_external
+                and absolute
+                and _netloc(link_url) != start_netloc
+            ):
+                if link_url not in seen:
+                    seen.add(link_url)
+                    stats.skipped_urls += 1
+                continue
+
+            # Absolute links do not depend on the page they appear on; leave
+            # the base out so they share one cache entry across pages
+            link_url = normalize(link_url, "" if absolute else page_url)
+
+            if link_url in visited or link_url in seen:
+                continue
+            seen.add(link_url)
+
+            if should_crawl(
+                link_url,
+                start_netloc,
+                include_external,
+                include_re,
+                exclude_res,
+            ):
+                links.append(link_url)
+            else:
+                stats.skipped_urls += 1
+
+        return links
+
     async def crawl_bfs(
         self,
         start_url: str,
@@ -220,6 +796,8 @@ class DeepCrawlCoordinator:
         exclude_patterns: Optional[List[str]],
         browser_config: Optional[Dict],
         scraping_config: Optional[Dict],
+        concurrency: int = 16,
+        per_host_concurrency: int = 4,
     ) -> Tuple[List[CrawlResultItem], DeepCrawlStats]:
         """Perform breadth-first search crawl.
 
@@ -232,80 +810,149 @@ class DeepCrawlCoordinator:
             exclude_patterns: URL exclusion patterns.
             browser_config: Browser configuration.
             scraping_config: Scraping configuration.
+            concurrency: Maximum number of pages crawled at once.
+            per_host_concurrency: Maximum number of pages crawled at once
+                per host.
 
         Returns:
             Tuple of (results list, stats).
         """
-        start_time = time.time()
-        visited: Set[str] = set()
-        queue: deque = deque([(start_url, None, 0)])  # (url, parent, depth)
-        results: List[CrawlResultItem] = []
         stats = DeepCrawlStats()
-
-        while queue and len(results) < max_pages:
-            url, parent_url, depth = queue.popleft()
-
-            # Normalize URL
-            normalized_url = self._normalize_url(url, start_url)
-
-            # Skip if already visited
-            if normalized_url in visited:
-                continue
-
-            visited.add(normalized_url)
-            stats.total_urls += 1
-
-            # Skip if depth exceeded
-            if depth > max_depth:
-                stats.skipped_urls += 1
-                continue
-
-            # Crawl the page
-            result = await self._crawl_page(
-                normalized_url,
+        results = [
+            result
+            async for result in self.crawl_bfs_iter(
+                start_url,
+                max_depth,
+                max_pages,
+                include_external,
+                url_pattern,
+                exclude_patterns,
                 browser_config,
                 scraping_config,
+                concurrency,
+                per_host_concurrency,
+                stats,
             )
-            result.depth = depth
-            result.parent_url = parent_url
-            results.append(result)
-
-            if result.success:
-                stats.crawled_urls += 1
-                stats.max_depth_reached = max(stats.max_depth_reached, depth)
-
-                # Extract links if within depth limit
-                if depth < max_depth and result.links:
-                    internal_links = result.links.get("internal", [])
-                    external_links = (
-                        result.links.get("external", []) if include_external else []
-                    )
+        ]
+        return results, stats
 
-                    for link in internal_links + external_links:
-                        link_url = link.get("href")
-                        if not link_url:
-                            continue
+    async def crawl_bfs_iter(
+        self,
+        start_url: str,
+        max_depth: int,
+        max_pages: int,
+        include_external: bool,
+        url_pattern: Optional[str],
+        exclude_patterns: Optional[List[str]],
+        browser_config: Optional[Dict],
+        scraping_config: Optional[Dict],
+        concurrency: int = 16,
+        per_host_concurrency: int = 4,
+        stats: Optional[DeepCrawlStats] = None,
+    ) -> AsyncIterator[CrawlResultItem]:
+        """Perform breadth-first search crawl, yielding results as they land.
 
-                        link_url = self._normalize_url(link_url, normalized_url)
+        The frontier is drained in waves: every queued URL that still fits in
+        the page budget is crawled concurrently, and each result is yielded
+        as soon as its page lands. Links found by the wave are queued for the
+        next one once the whole wave is done.
 
-                        if link_url in visited:
-                            continue
+        Args:
+            start_url: Starting URL.
+            max_depth: Maximum crawl depth.
+            max_pages: Maximum pages to crawl.
+            include_external: Include external links.
+            url_pattern: URL pattern filter.
+            exclude_patterns: URL exclusion patterns.
+            browser_config: Browser configuration.
+            scraping_config: Scraping configuration.
+            concurrency: Maximum number of pages crawled at once.
+            per_host_concurrency: Maximum number of pages crawled at once
+                per host.
+            stats: Statistics to update; complete once iteration ends.
 
-                        if self._should_crawl_url(
-                            link_url,
-                            start_url,
-                            include_external,
-                            url_pattern,
-                            exclude_patterns,
-                        ):
-                            queue.append((link_url, normalized_url, depth + 1))
-                        else:
-                            stats.skipped_urls += 1
-            else:
-                stats.failed_urls += 1
+        Yields:
+            CrawlResultItem for each crawled page.
+        """
+        start_time = time.time()
+        visited: Set[str] = set()
+        queue: deque = deque([(start_url, None, 0)])  # (url, parent, depth)
+        crawled = 0
+        stats = stats if stats is not None else DeepCrawlStats()
+        semaphore = asyncio.Semaphore(concurrency)
+        host_semaphores = _HostSemaphores(per_host_concurrency)
+        include_re, exclude_res = _compile_filters(
+            url_pattern, tuple(exclude_patterns or ())
+        )
+        start_netloc = urlparse(start_url).netloc
 
-        stats.duration_seconds = time.time() - start_time
-        return results, stats
+        try:
+            while queue and crawled < max_pages:
+                # Collect the next wave of unvisited URLs within the page budget
+                batch = []
+                while queue and crawled + len(batch) < max_pages:
+                    url, parent_url, depth = queue.popleft()
+
+                    # Normalize URL
+                    normalized_url = self._normalize_url(url, start_url)
+
+                    # Skip if already visited
+                    if normalized_url in visited:
+                        continue
+
+                    visited.add(normalized_url)
+                    stats.total_urls += 1
+
+                    # Skip if depth exceeded
+                    if depth > max_depth:
+                        stats.skipped_urls += 1
+                        continue
+
+                    batch.append((normalized_url, parent_url, depth))
+
+                # Crawl the wave concurrently, yielding pages as they land;
+                # links are queued in page order once the wave is done
+                crawled += len(batch)
+                discovered: List[List[str]] = [[] for _ in batch]
+                async for i, result in self._crawl_wave(
+                    semaphore,
+                    host_semaphores,
+                    concurrency,
+                    [url for url, _, _ in batch],
+                    browser_config,
+                    scraping_config,
+                ):
+                    normalized_url, parent_url, depth = batch[i]
+                    result.depth = depth
+                    result.parent_url = parent_url
+
+                    if result.success:
+                        stats.crawled_urls += 1
+                        stats.max_depth_reached = max(stats.max_depth_reached, depth)
+
+                        # Extract links if within depth limit
+                        if depth < max_depth and result.links:
+                            discovered[i] = self._discover_links(
+                                result,
+                                normalized_url,
+                                start_netloc,
+                                include_external,
+                                include_re,
+                                exclude_res,
+                                visited,
+                                stats,
+                            )
+                    else:
+                        stats.failed_urls += 1
+
+                    yield result
+
+                for (normalized_url, _, depth), links in zip(batch, discovered):
+                    queue.extend(
+                        (link_url, normalized_url, depth + 1) for link_url in links
+                    )
+        finally:
+            stats.duration_seconds = time.time() - start_time
 
     async def crawl_dfs(
         self,
@@ -317,77 +964,134 @@ class DeepCrawlCoordinator:
         exclude_patterns: Optional[List[str]],
         browser_config: Optional[Dict],
         scraping_config: Optional[Dict],
+        concurrency: int = 16,
+        per_host_concurrency: int = 4,
     ) -> Tuple[List[CrawlResultItem], DeepCrawlStats]:
         """Perform depth-first search crawl.
 
         Similar to BFS but uses a stack (LIFO) instead of queue.
         """
-        start_time = time.time()
-        visited: Set[str] = set()
-        stack: List = [(start_url, None, 0)]  # (url, parent, depth)
-        results: List[CrawlResultItem] = []
         stats = DeepCrawlStats()
-
-        while stack and len(results) < max_pages:
-            url, parent_url, depth = stack.pop()  # LIFO
-
-            normalized_url = self._normalize_url(url, start_url)
-
-            if normalized_url in visited:
-                continue
-
-            visited.add(normalized_url)
-            stats.total_urls += 1
-
-            if depth > max_depth:
-                stats.skipped_urls += 1
-                continue
-
-            result = await self._crawl_page(
-                normalized_url,
+        results = [
+            result
+            async for result in self.crawl_dfs_iter(
+                start_url,
+                max_depth,
+                max_pages,
+                include_external,
+                url_pattern,
+                exclude_patterns,
                 browser_config,
                 scraping_config,
+                concurrency,
+                per_host_concurrency,
+                stats,
             )
-            result.depth = depth
-            result.parent_url = parent_url
-            results.append(result)
-
-            if result.success:
-                stats.crawled_urls += 1
-                stats.max_depth_reached = max(stats.max_depth_reached, depth)
-
-                if depth < max_depth and result.links:
-                    internal_links = result.links.get("internal", [])
-                    external_links = (
-                        result.links.get("external", []) if include_external else []
-                    )
-
-                    # Add in reverse order so first discovered is processed next
-                    for link in reversed(internal_links + external_links):
-                        link_url = link.get("href")
-                        if not link_url:
-                            continue
-
-                        link_url = self._normalize_url(link_url, normalized_url)
-
-                        if link_url in visited:
-                            continue
+        ]
+        return results, stats
 
-                        if self._should_crawl_url(
-                            link_url,
-                            start_url,
-                            include_external,
-                            url_pattern,
-                            exclude_patterns,
-                        ):
-                            stack.append((link_url, normalized_url, depth + 1))
-                        else:
-                            stats.skipped_urls += 1
-            else:
-                stats.failed_urls += 1
+    async def crawl_dfs_iter(
+        self,
+        start_url: str,
+        max_depth: int,
+        max_pages: int,
+        include_external: bool,
+        url_pattern: Optional[str],
+        exclude_patterns: Optional[List[str]],
+        browser_config: Optional[Dict],
+        scraping_config: Optional[Dict],
+        concurrency: int = 16,
+        per_host_concurrency: int = 4,
+        stats: Optional[DeepCrawlStats] = None,
+    ) -> AsyncIterator[CrawlResultItem]:
+        """Perform depth-first search crawl, yielding results as they land.
+
+        Up to `concurrency` URLs are taken from the top of the stack and
+        crawled at once; their links are pushed back so the first URL taken is
+        still explored first.
+        """
+        start_time = time.time()
+        visited: Set[str] = set()
+        stack: List = [(start_url, None, 0)]  # (url, parent, depth)
+        crawled = 0
+        stats = stats if stats is not None else DeepCrawlStats()
+        semaphore = asyncio.Semaphore(concurrency)
+        host_semaphores = _HostSemaphores(per_host_concurrency)
+        include_re, exclude_res = _compile_filters(
+            url_pattern, tuple(exclude_patterns or ())
+        )
+        start_netloc = urlparse(start_url).netloc
 
-        stats.duration_seconds = time.time() - start_time
-        return results, stats
+        try:
+            while stack and crawled < max_pages:
+                # Take a chunk from the top of the stack
+                batch = []
+                while (
+                    stack
+                    and len(batch) < concurrency
+                    and crawled + len(batch) < max_pages
+                ):
+                    url, parent_url, depth = stack.pop()  # LIFO
+
+                    normalized_url = self._normalize_url(url, start_url)
+
+                    if normalized_url in visited:
+                        continue
+
+                    visited.add(normalized_url)
+                    stats.total_urls += 1
+
+                    if depth > max_depth:
+                        stats.skipped_urls += 1
+                        continue
+
+                    batch.append((normalized_url, parent_url, depth))
+
+                crawled += len(batch)
+                discovered: List[List[str]] = [[] for _ in batch]
+                async for i, result in self._crawl_wave(
+                    semaphore,
+                    host_semaphores,
+                    concurrency,
+                    [url for url, _, _ in batch],
+                    browser_config,
+                    scraping_config,
+                ):
+                    normalized_url, parent_url, depth = batch[i]
+                    result.depth = depth
+                    result.parent_url = parent_url
+
+                    if result.success:
+                        stats.crawled_urls += 1
+                        stats.max_depth_reached = max(stats.max_depth_reached, depth)
+
+                        if depth < max_depth and result.links:
+                            discovered[i] = self._discover_links(
+                                result,
+                                normalized_url,
+                                start_netloc,
+                                include_external,
+                                include_re,
+                                exclude_res,
+                                visited,
+                                stats,
+                            )
+                    else:
+                        stats.failed_urls += 1
+
+                    yield result
+
+                # Push the last page's links first and each page's links in
+                # reverse, so the first discovered link of the first page is next
+                for (normalized_url, _, depth), links in zip(
+                    reversed(batch), reversed(discovered)
+                ):
+                    stack.extend(
+                        (link_url, normalized_url, depth + 1)
+                        for link_url in reversed(links)
+                    )
+        finally:
+            stats.duration_seconds = time.time() - start_time
 
     async def crawl_best_first(
         self,
@@ -400,22 +1104,143 @@ class DeepCrawlCoordinator:
         score_threshold: float,
         browser_config: Optional[Dict],
         scraping_config: Optional[Dict],
+        concurrency: int = 16,
+        per_host_concurrency: int = 4,
     ) -> Tuple[List[CrawlResultItem], DeepCrawlStats]:
         """Perform best-first search crawl with URL scoring.
 
-        For simplicity, uses a basic scoring heuristic based on URL depth.
-        In production, this could use ML-based scoring.
+        Uses a heuristic URL score (see `_score_url`). In production, this
+        could use ML-based scoring.
+        """
+        stats = DeepCrawlStats()
+        results = [
+            result
+            async for result in self.crawl_best_first_iter(
+                start_url,
+                max_depth,
+                max_pages,
+                include_external,
+                url_pattern,
+                exclude_patterns,
+                score_threshold,
+                browser_config,
+                scraping_config,
+                concurrency,
+                per_host_concurrency,
+                stats,
+            )
+        ]
+        return results, stats
+
+    async def crawl_best_first_iter(
+        self,
+        start_url: str,
+        max_depth: int,
+        max_pages: int,
+        include_external: bool,
+        url_pattern: Optional[str],
+        exclude_patterns: Optional[List[str]],
+        score_threshold: float,
+        browser_config: Optional[Dict],
+        scraping_config: Optional[Dict],
+        concurrency: int = 16,
+        per_host_concurrency: int = 4,
+        stats: Optional[DeepCrawlStats] = None,
+    ) -> AsyncIterator[CrawlResultItem]:
+        """Perform best-first search crawl, yielding results as they land.
+
+        Discovered URLs are scored when found; those below `score_threshold`
+        are skipped and the rest wait in a max-heap. Each wave crawls the
+        `concurrency` highest-scoring URLs at once.
         """
-        # For now, fall back to BFS since we don't have a scorer
-        # In production, this would use priority queue with URL scores
-        logger.info("Best-first crawl not fully implemented, using BFS")
-        return await self.crawl_bfs(
-            start_url,
-            max_depth,
-            max_pages,
-            include_external,
-            url_pattern,
-            exclude_patterns,
-            browser_config,
-            scraping_config,
+        start_time = time.time()
+        visited: Set[str] = set()
+        counter = itertools.count()  # FIFO tie-break between equal scores
+        heap: List = [(-1.0, next(counter), start_url, None, 0)]
+        crawled = 0
+        stats = stats if stats is not None else DeepCrawlStats()
+        semaphore = asyncio.Semaphore(concurrency)
+        host_semaphores = _HostSemaphores(per_host_concurrency)
+        include_re, exclude_res = _compile_filters(
+            url_pattern, tuple(exclude_patterns or ())
         )
+        start_netloc = urlparse(start_url).netloc
+
+        try:
+            while heap and crawled < max_pages:
+                # Take the highest-scoring URLs
+                batch = []
+                while (
+                    heap
+                    and len(batch) < concurrency
+                    and crawled + len(batch) < max_pages
+                ):
+                    _, _, url, parent_url, depth = heapq.heappop(heap)
+
+                    normalized_url = self._normalize_url(url, start_url)
+
+                    if normalized_url in visited:
+                        continue
+
+                    visited.add(normalized_url)
+                    stats.total_urls += 1
+
+                    if depth > max_depth:
+                        stats.skipped_urls += 1
+                        continue
+
+                    batch.append((normalized_url, parent_url, depth))
+
+                crawled += len(batch)
+                discovered: List[List[str]] = [[] for _ in batch]
+                async for i, result in self._crawl_wave(
+                    semaphore,
+                    host_semaphores,
+                    concurrency,
+                    [url for url, _, _ in batch],
+                    browser_config,
+                    scraping_config,
+                ):
+                    normalized_url, parent_url, depth = batch[i]
+                    result.depth = depth
+                    result.parent_url = parent_url
+
+                    if result.success:
+                        stats.crawled_urls += 1
+                        stats.max_depth_reached = max(stats.max_depth_reached, depth)
+
+                        if depth < max_depth and result.links:
+                            discovered[i] = self._discover_links(
+                                result,
+                                normalized_url,
+                                start_netloc,
+                                include_external,
+                                include_re,
+                                exclude_res,
+                                visited,
+                                stats,
+                            )
+                    else:
+                        stats.failed_urls += 1
+
+                    yield result
+
+                # Score links in page order so equal scores keep FIFO order
+                for (normalized_url, _, depth), links in zip(batch, discovered):
+                    for link_url in links:
+                        score = _score_url(link_url, depth + 1)
+                        if score < score_threshold:
+                            stats.skipped_urls += 1
+                            continue
+                        heapq.heappush(
+                            heap,
+                            (
+                                -score,
+                                next(counter),
+                                link_url,
+                                normalized_url,
+                                depth + 1,
+                            ),
+                        )
+        finally:
+            stats.duration_seconds = time.time() - start_time
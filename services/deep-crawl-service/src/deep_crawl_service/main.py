@@ -1,19 +1,28 @@
 """FastAPI application for deep crawling service."""
 
+import asyncio
 import logging
+import os
 from contextlib import asynccontextmanager
-from typing import AsyncGenerator
+from typing import AsyncGenerator, Dict, FrozenSet, Optional, Tuple
 
+import orjson
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse, StreamingResponse
 
 from shared.schemas.deep_crawl_schemas import (
     DeepCrawlRequest,
     DeepCrawlResponse,
     CrawlStrategy,
+    DeepCrawlStats,
     HealthResponse,
 )
-from .crawler import DeepCrawlCoordinator
+from .crawler import (
+    DEFAULT_BROWSER_SERVICE_URL,
+    DEFAULT_SCRAPING_SERVICE_URL,
+    DeepCrawlCoordinator,
+)
 
 # Configure logging
 logging.basicConfig(
@@ -23,26 +32,90 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
-# Global coordinator instance
-coordinator: DeepCrawlCoordinator = None
+def _allowed_urls(env_var: str, default: str) -> FrozenSet[str]:
+    """Read a comma-separated service URL allowlist from the environment."""
+    urls = os.getenv(env_var, "").split(",")
+    return frozenset(url.strip() for url in urls if url.strip()) | {default}
+
+
+# Service URLs a request may select; anything else is rejected so callers
+# cannot point the crawler at arbitrary hosts
+_ALLOWED_BROWSER_SERVICE_URLS = _allowed_urls(
+    "DEEP_CRAWL_BROWSER_SERVICE_URLS", DEFAULT_BROWSER_SERVICE_URL
+)
+_ALLOWED_SCRAPING_SERVICE_URLS = _allowed_urls(
+    "DEEP_CRAWL_SCRAPING_SERVICE_URLS", DEFAULT_SCRAPING_SERVICE_URL
+)
+
+# Coordinators by (browser_service_url, scraping_service_url), each owning
+# one pooled HTTP client; bounded by the allowlists above
+_coordinators: Dict[Tuple[str, str], DeepCrawlCoordinator] = {}
+
+
+def create_coordinator(
+    browser_service_url: str, scraping_service_url: str
+) -> DeepCrawlCoordinator:
+    """Create a coordinator for one pair of upstream services."""
+    return DeepCrawlCoordinator(browser_service_url, scraping_service_url)
+
+
+def get_coordinator(
+    browser_service_url: Optional[str] = None,
+    scraping_service_url: Optional[str] = None,
+) -> DeepCrawlCoordinator:
+    """Get the pooled coordinator for a pair of upstream services.
+
+    Args:
+        browser_service_url: Browser service URL, or None for the default.
+        scraping_service_url: Scraping service URL, or None for the default.
+
+    Returns:
+        Coordinator for the services, created on first use.
+
+    Raises:
+        ValueError: If a URL is not in the configured allowlist.
+    """
+    key = (
+        browser_service_url or DEFAULT_BROWSER_SERVICE_URL,
+        scraping_service_url or DEFAULT_SCRAPING_SERVICE_URL,
+    )
+    if key[0] not in _ALLOWED_BROWSER_SERVICE_URLS:
+        raise ValueError(f"Browser service URL not allowed: {key[0]}")
+    if key[1] not in _ALLOWED_SCRAPING_SERVICE_URLS:
+        raise ValueError(f"Scraping service URL not allowed: {key[1]}")
+    coordinator = _coordinators.get(key)
+    if coordinator is None:
+        coordinator = _coordinators[key] = create_coordinator(*key)
+    return coordinator
+
+
+def _request_coordinator(request: DeepCrawlRequest) -> DeepCrawlCoordinator:
+    """Get the coordinator for a request, rejecting disallowed service URLs."""
+    try:
+        return get_coordinator(
+            request.browser_service_url, request.scraping_service_url
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     """Application lifespan manager."""
-    global coordinator
-
     logger.info("Starting deep crawl service...")
 
-    # Initialize coordinator
-    coordinator = DeepCrawlCoordinator()
+    # Initialize the default coordinator
+    await get_coordinator().warmup()
 
     logger.info("Deep crawl service started successfully")
 
     yield
 
     logger.info("Shutting down deep crawl service...")
-    await coordinator.close()
+    await asyncio.gather(
+        *(coordinator.close() for coordinator in _coordinators.values())
+    )
+    _coordinators.clear()
 
 
 # Create FastAPI app
@@ -51,6 +124,7 @@ app = FastAPI(
     description="Microservice for deep crawling with BFS/DFS/Best-First strategies",
     version="0.1.0",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 # Add CORS middleware
@@ -81,6 +155,8 @@ async def deep_crawl(request: DeepCrawlRequest) -> DeepCrawlResponse:
     Raises:
         HTTPException: If crawl fails.
     """
+    coordinator = _request_coordinator(request)
+
     try:
         logger.info(
             f"Starting {request.strategy} crawl from {request.start_url} "
@@ -98,6 +174,8 @@ async def deep_crawl(request: DeepCrawlRequest) -> DeepCrawlResponse:
                 exclude_patterns=request.exclude_patterns,
                 browser_config=request.browser_config,
                 scraping_config=request.scraping_config,
+                concurrency=request.concurrency,
+                per_host_concurrency=request.per_host_concurrency,
             )
         elif request.strategy == CrawlStrategy.DFS:
             results, stats = await coordinator.crawl_dfs(
@@ -109,6 +187,8 @@ async def deep_crawl(request: DeepCrawlRequest) -> DeepCrawlResponse:
                 exclude_patterns=request.exclude_patterns,
                 browser_config=request.browser_config,
                 scraping_config=request.scraping_config,
+                concurrency=request.concurrency,
+                per_host_concurrency=request.per_host_concurrency,
             )
         elif request.strategy == CrawlStrategy.BEST_FIRST:
             results, stats = await coordinator.crawl_best_first(
@@ -121,6 +201,8 @@ async def deep_crawl(request: DeepCrawlRequest) -> DeepCrawlResponse:
                 score_threshold=request.score_threshold or 0.0,
                 browser_config=request.browser_config,
                 scraping_config=request.scraping_config,
+                concurrency=request.concurrency,
+                per_host_concurrency=request.per_host_concurrency,
             )
         else:
             raise HTTPException(
@@ -143,6 +225,63 @@ async def deep_crawl(request: DeepCrawlRequest) -> DeepCrawlResponse:
         raise HTTPException(status_code=500, detail=f"Deep crawl failed: {str(e)}")
 
 
+@app.post("/crawl/stream")
+async def deep_crawl_stream(request: DeepCrawlRequest) -> StreamingResponse:
+    """Perform deep crawling, streaming results as NDJSON.
+
+    Each line is one CrawlResultItem, written as soon as its page is crawled;
+    the final line is {"stats": {...}} with the crawl statistics, or
+    {"error": "..."} if the crawl fails part-way.
+
+    Args:
+        request: Deep crawl request.
+
+    Returns:
+        StreamingResponse emitting application/x-ndjson.
+    """
+    logger.info(
+        f"Starting streamed {request.strategy} crawl from {request.start_url} "
+        f"(max_depth={request.max_depth}, max_pages={request.max_pages})"
+    )
+
+    coordinator = _request_coordinator(request)
+    stats = DeepCrawlStats()
+    crawl_kwargs = dict(
+        start_url=request.start_url,
+        max_depth=request.max_depth,
+        max_pages=request.max_pages,
+        include_external=request.include_external,
+        url_pattern=request.url_pattern,
+        exclude_patterns=request.exclude_patterns,
+        browser_config=request.browser_config,
+        scraping_config=request.scraping_config,
+        concurrency=request.concurrency,
+        per_host_concurrency=request.per_host_concurrency,
+        stats=stats,
+    )
+    if request.strategy == CrawlStrategy.DFS:
+        results = coordinator.crawl_dfs_iter(**crawl_kwargs)
+    elif request.strategy == CrawlStrategy.BEST_FIRST:
+        results = coordinator.crawl_best_first_iter(
+            score_threshold=request.score_threshold or 0.0, **crawl_kwargs
+        )
+    else:
+        results = coordinator.crawl_bfs_iter(**crawl_kwargs)
+
+    async def ndjson():
+        try:
+            async for item in results:
+                yield orjson.dumps(item.model_dump()) + b"\n"
+        except Exception as e:
+            # Headers are already sent, so report the failure in the body
+            logger.exception("Error during streamed deep crawl")
+            yield orjson.dumps({"error": f"Deep crawl failed: {str(e)}"}) + b"\n"
+            return
+        yield orjson.dumps({"stats": stats.model_dump()}) + b"\n"
+
+    return StreamingResponse(ndjson(), media_type="application/x-ndjson")
+
+
 if __name__ == "__main__":
     import uvicorn
 
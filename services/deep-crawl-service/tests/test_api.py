@@ -1,35 +1,154 @@
 """Tests for deep crawl service API."""
 
+import asyncio
+from unittest.mock import patch
+
+import httpx
+import orjson
 import pytest
-from fastapi.testclient import TestClient
+import pytest_asyncio
+from deep_crawl_service import main
+from deep_crawl_service.crawler import DeepCrawlCoordinator
 from deep_crawl_service.main import app
 
+from shared.schemas.deep_crawl_schemas import DeepCrawlRequest
+
+
+def _services_unavailable(request: httpx.Request) -> httpx.Response:
+    """Answer every browser/scraping service call with 503."""
+    return httpx.Response(503)
+
+
+def _offline_coordinator(
+    browser_service_url: str, scraping_service_url: str
+) -> DeepCrawlCoordinator:
+    """Create a coordinator whose services are all unavailable."""
+    return DeepCrawlCoordinator(
+        browser_service_url,
+        scraping_service_url,
+        http_client=httpx.AsyncClient(
+            transport=httpx.MockTransport(_services_unavailable)
+        ),
+    )
+
+
+def _gated_coordinator(gate: asyncio.Event) -> DeepCrawlCoordinator:
+    """Create a coordinator for a three-page site whose /slow page waits.
+
+    The start page links to /slow and /fast, /fast links to /next, and
+    navigating /slow blocks until ``gate`` is set.
+    """
+    site = {
+        "https://example.com": ["/slow", "/fast"],
+        "https://example.com/fast": ["/next"],
+    }
+
+    async def handle(request: httpx.Request) -> httpx.Response:
+        if request.method == "HEAD":
+            return httpx.Response(404)
+        url = orjson.loads(request.content)["url"]
+        if request.url.path == "/navigate":
+            if url.endswith("/slow"):
+                await gate.wait()
+            return httpx.Response(
+                200, json={"success": True, "url": url, "html": "<html/>"}
+            )
+        links = [{"href": href} for href in site.get(url, ())]
+        return httpx.Response(200, json={"links": {"internal": links}})
+
+    return DeepCrawlCoordinator(
+        "http://browser",
+        "http://scraping",
+        http_client=httpx.AsyncClient(transport=httpx.MockTransport(handle)),
+    )
+
+
+async def _stream_lines(coordinator: DeepCrawlCoordinator, **request_fields):
+    """Call /crawl/stream on a coordinator, returning its body iterator."""
+    request = DeepCrawlRequest(start_url="https://example.com", **request_fields)
+    with patch.object(main, "_request_coordinator", return_value=coordinator):
+        response = await main.deep_crawl_stream(request)
+    return response.body_iterator
+
 
+@pytest_asyncio.fixture(scope="class", loop_scope="class")
+async def client():
+    """Create an async client, running the app lifespan once per class."""
+    with patch.object(main, "create_coordinator", _offline_coordinator):
+        async with app.router.lifespan_context(app):
+            async with httpx.AsyncClient(
+                transport=httpx.ASGITransport(app=app), base_url="http://test"
+            ) as client:
+                yield client
+
+
+@pytest.mark.asyncio(loop_scope="class")
 class TestDeepCrawlAPI:
     """Test deep crawl service API endpoints."""
 
-    @pytest.fixture
-    def client(self):
-        """Create test client."""
-        return TestClient(app)
-
-    def test_health_check(self, client):
+    async def test_health_check(self, client):
         """Test health check endpoint."""
-        response = client.get("/health")
+        response = await client.get("/health")
 
         assert response.status_code == 200
         data = response.json()
         assert data["status"] == "healthy"
         assert data["service"] == "deep-crawl-service"
 
-    def test_deep_crawl_request_validation(self, client):
+    async def test_health_check_concurrent(self, client):
+        """Test that concurrent requests are served without blocking."""
+        responses = await asyncio.gather(*(client.get("/health") for _ in range(20)))
+
+        assert all(response.status_code == 200 for response in responses)
+
+    @patch.object(
+        main,
+        "_ALLOWED_BROWSER_SERVICE_URLS",
+        main._ALLOWED_BROWSER_SERVICE_URLS | {"http://other-browser:8000"},
+    )
+    async def test_coordinator_pool(self, client):
+        """Test that coordinators are pooled per pair of service URLs."""
+        default = main.get_coordinator()
+        assert main.get_coordinator() is default
+
+        other = main.get_coordinator(browser_service_url="http://other-browser:8000")
+        assert other is not default
+        assert other.browser_service_url == "http://other-browser:8000"
+        assert other.scraping_service_url == default.scraping_service_url
+        assert main.get_coordinator("http://other-browser:8000") is other
+
+        response = await client.post(
+            "/crawl",
+            json={
+                "start_url": "https://example.com",
+                "browser_service_url": "http://other-browser:8000",
+            },
+        )
+        assert response.status_code == 200
+
+    async def test_service_url_allowlist(self, client):
+        """Test that service URLs outside the allowlist are rejected."""
+        with pytest.raises(ValueError):
+            main.get_coordinator(browser_service_url="http://169.254.169.254")
+
+        for path in ("/crawl", "/crawl/stream"):
+            response = await client.post(
+                path,
+                json={
+                    "start_url": "https://example.com",
+                    "scraping_service_url": "http://internal-host:8080",
+                },
+            )
+            assert response.status_code == 400
+
+    async def test_deep_crawl_request_validation(self, client):
         """Test request validation."""
         # Missing required field
-        response = client.post("/crawl", json={})
+        response = await client.post("/crawl", json={})
         assert response.status_code == 422
 
         # Invalid strategy
-        response = client.post(
+        response = await client.post(
             "/crawl",
             json={
                 "start_url": "https://example.com",
@@ -39,7 +158,7 @@ class TestDeepCrawlAPI:
         assert response.status_code == 422
 
         # Invalid max_depth (too high)
-        response = client.post(
+        response = await client.post(
             "/crawl",
             json={
                 "start_url": "https://example.com",
@@ -49,7 +168,7 @@ class TestDeepCrawlAPI:
         assert response.status_code == 422
 
         # Invalid max_pages (too low)
-        response = client.post(
+        response = await client.post(
             "/crawl",
             json={
                 "start_url": "https://example.com",
@@ -58,8 +177,8 @@ class TestDeepCrawlAPI:
         )
         assert response.status_code == 422
 
-    def test_deep_crawl_valid_request_structure(self, client):
-        """Test that valid request structure is accepted (will fail without services)."""
+    async def test_deep_crawl_valid_request_structure(self, client):
+        """Test that valid request structure is accepted (services unavailable)."""
         request_data = {
             "start_url": "https://example.com",
             "strategy": "bfs",
@@ -68,14 +187,18 @@ class TestDeepCrawlAPI:
             "include_external": False,
         }
 
-        # This will fail because browser/scraping services aren't running
-        # but we're testing that the request structure is valid
-        response = client.post("/crawl", json=request_data)
+        # Browser/scraping services are unavailable, so the start page fails
+        # but the request structure is valid
+        response = await client.post("/crawl", json=request_data)
 
-        # Expect 500 (service unavailable) not 422 (validation error)
-        assert response.status_code == 500
+        # Expect a completed crawl with one failed page, not 422
+        assert response.status_code == 200
+        data = response.json()
+        assert data["results"][0]["success"] is False
+        assert data["results"][0]["status_code"] == 503
+        assert data["stats"]["failed_urls"] == 1
 
-    def test_deep_crawl_with_filters(self, client):
+    async def test_deep_crawl_with_filters(self, client):
         """Test deep crawl with URL filters."""
         request_data = {
             "start_url": "https://example.com",
@@ -86,11 +209,12 @@ class TestDeepCrawlAPI:
             "exclude_patterns": [r"/admin/", r"/private/"],
         }
 
-        # Will fail without services but validates request structure
-        response = client.post("/crawl", json=request_data)
-        assert response.status_code == 500
+        # Fails to crawl without services but validates request structure
+        response = await client.post("/crawl", json=request_data)
+        assert response.status_code == 200
+        assert response.json()["stats"]["failed_urls"] == 1
 
-    def test_deep_crawl_dfs_strategy(self, client):
+    async def test_deep_crawl_dfs_strategy(self, client):
         """Test DFS strategy request."""
         request_data = {
             "start_url": "https://example.com",
@@ -99,10 +223,11 @@ class TestDeepCrawlAPI:
             "max_pages": 20,
         }
 
-        response = client.post("/crawl", json=request_data)
-        assert response.status_code == 500
+        response = await client.post("/crawl", json=request_data)
+        assert response.status_code == 200
+        assert response.json()["stats"]["failed_urls"] == 1
 
-    def test_deep_crawl_best_first_strategy(self, client):
+    async def test_deep_crawl_best_first_strategy(self, client):
         """Test best-first strategy request."""
         request_data = {
             "start_url": "https://example.com",
@@ -112,5 +237,69 @@ class TestDeepCrawlAPI:
             "score_threshold": 0.5,
         }
 
-        response = client.post("/crawl", json=request_data)
-        assert response.status_code == 500
+        response = await client.post("/crawl", json=request_data)
+        assert response.status_code == 200
+        assert response.json()["stats"]["failed_urls"] == 1
+
+    async def test_deep_crawl_stream_request_validation(self, client):
+        """Test streaming endpoint request validation."""
+        response = await client.post("/crawl/stream", json={})
+        assert response.status_code == 422
+
+        response = await client.post(
+            "/crawl/stream",
+            json={
+                "start_url": "https://example.com",
+                "concurrency": 0,
+            },
+        )
+        assert response.status_code == 422
+
+    async def test_deep_crawl_stream(self, client):
+        """Test that streamed results end with the crawl statistics."""
+        response = await client.post(
+            "/crawl/stream",
+            json={"start_url": "https://example.com", "max_pages": 5},
+        )
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/x-ndjson"
+
+        lines = [orjson.loads(line) for line in response.text.splitlines()]
+        assert lines[0]["url"] == "https://example.com"
+        assert lines[0]["success"] is False
+        assert lines[-1]["stats"]["failed_urls"] == 1
+
+    async def test_deep_crawl_stream_before_wave_finishes(self):
+        """Test that a page is streamed while the rest of its wave is in flight."""
+        gate = asyncio.Event()
+        coordinator = _gated_coordinator(gate)
+        lines = await _stream_lines(coordinator, max_depth=1)
+
+        assert orjson.loads(await anext(lines))["url"] == "https://example.com"
+        fast = orjson.loads(await asyncio.wait_for(anext(lines), timeout=5))
+        assert fast["url"] == "https://example.com/fast"
+        assert not gate.is_set()
+
+        gate.set()
+        rest = [orjson.loads(line) async for line in lines]
+        assert rest[0]["url"] == "https://example.com/slow"
+        assert rest[-1]["stats"]["crawled_urls"] == 3
+        await coordinator.close()
+
+    async def test_deep_crawl_stream_error(self):
+        """Test that a crawl failing part-way ends with an error line."""
+        gate = asyncio.Event()
+        gate.set()
+        coordinator = _gated_coordinator(gate)
+        lines = await _stream_lines(coordinator, max_depth=2)
+
+        with patch.object(
+            coordinator,
+            "_discover_links",
+            side_effect=[["https://example.com/fast"], RuntimeError("boom")],
+        ):
+            body = [orjson.loads(line) async for line in lines]
+
+        assert [line.get("url") for line in body[:-1]] == ["https://example.com"]
+        assert body[-1] == {"error": "Deep crawl failed: boom"}
+        await coordinator.close()
@@ -1,7 +1,105 @@
 """Tests for deep crawl coordinator."""
 
+import asyncio
+import re
+
+import httpx
+import orjson
 import pytest
-from deep_crawl_service.crawler import DeepCrawlCoordinator
+from deep_crawl_service.crawler import (
+    DeepCrawlCoordinator,
+    _HostSemaphores,
+    _compile_filters,
+    _normalize_url,
+    _score_url,
+)
+from shared.schemas.deep_crawl_schemas import CrawlResultItem, DeepCrawlStats
+
+
+class _FakeServices:
+    """Browser and scraping services answering from an in-memory site."""
+
+    def __init__(self, site, batch_status=405, failing=(), gates=None):
+        """Initialize the fake services.
+
+        Args:
+            site: Links (hrefs) on each page, by normalized page URL.
+            batch_status: Status answered to HEAD probes of batch endpoints.
+            failing: URLs whose navigation fails.
+            gates: Events by URL; navigating the URL waits for its event.
+        """
+        self.site = site
+        self.batch_status = batch_status
+        self.failing = set(failing)
+        self.gates = gates or {}
+        self.calls = []  # (method, path) of every request
+
+    def coordinator(self):
+        """Create a coordinator talking to these services."""
+        return DeepCrawlCoordinator(
+            "http://browser",
+            "http://scraping",
+            http_client=httpx.AsyncClient(transport=httpx.MockTransport(self.handle)),
+        )
+
+    def navigated(self):
+        """Return the URLs sent to the browser service, in request order."""
+        return [url for path, url in self.calls if path.startswith("/navigate")]
+
+    def _navigate(self, url):
+        self.calls.append(("/navigate", url))
+        if url in self.failing or url not in self.site:
+            return {"success": False, "url": url, "error": f"Cannot load {url}"}
+        return {"success": True, "url": url, "html": "<html/>", "status_code": 200}
+
+    def _scrape(self, item):
+        links = [{"href": href} for href in self.site[item["url"]]]
+        return {"title": item["url"], "links": {"internal": links}}
+
+    async def handle(self, request: httpx.Request) -> httpx.Response:
+        """Answer one service call."""
+        path = request.url.path
+        if request.method == "HEAD":
+            self.calls.append(("HEAD", path))
+            return httpx.Response(self.batch_status)
+
+        body = orjson.loads(request.content)
+        urls = body["urls"] if path == "/navigate_batch" else [body.get("url")]
+        if path.startswith("/navigate"):
+            self.calls.append(("dispatch", path))
+            for url in urls:
+                gate = self.gates.get(url)
+                if gate is not None:
+                    await gate.wait()
+        if path == "/navigate":
+            return httpx.Response(200, json=self._navigate(body["url"]))
+        if path == "/navigate_batch":
+            self.calls.append(("batch", path))
+            results = [self._navigate(url) for url in body["urls"]]
+            return httpx.Response(200, json=results)
+        if path == "/scrape":
+            return httpx.Response(200, json=self._scrape(body))
+        if path == "/scrape_batch":
+            self.calls.append(("batch", path))
+            results = [self._scrape(item) for item in body["items"]]
+            return httpx.Response(200, json=results)
+        return httpx.Response(404)
+
+
+def _crawl_kwargs(**overrides):
+    """Keyword arguments for a crawl of https://example.com."""
+    kwargs = dict(
+        start_url="https://example.com",
+        max_depth=3,
+        max_pages=100,
+        include_external=False,
+        url_pattern=None,
+        exclude_patterns=None,
+        browser_config=None,
+        scraping_config=None,
+    )
+    kwargs.update(overrides)
+    return kwargs
 
 
 class TestDeepCrawlCoordinator:
@@ -30,93 +128,217 @@ class TestDeepCrawlCoordinator:
         result = coordinator._normalize_url("/about", "https://example.com")
         assert result == "https://example.com/about"
 
-    def test_is_same_domain(self, coordinator):
-        """Test same domain check."""
-        assert coordinator._is_same_domain(
-            "https://example.com/page1", "https://example.com/page2"
+    def test_normalize_url_cache(self, coordinator):
+        """Test that absolute links share cache entries across pages."""
+        result = CrawlResultItem(
+            url="https://example.com/a",
+            depth=0,
+            success=True,
+            links={"internal": [{"href": "https://example.com/nav"}]},
         )
+        _normalize_url.cache_clear()
 
-        assert not coordinator._is_same_domain(
-            "https://example.com/page", "https://other.com/page"
+        for page_url in ("https://example.com/a", "https://example.com/b"):
+            coordinator._discover_links(
+                result,
+                page_url,
+                "example.com",
+                include_external=False,
+                include_re=None,
+                exclude_res=(),
+                visited=set(),
+                stats=DeepCrawlStats(),
+            )
+
+        info = _normalize_url.cache_info()
+        assert (info.hits, info.misses) == (1, 1)
+
+    def test_score_url(self):
+        """Test best-first URL scoring."""
+        assert _score_url("https://example.com", 0) == 1.0
+
+        # Shallower, shorter and query-free URLs score higher
+        assert _score_url("https://example.com/a", 1) > _score_url(
+            "https://example.com/a", 2
+        )
+        assert _score_url("https://example.com/a", 1) > _score_url(
+            "https://example.com/a/b/c", 1
+        )
+        assert _score_url("https://example.com/a", 1) > _score_url(
+            "https://example.com/a?page=2", 1
         )
 
+    def test_is_same_domain(self, coordinator):
+        """Test same domain check."""
+        assert coordinator._is_same_domain("https://example.com/page2", "example.com")
+
+        assert not coordinator._is_same_domain("https://other.com/page", "example.com")
+
         # Subdomains are different
         assert not coordinator._is_same_domain(
-            "https://www.example.com/page", "https://api.example.com/page"
+            "https://api.example.com/page", "www.example.com"
         )
 
-    def test_matches_pattern(self, coordinator):
-        """Test regex pattern matching."""
+        # Netloc ends at a query or fragment as well as a path
+        assert coordinator._is_same_domain("https://example.com?q=1", "example.com")
+        assert coordinator._is_same_domain("http://example.com#top", "example.com")
+        assert coordinator._is_same_domain("https://example.com", "example.com")
+
+    def test_compile_filters(self):
+        """Test regex pattern compilation."""
+        include_re, exclude_res = _compile_filters(r"/blog/", (r"/admin/",))
+
         # Match blog posts
-        assert coordinator._matches_pattern(
-            "https://example.com/blog/post-1", r"/blog/"
-        )
+        assert include_re.search("https://example.com/blog/post-1")
 
         # Don't match
-        assert not coordinator._matches_pattern("https://example.com/about", r"/blog/")
+        assert not include_re.search("https://example.com/about")
 
-        # Invalid pattern should return False
-        assert not coordinator._matches_pattern(
-            "https://example.com/page", r"[invalid(pattern"
+        assert len(exclude_res) == 1
+        assert exclude_res[0].search("https://example.com/admin/page")
+
+        # Invalid include pattern matches nothing, invalid exclude is dropped
+        include_re, exclude_res = _compile_filters(
+            r"[invalid(pattern", (r"[invalid(pattern",)
         )
+        assert not include_re.search("https://example.com/page")
+        assert exclude_res == ()
+
+        # No patterns
+        assert _compile_filters(None) == (None, ())
 
     def test_should_crawl_url(self, coordinator):
         """Test URL crawl decision logic."""
-        start_url = "https://example.com"
+        start_netloc = "example.com"
 
         # Internal URL, no filters
         assert coordinator._should_crawl_url(
             "https://example.com/page",
-            start_url,
+            start_netloc,
             include_external=False,
-            url_pattern=None,
-            exclude_patterns=None,
+            include_re=None,
+            exclude_res=(),
         )
 
         # External URL, external not allowed
         assert not coordinator._should_crawl_url(
             "https://other.com/page",
-            start_url,
+            start_netloc,
             include_external=False,
-            url_pattern=None,
-            exclude_patterns=None,
+            include_re=None,
+            exclude_res=(),
         )
 
         # External URL, external allowed
         assert coordinator._should_crawl_url(
             "https://other.com/page",
-            start_url,
+            start_netloc,
             include_external=True,
-            url_pattern=None,
-            exclude_patterns=None,
+            include_re=None,
+            exclude_res=(),
         )
 
         # Matches include pattern
         assert coordinator._should_crawl_url(
             "https://example.com/blog/post",
-            start_url,
+            start_netloc,
             include_external=False,
-            url_pattern=r"/blog/",
-            exclude_patterns=None,
+            include_re=re.compile(r"/blog/"),
+            exclude_res=(),
         )
 
         # Doesn't match include pattern
         assert not coordinator._should_crawl_url(
             "https://example.com/about",
-            start_url,
+            start_netloc,
             include_external=False,
-            url_pattern=r"/blog/",
-            exclude_patterns=None,
+            include_re=re.compile(r"/blog/"),
+            exclude_res=(),
         )
 
         # Matches exclude pattern
         assert not coordinator._should_crawl_url(
             "https://example.com/admin/page",
-            start_url,
+            start_netloc,
+            include_external=False,
+            include_re=None,
+            exclude_res=(re.compile(r"/admin/"),),
+        )
+
+    def test_discover_links(self, coordinator):
+        """Test link discovery filtering."""
+        result = CrawlResultItem(
+            url="https://example.com",
+            depth=0,
+            success=True,
+            links={
+                "internal": [
+                    {"href": "/page1"},
+                    {"href": "/page1#top"},
+                    {"href": "#section"},
+                    {"href": "mailto:someone@example.com"},
+                    {"href": "javascript:void(0)"},
+                ],
+                "external": [
+                    {"href": "https://other.com/page"},
+                    {"href": "https://other.com/page"},
+                ],
+            },
+        )
+        stats = DeepCrawlStats()
+
+        links = coordinator._discover_links(
+            result,
+            "https://example.com",
+            "example.com",
+            include_external=True,
+            include_re=None,
+            exclude_res=(),
+            visited={"https://example.com"},
+            stats=stats,
+        )
+        assert links == ["https://example.com/page1", "https://other.com/page"]
+
+        # External links rejected before normalization, counted once
+        result.links["internal"].append({"href": "https://other.com/page"})
+        result.links["internal"].append({"href": "https://other.com/page"})
+        links = coordinator._discover_links(
+            result,
+            "https://example.com",
+            "example.com",
             include_external=False,
-            url_pattern=None,
-            exclude_patterns=[r"/admin/"],
+            include_re=None,
+            exclude_res=(),
+            visited={"https://example.com"},
+            stats=stats,
         )
+        assert links == ["https://example.com/page1"]
+        assert stats.skipped_urls == 1
+
+    def test_host_semaphores(self):
+        """Test per-host semaphores and batch chunking."""
+        host_semaphores = _HostSemaphores(2)
+
+        assert host_semaphores.get("https://a.com/x") is host_semaphores.get(
+            "https://a.com/y?q=1"
+        )
+        assert host_semaphores.get("https://a.com/x") is not host_semaphores.get(
+            "https://b.com/x"
+        )
+
+        urls = [
+            "https://a.com/1",
+            "https://a.com/2",
+            "https://b.com/1",
+            "https://a.com/3",
+            "https://b.com/2",
+        ]
+        assert host_semaphores.chunks(urls, 16) == [urls[:3], urls[3:]]
+        assert host_semaphores.chunks(urls, 2) == [
+            urls[:2],
+            urls[2:4],
+            urls[4:],
+        ]
 
 
 class TestCrawlStrategies:
@@ -148,3 +370,316 @@ class TestCrawlStrategies:
         """Test basic best-first crawl logic (mocked)."""
         assert hasattr(coordinator, "crawl_best_first")
         assert callable(coordinator.crawl_best_first)
+
+
+class TestBatchCrawl:
+    """Test crawling through the batch endpoints of the services."""
+
+    SITE = {
+        "https://example.com": ["/a", "/b", "/c"],
+        "https://example.com/a": [],
+        "https://example.com/b": [],
+        "https://example.com/c": [],
+    }
+
+    async def test_crawl_batch(self):
+        """Test that a batch crawls every page with two service calls."""
+        services = _FakeServices(self.SITE)
+        coordinator = services.coordinator()
+        urls = ["https://example.com/a", "https://example.com/b"]
+
+        results = await coordinator._crawl_batch(urls)
+        await coordinator.close()
+
+        assert [result.url for result in results] == urls
+        assert all(result.success for result in results)
+        assert [result.title for result in results] == urls
+        assert services.calls.count(("batch", "/navigate_batch")) == 1
+        assert services.calls.count(("batch", "/scrape_batch")) == 1
+
+    async def test_crawl_batch_partial_failure(self):
+        """Test that failed navigations fail only their own pages."""
+        services = _FakeServices(self.SITE, failing={"https://example.com/b"})
+        coordinator = services.coordinator()
+        urls = [
+            "https://example.com/a",
+            "https://example.com/b",
+            "https://example.com/c",
+        ]
+
+        results = await coordinator._crawl_batch(urls)
+        await coordinator.close()
+
+        assert [result.url for result in results] == urls
+        assert [result.success for result in results] == [True, False, True]
+        assert results[1].error == "Cannot load https://example.com/b"
+        assert results[1].title is None
+
+    async def test_crawl_uses_batches(self):
+        """Test that a crawl sends each wave as a batch when supported."""
+        services = _FakeServices(self.SITE)
+        coordinator = services.coordinator()
+
+        results, stats = await coordinator.crawl_bfs(**_crawl_kwargs())
+        await coordinator.close()
+
+        assert stats.crawled_urls == 4
+        assert [result.url for result in results] == list(self.SITE)
+        # One batch for the start page, one for the wave of its links
+        assert services.calls.count(("batch", "/navigate_batch")) == 2
+        assert services.calls.count(("batch", "/scrape_batch")) == 2
+
+    # Two batch chunks of two URLs each; navigating a.com/1 blocks on a gate
+    CHUNKED_SITE = {
+        "https://a.com/1": [],
+        "https://a.com/2": [],
+        "https://b.com/1": [],
+        "https://b.com/2": [],
+    }
+
+    def _gated_wave(self, concurrency):
+        """Start a batched wave over CHUNKED_SITE with a.com/1 gated."""
+        gate = asyncio.Event()
+        services = _FakeServices(self.CHUNKED_SITE, gates={"https://a.com/1": gate})
+        coordinator = services.coordinator()
+        wave = coordinator._crawl_wave(
+            asyncio.Semaphore(concurrency),
+            _HostSemaphores(2),
+            2,
+            list(self.CHUNKED_SITE),
+        )
+        return gate, services, coordinator, wave
+
+    async def test_crawl_wave_chunks_concurrently(self):
+        """Test that a slow batch chunk does not hold up the next one."""
+        gate, _, coordinator, wave = self._gated_wave(concurrency=4)
+
+        first = await asyncio.wait_for(anext(wave), timeout=5)
+        assert first[0] == 2
+        assert (await anext(wave))[0] == 3
+
+        gate.set()
+        assert sorted([i async for i, _ in wave]) == [0, 1]
+        await coordinator.close()
+
+    async def test_crawl_wave_chunks_bounded(self):
+        """Test that batch chunks together stay within the crawl slots."""
+        gate, services, coordinator, wave = self._gated_wave(concurrency=2)
+
+        pending = asyncio.ensure_future(anext(wave))
+        await asyncio.sleep(0.05)
+        assert not pending.done()
+        assert services.calls.count(("dispatch", "/navigate_batch")) == 1
+
+        gate.set()
+        assert (await pending)[0] == 0
+        assert [i async for i, _ in wave] == [1, 2, 3]
+        await coordinator.close()
+
+    @pytest.mark.parametrize("status", [404, 503])
+    async def test_crawl_falls_back_to_pages(self, status):
+        """Test per-page crawling when the batch probe does not succeed."""
+        services = _FakeServices(self.SITE, batch_status=status)
+        coordinator = services.coordinator()
+
+        results, stats = await coordinator.crawl_bfs(**_crawl_kwargs())
+
+        assert stats.crawled_urls == 4
+        assert ("batch", "/navigate_batch") not in services.calls
+        assert sorted(services.navigated()) == sorted(self.SITE)
+
+        # A missing endpoint is remembered; a failed probe is retried
+        probes = services.calls.count(("HEAD", "/navigate_batch"))
+        assert probes == (1 if status == 404 else 2)
+
+        services.batch_status = 405
+        await coordinator.crawl_bfs(**_crawl_kwargs())
+        await coordinator.close()
+        assert (("batch", "/navigate_batch") in services.calls) == (status == 503)
+
+
+class TestBestFirstCrawl:
+    """Test best-first crawl ordering and limits."""
+
+    # Depth-1 scores: /a and /c 0.73, /deep/nested/page 0.62, /b?q=1 0.58
+    SITE = {
+        "https://example.com": ["/deep/nested/page", "/b?q=1", "/a", "/c"],
+        "https://example.com/a": [],
+        "https://example.com/b?q=1": [],
+        "https://example.com/c": [],
+        "https://example.com/deep/nested/page": [],
+    }
+
+    async def _crawl(self, **overrides):
+        """Crawl SITE best-first, returning the crawled URLs and stats."""
+        services = _FakeServices(self.SITE, batch_status=404)
+        coordinator = services.coordinator()
+        kwargs = _crawl_kwargs(score_threshold=0.0, concurrency=1)
+        kwargs.update(overrides)
+        results, stats = await coordinator.crawl_best_first(**kwargs)
+        await coordinator.close()
+        return [result.url for result in results], stats
+
+    async def test_heap_order(self):
+        """Test that pages are crawled highest score first, ties in order."""
+        urls, stats = await self._crawl()
+
+        assert urls == [
+            "https://example.com",
+            "https://example.com/a",
+            "https://example.com/c",
+            "https://example.com/deep/nested/page",
+            "https://example.com/b?q=1",
+        ]
+        assert stats.crawled_urls == 5
+        assert stats.skipped_urls == 0
+
+    async def test_score_threshold(self):
+        """Test that links scoring below the threshold are skipped."""
+        urls, stats = await self._crawl(score_threshold=0.7)
+
+        assert urls == [
+            "https://example.com",
+            "https://example.com/a",
+            "https://example.com/c",
+        ]
+        assert stats.skipped_urls == 2
+
+    async def test_score_threshold_admits_depth_one(self):
+        """Test that the documented threshold of 0.5 crawls past depth 0."""
+        urls, stats = await self._crawl(score_threshold=0.5)
+
+        assert len(urls) == 5
+        assert stats.skipped_urls == 0
+
+    async def test_max_pages(self):
+        """Test that the crawl stops at max_pages, keeping the best pages."""
+        urls, stats = await self._crawl(max_pages=3, concurrency=2)
+
+        assert urls == [
+            "https://example.com",
+            "https://example.com/a",
+            "https://example.com/c",
+        ]
+        assert stats.crawled_urls == 3
+
+
+class TestWaveOrder:
+    """Test the page order of wave-based BFS and DFS crawls."""
+
+    SITE = {
+        "https://example.com": ["/a", "/b", "/c"],
+        "https://example.com/a": ["/a1"],
+        "https://example.com/b": ["/b1"],
+        "https://example.com/c": [],
+        "https://example.com/a1": [],
+        "https://example.com/b1": [],
+    }
+
+    async def _crawl(self, strategy, **overrides):
+        """Crawl SITE with one strategy, returning the crawled URLs."""
+        services = _FakeServices(self.SITE, batch_status=404)
+        coordinator = services.coordinator()
+        crawl = getattr(coordinator, f"crawl_{strategy}")
+        results, stats = await crawl(**_crawl_kwargs(**overrides))
+        await coordinator.close()
+        assert stats.crawled_urls == len(results)
+        return [result.url.removeprefix("https://example.com") for result in results]
+
+    async def test_bfs_order(self):
+        """Test that BFS crawls level by level, in discovery order."""
+        for concurrency in (1, 2, 16):
+            assert await self._crawl("bfs", concurrency=concurrency) == [
+                "",
+                "/a",
+                "/b",
+                "/c",
+                "/a1",
+                "/b1",
+            ]
+
+    async def test_bfs_max_pages(self):
+        """Test that a BFS wave is cut to the remaining page budget."""
+        assert await self._crawl("bfs", max_pages=3) == ["", "/a", "/b"]
+
+    async def test_dfs_order(self):
+        """Test that DFS explores the first page's links first."""
+        assert await self._crawl("dfs", concurrency=1) == [
+            "",
+            "/a",
+            "/a1",
+            "/b",
+            "/b1",
+            "/c",
+        ]
+
+        # Waves of two: /a and /b together, then both of their links
+        assert await self._crawl("dfs", concurrency=2) == [
+            "",
+            "/a",
+            "/b",
+            "/a1",
+            "/b1",
+            "/c",
+        ]
+
+    async def test_dfs_max_depth(self):
+        """Test that DFS does not follow links past max_depth."""
+        assert await self._crawl("dfs", concurrency=1, max_depth=1) == [
+            "",
+            "/a",
+            "/b",
+            "/c",
+        ]
+
+
+class TestStreaming:
+    """Test that crawl iterators yield pages as they land."""
+
+    SITE = {
+        "https://example.com": ["/slow", "/fast"],
+        "https://example.com/slow": [],
+        "https://example.com/fast": [],
+    }
+
+    @pytest.mark.parametrize("strategy", ["bfs", "dfs", "best_first"])
+    async def test_yields_before_wave_finishes(self, strategy):
+        """Test that a finished page is yielded while its wave is in flight."""
+        gate = asyncio.Event()
+        services = _FakeServices(
+            self.SITE, batch_status=404, gates={"https://example.com/slow": gate}
+        )
+        coordinator = services.coordinator()
+        kwargs = _crawl_kwargs()
+        if strategy == "best_first":
+            kwargs["score_threshold"] = 0.0
+        results = getattr(coordinator, f"crawl_{strategy}_iter")(**kwargs)
+
+        assert (await anext(results)).url == "https://example.com"
+        fast = await asyncio.wait_for(anext(results), timeout=5)
+        assert fast.url == "https://example.com/fast"
+        assert not gate.is_set()
+
+        gate.set()
+        assert (await anext(results)).url == "https://example.com/slow"
+        with pytest.raises(StopAsyncIteration):
+            await anext(results)
+        await coordinator.close()
+
+    async def test_closing_cancels_pages_in_flight(self):
+        """Test that closing the iterator cancels the rest of the wave."""
+        gate = asyncio.Event()
+        services = _FakeServices(
+            self.SITE, batch_status=404, gates={"https://example.com/slow": gate}
+        )
+        coordinator = services.coordinator()
+        stats = DeepCrawlStats()
+        results = coordinator.crawl_bfs_iter(**_crawl_kwargs(), stats=stats)
+
+        await anext(results)
+        await anext(results)
+        await results.aclose()
+
+        assert stats.crawled_urls == 2
+        assert not gate.is_set()
+        await coordinator.close()
@@ -1,13 +1,68 @@
 """Extraction implementations for CSS, XPath, and Regex."""
 
 import re
+import threading
+from functools import lru_cache
 from typing import List, Optional, Dict
+import soupsieve
 from bs4 import BeautifulSoup
+from bs4.builder._lxml import LXMLTreeBuilder
 from lxml import html, etree
+from selectolax.lexbor import LexborHTMLParser, SelectolaxError
 
 from shared.schemas.extraction_schemas import ExtractionResult
 
 
+# Elements whose text is not page text; BeautifulSoup's get_text skips them
+_NON_TEXT_TAGS = ["script", "style"]
+_NON_TEXT_SELECTOR = ", ".join(_NON_TEXT_TAGS)
+
+# Per-thread lxml tree builders; a builder is bound to one soup while parsing
+_bs4_builders = threading.local()
+
+
+def _make_soup(html_content: str) -> BeautifulSoup:
+    """Parse HTML with BeautifulSoup, reusing this thread's lxml tree builder.
+
+    Args:
+        html_content: HTML content to parse.
+
+    Returns:
+        Parsed soup.
+    """
+    builder = getattr(_bs4_builders, "lxml", None)
+    if builder is None:
+        builder = _bs4_builders.lxml = LXMLTreeBuilder()
+    return BeautifulSoup(html_content, builder=builder)
+
+
+@lru_cache(maxsize=512)
+def _compile_xpath(xpath: str) -> etree.XPath:
+    """Compile an XPath expression, reusing it across requests.
+
+    Args:
+        xpath: XPath expression.
+
+    Returns:
+        Compiled lxml XPath.
+    """
+    return etree.XPath(xpath)
+
+
+@lru_cache(maxsize=1024)
+def _compile_regex(pattern: str, flags: int) -> re.Pattern:
+    """Compile a regex pattern, reusing it across requests.
+
+    Args:
+        pattern: Regex pattern.
+        flags: Regex flags.
+
+    Returns:
+        Compiled pattern.
+    """
+    return re.compile(pattern, flags)
+
+
 class CSSExtractor:
     """Extract data using CSS selectors."""
 
@@ -21,6 +76,9 @@ class CSSExtractor:
     ) -> List[ExtractionResult]:
         """Extract elements using CSS selector.
 
+        Parses with Lexbor; selectors Lexbor cannot parse (such as soupsieve's
+        :-soup-contains) fall back to BeautifulSoup.
+
         Args:
             html_content: HTML content to parse.
             selector: CSS selector.
@@ -31,9 +89,144 @@ class CSSExtractor:
         Returns:
             List of extraction results.
         """
-        soup = BeautifulSoup(html_content, "lxml")
-        elements = soup.select(selector)
+        return CSSExtractor.extract_many(
+            html_content,
+            [selector],
+            extract_text,
+            extract_html,
+            extract_attributes,
+        )[selector]
+
+    @staticmethod
+    def extract_many(
+        html_content: str,
+        selectors: List[str],
+        extract_text: bool = True,
+        extract_html: bool = False,
+        extract_attributes: Optional[List[str]] = None,
+    ) -> Dict[str, List[ExtractionResult]]:
+        """Extract elements for several CSS selectors, parsing the HTML once.
+
+        Args:
+            html_content: HTML content to parse.
+            selectors: CSS selectors.
+            extract_text: Extract text content.
+            extract_html: Extract raw HTML.
+            extract_attributes: List of attributes to extract.
+
+        Returns:
+            Extraction results by selector.
+
+        Raises:
+            soupsieve.SelectorSyntaxError: If a selector is malformed.
+        """
+        # Lexbor silently accepts some malformed selectors (e.g. "a[href"),
+        # so validate with soupsieve, which caches compiled selectors
+        for selector in selectors:
+            soupsieve.compile(selector)
+
+        tree = LexborHTMLParser(html_content)
+        soup = None
+
+        results = {}
+        for selector in selectors:
+            try:
+                elements = tree.css(selector)
+            except SelectolaxError:
+                # Parsed with BeautifulSoup on first use only
+                if soup is None:
+                    soup = _make_soup(html_content)
+                results[selector] = CSSExtractor._bs4_results(
+                    soup.select(selector),
+                    extract_text,
+                    extract_html,
+                    extract_attributes,
+                )
+                continue
+
+            results[selector] = CSSExtractor._lexbor_results(
+                elements, extract_text, extract_html, extract_attributes
+            )
+
+        return results
+
+    @staticmethod
+    def _lexbor_results(
+        elements: List,
+        extract_text: bool,
+        extract_html: bool,
+        extract_attributes: Optional[List[str]],
+    ) -> List[ExtractionResult]:
+        """Build extraction results from Lexbor nodes.
+
+        Args:
+            elements: Selected Lexbor nodes.
+            extract_text: Extract text content.
+            extract_html: Extract raw HTML.
+            extract_attributes: List of attributes to extract.
 
+        Returns:
+            List of extraction results.
+        """
+        results = []
+        for element in elements:
+            result = ExtractionResult()
+
+            if extract_text:
+                result.text = CSSExtractor._lexbor_text(element)
+
+            if extract_html:
+                result.html = element.html
+
+            if extract_attributes:
+                # Valueless attributes (e.g. disabled) are None in Lexbor
+                attributes = element.attributes
+                result.attributes = {
+                    attr: attributes[attr] or ""
+                    for attr in extract_attributes
+                    if attr in attributes
+                }
+
+            results.append(result)
+
+        return results
+
+    @staticmethod
+    def _lexbor_text(element) -> str:
+        """Get an element's text without script and style contents.
+
+        Args:
+            element: Lexbor node.
+
+        Returns:
+            Stripped text, as BeautifulSoup's get_text(strip=True) gives it.
+        """
+        if element.tag not in _NON_TEXT_TAGS and element.css_first(
+            _NON_TEXT_SELECTOR
+        ):
+            # Strip a copy so the shared tree keeps them for html extraction
+            element = element.clone()
+            element.strip_tags(_NON_TEXT_TAGS)
+        return element.text(strip=True)
+
+    @staticmethod
+    def _bs4_results(
+        elements: List,
+        extract_text: bool,
+        extract_html: bool,
+        extract_attributes: Optional[List[str]],
+    ) -> List[ExtractionResult]:
+        """Build extraction results from BeautifulSoup elements.
+
+        Args:
+            elements: Selected BeautifulSoup elements.
+            extract_text: Extract text content.
+            extract_html: Extract raw HTML.
+            extract_attributes: List of attributes to extract.
+
+        Returns:
+            List of extraction results.
+        """
         results = []
         for element in elements:
             result = ExtractionResult()
@@ -45,10 +238,17 @@ class CSSExtractor:
                 result.html = str(element)
 
             if extract_attributes:
+                # Multi-valued attributes (e.g. class) are lists in bs4;
+                # join them back into the source string, as Lexbor gives it
+                attributes = element.attrs
                 result.attributes = {
-                    attr: element.get(attr)
+                    attr: (
+                        " ".join(attributes[attr])
+                        if isinstance(attributes[attr], list)
+                        else attributes[attr]
+                    )
                     for attr in extract_attributes
-                    if element.get(attr) is not None
+                    if attr in attributes
                 }
 
             results.append(result)
@@ -78,43 +278,103 @@ class XPathExtractor:
 
         Returns:
             List of extraction results.
+
+        Raises:
+            ValueError: If the expression is invalid or cannot be evaluated.
+        """
+        return XPathExtractor.extract_many(
+            html_content,
+            [xpath],
+            extract_text,
+            extract_html,
+            extract_attributes,
+        )[xpath]
+
+    @staticmethod
+    def extract_many(
+        html_content: str,
+        xpaths: List[str],
+        extract_text: bool = True,
+        extract_html: bool = False,
+        extract_attributes: Optional[List[str]] = None,
+    ) -> Dict[str, List[ExtractionResult]]:
+        """Extract elements for several XPath expressions, parsing the HTML once.
+
+        Args:
+            html_content: HTML content to parse.
+            xpaths: XPath expressions.
+            extract_text: Extract text content.
+            extract_html: Extract raw HTML.
+            extract_attributes: List of attributes to extract.
+
+        Returns:
+            Extraction results by expression.
+
+        Raises:
+            ValueError: If an expression is invalid or cannot be evaluated.
         """
         try:
             tree = html.fromstring(html_content)
-            elements = tree.xpath(xpath)
 
-            results = []
-            for element in elements:
-                result = ExtractionResult()
+            return {
+                xpath: XPathExtractor._results(
+                    _compile_xpath(xpath)(tree),
+                    extract_text,
+                    extract_html,
+                    extract_attributes,
+                )
+                for xpath in xpaths
+            }
 
-                # Handle scalar values (text, numbers, booleans)
-                if isinstance(element, (str, int, float, bool)):
-                    result.text = str(element)
-                    results.append(result)
-                    continue
+        except Exception as e:
+            raise ValueError(f"Invalid XPath expression: {str(e)}")
 
-                # Handle element nodes
-                if extract_text:
-                    result.text = element.text_content().strip()
+    @staticmethod
+    def _results(
+        elements: List,
+        extract_text: bool,
+        extract_html: bool,
+        extract_attributes: Optional[List[str]],
+    ) -> List[ExtractionResult]:
+        """Build extraction results from XPath matches.
 
-                if extract_html:
-                    result.html = etree.tostring(
-                        element, encoding="unicode", method="html"
-                    )
+        Args:
+            elements: Nodes or values returned by the expression.
+            extract_text: Extract text content.
+            extract_html: Extract raw HTML.
+            extract_attributes: List of attributes to extract.
 
-                if extract_attributes:
-                    result.attributes = {
-                        attr: element.get(attr)
-                        for attr in extract_attributes
-                        if element.get(attr) is not None
-                    }
+        Returns:
+            List of extraction results.
+        """
+        results = []
+        for element in elements:
+            result = ExtractionResult()
 
+            # Handle scalar values (text, numbers, booleans)
+            if isinstance(element, (str, int, float, bool)):
+                result.text = str(element)
                 results.append(result)
+                continue
 
-            return results
+            # Handle element nodes
+            if extract_text:
+                result.text = element.text_content().strip()
 
-        except Exception as e:
-            raise ValueError(f"Invalid XPath expression: {str(e)}")
+            if extract_html:
+                result.html = etree.tostring(element, encoding="unicode", method="html")
+
+            if extract_attributes:
+                attributes = element.attrib
+                result.attributes = {
+                    attr: attributes[attr]
+                    for attr in extract_attributes
+                    if attr in attributes
+                }
+
+            results.append(result)
+
+        return results
 
 
 class RegexExtractor:
@@ -138,23 +398,20 @@ class RegexExtractor:
         Returns:
             List of extraction results.
         """
+        # Compile first so an invalid pattern fails before any scan
         try:
-            matches = re.finditer(pattern, text, flags=flags)
-
-            results = []
-            for match in matches:
-                result = ExtractionResult()
-
-                if group is not None:
-                    # Extract specific group
-                    result.text = match.group(group)
-                else:
-                    # Extract full match
-                    result.text = match.group(0)
+            compiled = _compile_regex(pattern, flags or 0)
+        except (re.error, TypeError, ValueError) as e:
+            raise ValueError(f"Invalid regex pattern: {str(e)}")
 
-                results.append(result)
+        # Specific group, or the full match
+        group = 0 if group is None else group
 
-            return results
+        try:
+            return [
+                ExtractionResult(text=match.group(group))
+                for match in compiled.finditer(text)
+            ]
 
         except Exception as e:
             raise ValueError(f"Invalid regex pattern: {str(e)}")
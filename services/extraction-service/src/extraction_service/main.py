@@ -1,14 +1,25 @@
 """FastAPI application for extraction service."""
 
+import asyncio
 import logging
-from fastapi import FastAPI, HTTPException
+import os
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import asynccontextmanager
+from functools import partial
+from typing import Any, Callable, TypeVar
+
+from fastapi import FastAPI, HTTPException, Request
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
 
 from shared.schemas.extraction_schemas import (
     CSSExtractionRequest,
+    CSSBatchExtractionRequest,
     XPathExtractionRequest,
+    XPathBatchExtractionRequest,
     RegexExtractionRequest,
     ExtractionResponse,
+    BatchExtractionResponse,
     HealthResponse,
 )
 from .extractor import CSSExtractor, XPathExtractor, RegexExtractor
@@ -20,11 +31,53 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Inputs at least this large are extracted on the process pool; smaller ones
+# run on the thread pool, where pickling them over would cost more than it saves
+_PROCESS_POOL_MIN_BYTES = 256 * 1024
+
+T = TypeVar("T")
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Application lifespan manager."""
+    # Startup: extraction is CPU-bound, so run it off the event loop
+    app.state.executor = ProcessPoolExecutor(max_workers=os.cpu_count())
+
+    yield
+
+    # Shutdown
+    app.state.executor.shutdown(wait=False, cancel_futures=True)
+
+
+async def _run_extraction(
+    app_request: Request, size: int, func: Callable[..., T], **kwargs: Any
+) -> T:
+    """Run an extraction off the event loop.
+
+    Args:
+        app_request: Incoming request, for the app's process pool.
+        size: Length of the input being extracted from.
+        func: Extraction function.
+        **kwargs: Keyword arguments for func.
+
+    Returns:
+        The extraction function's result.
+    """
+    call = partial(func, **kwargs)
+    if size >= _PROCESS_POOL_MIN_BYTES:
+        return await asyncio.get_running_loop().run_in_executor(
+            app_request.app.state.executor, call
+        )
+    return await run_in_threadpool(call)
+
+
 # Create FastAPI app
 app = FastAPI(
     title="Extraction Service",
     description="Microservice for data extraction using CSS/XPath/Regex",
     version="0.1.0",
+    lifespan=lifespan,
 )
 
 # Add CORS middleware
@@ -43,11 +96,14 @@ async def health_check() -> HealthResponse:
 
 
 @app.post("/extract/css", response_model=ExtractionResponse)
-async def extract_css(request: CSSExtractionRequest) -> ExtractionResponse:
+async def extract_css(
+    request: CSSExtractionRequest, app_request: Request
+) -> ExtractionResponse:
     """Extract data using CSS selectors.
 
     Args:
         request: CSS extraction request.
+        app_request: Incoming request, for the app's process pool.
 
     Returns:
         ExtractionResponse with results.
@@ -58,7 +114,10 @@ async def extract_css(request: CSSExtractionRequest) -> ExtractionResponse:
     try:
         logger.info(f"Extracting with CSS selector: {request.selector}")
 
-        results = CSSExtractor.extract(
+        results = await _run_extraction(
+            app_request,
+            len(request.html),
+            CSSExtractor.extract,
             html_content=request.html,
             selector=request.selector,
             extract_text=request.extract_text,
@@ -78,12 +137,55 @@ async def extract_css(request: CSSExtractionRequest) -> ExtractionResponse:
         raise HTTPException(status_code=500, detail=f"CSS extraction failed: {str(e)}")
 
 
+@app.post("/extract/css/batch", response_model=BatchExtractionResponse)
+async def extract_css_batch(
+    request: CSSBatchExtractionRequest, app_request: Request
+) -> BatchExtractionResponse:
+    """Extract data for several CSS selectors, parsing the HTML once.
+
+    Args:
+        request: Batch CSS extraction request.
+        app_request: Incoming request, for the app's process pool.
+
+    Returns:
+        BatchExtractionResponse with results by selector.
+
+    Raises:
+        HTTPException: If extraction fails.
+    """
+    try:
+        logger.info(f"Extracting with {len(request.selectors)} CSS selectors")
+
+        results = await _run_extraction(
+            app_request,
+            len(request.html),
+            CSSExtractor.extract_many,
+            html_content=request.html,
+            selectors=request.selectors,
+            extract_text=request.extract_text,
+            extract_html=request.extract_html,
+            extract_attributes=request.extract_attributes,
+        )
+        count = sum(map(len, results.values()))
+
+        logger.info(f"Extracted {count} elements")
+
+        return BatchExtractionResponse(results=results, count=count)
+
+    except Exception as e:
+        logger.exception("Error in batch CSS extraction")
+        raise HTTPException(status_code=500, detail=f"CSS extraction failed: {str(e)}")
+
+
 @app.post("/extract/xpath", response_model=ExtractionResponse)
-async def extract_xpath(request: XPathExtractionRequest) -> ExtractionResponse:
+async def extract_xpath(
+    request: XPathExtractionRequest, app_request: Request
+) -> ExtractionResponse:
     """Extract data using XPath expressions.
 
     Args:
         request: XPath extraction request.
+        app_request: Incoming request, for the app's process pool.
 
     Returns:
         ExtractionResponse with results.
@@ -94,7 +196,10 @@ async def extract_xpath(request: XPathExtractionRequest) -> ExtractionResponse:
     try:
         logger.info(f"Extracting with XPath: {request.xpath}")
 
-        results = XPathExtractor.extract(
+        results = await _run_extraction(
+            app_request,
+            len(request.html),
+            XPathExtractor.extract,
             html_content=request.html,
             xpath=request.xpath,
             extract_text=request.extract_text,
@@ -119,12 +224,60 @@ async def extract_xpath(request: XPathExtractionRequest) -> ExtractionResponse:
         )
 
 
+@app.post("/extract/xpath/batch", response_model=BatchExtractionResponse)
+async def extract_xpath_batch(
+    request: XPathBatchExtractionRequest, app_request: Request
+) -> BatchExtractionResponse:
+    """Extract data for several XPath expressions, parsing the HTML once.
+
+    Args:
+        request: Batch XPath extraction request.
+        app_request: Incoming request, for the app's process pool.
+
+    Returns:
+        BatchExtractionResponse with results by expression.
+
+    Raises:
+        HTTPException: If extraction fails.
+    """
+    try:
+        logger.info(f"Extracting with {len(request.xpaths)} XPath expressions")
+
+        results = await _run_extraction(
+            app_request,
+            len(request.html),
+            XPathExtractor.extract_many,
+            html_content=request.html,
+            xpaths=request.xpaths,
+            extract_text=request.extract_text,
+            extract_html=request.extract_html,
+            extract_attributes=request.extract_attributes,
+        )
+        count = sum(map(len, results.values()))
+
+        logger.info(f"Extracted {count} elements")
+
+        return BatchExtractionResponse(results=results, count=count)
+
+    except ValueError as e:
+        logger.error(f"Invalid XPath: {str(e)}")
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        logger.exception("Error in batch XPath extraction")
+        raise HTTPException(
+            status_code=500, detail=f"XPath extraction failed: {str(e)}"
+        )
+
+
 @app.post("/extract/regex", response_model=ExtractionResponse)
-async def extract_regex(request: RegexExtractionRequest) -> ExtractionResponse:
+async def extract_regex(
+    request: RegexExtractionRequest, app_request: Request
+) -> ExtractionResponse:
     """Extract data using regular expressions.
 
     Args:
         request: Regex extraction request.
+        app_request: Incoming request, for the app's process pool.
 
     Returns:
         ExtractionResponse with results.
@@ -135,7 +288,10 @@ async def extract_regex(request: RegexExtractionRequest) -> ExtractionResponse:
     try:
         logger.info(f"Extracting with regex pattern: {request.pattern}")
 
-        results = RegexExtractor.extract(
+        results = await _run_extraction(
+            app_request,
+            len(request.text),
+            RegexExtractor.extract,
             text=request.text,
             pattern=request.pattern,
             group=request.group,
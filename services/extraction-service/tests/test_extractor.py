@@ -0,0 +1,107 @@
+"""Tests for extraction implementations."""
+
+import textwrap
+
+import pytest
+from extraction_service.extractor import CSSExtractor, _make_soup
+from selectolax.lexbor import LexborHTMLParser
+from soupsieve import SelectorSyntaxError
+
+
+@pytest.fixture(scope="session")
+def sample_html():
+    """Sample HTML for testing."""
+    return textwrap.dedent(
+        """
+        <html>
+        <body>
+            <ul id="items">
+                <li class="item first" data-id="1">One <b>bold</b></li>
+                <li class="item" data-id="2" hidden>2<script>var x=1;</script></li>
+                <li class="item">  Three <style>p { color: red; }</style></li>
+            </ul>
+            <a href="/page" title="Page">link</a>
+            <script>var y=2;</script>
+        </body>
+        </html>
+        """
+    )
+
+
+class TestCSSExtractor:
+    """Test CSS extraction with Lexbor and the BeautifulSoup fallback."""
+
+    @pytest.mark.parametrize(
+        "selector",
+        ["li.item", "ul > li:nth-child(2)", "a[href]", "#items b", "script"],
+    )
+    def test_lexbor_bs4_parity(self, sample_html, selector):
+        """Test that Lexbor and BeautifulSoup build the same results."""
+        attributes = ["class", "data-id", "hidden", "href", "title"]
+
+        lexbor = CSSExtractor._lexbor_results(
+            LexborHTMLParser(sample_html).css(selector), True, True, attributes
+        )
+        bs4 = CSSExtractor._bs4_results(
+            _make_soup(sample_html).select(selector), True, True, attributes
+        )
+
+        assert lexbor
+        assert lexbor == bs4
+
+    def test_text_skips_script_and_style(self, sample_html):
+        """Test that script and style contents are not element text."""
+        results = CSSExtractor.extract(sample_html, "li", extract_html=True)
+
+        assert [result.text for result in results] == ["Onebold", "2", "Three"]
+        # The raw HTML still has them
+        assert "<script>var x=1;</script>" in results[1].html
+        assert "<style>" in results[2].html
+
+    def test_text_of_script_element(self, sample_html):
+        """Test that a selected script element keeps its own text."""
+        results = CSSExtractor.extract(sample_html, "body > script")
+
+        assert [result.text for result in results] == ["var y=2;"]
+
+    def test_attributes(self, sample_html):
+        """Test attribute extraction, including valueless attributes."""
+        results = CSSExtractor.extract(
+            sample_html,
+            "li[data-id]",
+            extract_text=False,
+            extract_attributes=["class", "hidden", "missing"],
+        )
+
+        assert [result.attributes for result in results] == [
+            {"class": "item first"},
+            {"class": "item", "hidden": ""},
+        ]
+        assert all(result.text is None for result in results)
+
+    def test_bs4_fallback(self, sample_html):
+        """Test that selectors Lexbor cannot parse fall back to BeautifulSoup."""
+        results = CSSExtractor.extract(sample_html, "li:-soup-contains('Three')")
+
+        assert [result.text for result in results] == ["Three"]
+
+    def test_extract_many(self, sample_html):
+        """Test extracting several selectors from one parse."""
+        results = CSSExtractor.extract_many(
+            sample_html, ["a", "li:-soup-contains('bold')", ".missing"]
+        )
+
+        assert [result.text for result in results["a"]] == ["link"]
+        assert [result.text for result in results["li:-soup-contains('bold')"]] == [
+            "Onebold"
+        ]
+        assert results[".missing"] == []
+
+    @pytest.mark.parametrize("selector", ["a[href", "li >", "::", ""])
+    def test_malformed_selector(self, sample_html, selector):
+        """Test that malformed selectors raise instead of matching nothing."""
+        with pytest.raises(SelectorSyntaxError):
+            CSSExtractor.extract(sample_html, selector)
+
+        with pytest.raises(SelectorSyntaxError):
+            CSSExtractor.extract_many(sample_html, ["li", selector])
@@ -1,7 +1,13 @@
 """Markdown generator implementation."""
 
+import asyncio
+import hashlib
 import re
-from typing import Dict, List, Optional, Any, Tuple
+import threading
+from collections import OrderedDict
+from concurrent.futures import Executor
+from functools import partial
+from typing import Dict, Hashable, List, Optional, Any, Tuple
 from urllib.parse import urljoin, urlparse
 from dataclasses import dataclass
 
@@ -14,6 +20,26 @@ except ImportError:
     # In production, this should be a proper dependency
     from html2text import HTML2Text
 
+# Markdown inline links: [text](url). The quantifiers are possessive: each
+# class stops at the delimiter that follows it, so backtracking into it can
+# never produce a match and only costs time on unclosed brackets
+_LINK_RE = re.compile(r"\[([^\]]++)\]\(([^)]++)\)")
+
+# Default HTML2Text options, overridden per call
+_DEFAULT_HTML2TEXT_OPTIONS = {
+    "body_width": 0,  # Disable text wrapping
+    "ignore_emphasis": False,
+    "ignore_links": False,
+    "ignore_images": False,
+    "protect_links": False,
+    "single_line_break": True,
+    "mark_code": True,
+    "escape_snob": False,
+}
+
+# Link targets left as-is when resolving against the base URL
+_UNRESOLVED_PREFIXES = ("http://", "https://", "mailto:", "#")
+
 
 @dataclass
 class MarkdownGenerationResult:
@@ -54,6 +80,22 @@ class CustomHTML2Text(HTML2Text):
         self.escape_dash = False
         self.escape_snob = False
 
+        self._select_handlers()
+
+    def _select_handlers(self):
+        """Bind the per-event handlers for the current preserve_tags.
+
+        Without preserved tags no element can be preserved, so the handlers
+        HTMLParser calls for every tag and text run skip those checks.
+        """
+        if self.preserve_tags:
+            # Fall back to the class methods
+            self.__dict__.pop("handle_tag", None)
+            self.__dict__.pop("handle_data", None)
+        else:
+            self.handle_tag = self._handle_tag_unpreserved
+            self.handle_data = self._handle_data_unpreserved
+
     def update_params(self, **kwargs):
         """Update parameters and set preserved tags."""
         # Handle custom parameters
@@ -69,6 +111,8 @@ class CustomHTML2Text(HTML2Text):
         if handle_code_in_pre is not None:
             self.handle_code_in_pre = handle_code_in_pre
 
+        self._select_handlers()
+
     def handle_tag(self, tag, attrs, start):
         # Handle preserved tags
         if tag in self.preserve_tags:
@@ -105,6 +149,10 @@ class CustomHTML2Text(HTML2Text):
                 self.preserved_content.append(f"</{tag}>")
             return
 
+        self._handle_tag_unpreserved(tag, attrs, start)
+
+    def _handle_tag_unpreserved(self, tag, attrs, start):
+        """Handle a tag outside any preserved element."""
         # Handle link tags
         if tag == "a":
             self.inside_link = start
@@ -142,6 +190,10 @@ class CustomHTML2Text(HTML2Text):
             self.preserved_content.append(data)
             return
 
+        self._handle_data_unpreserved(data, entity_char)
+
+    def _handle_data_unpreserved(self, data, entity_char=False):
+        """Handle data outside any preserved element."""
         if self.inside_pre:
             # Output the raw content for pre blocks, including content inside code tags
             self.o(data)  # Directly output the data as-is (preserve newlines)
@@ -155,16 +207,145 @@ class CustomHTML2Text(HTML2Text):
         super().handle_data(data, entity_char)
 
 
+class _ResultCache:
+    """Thread-safe LRU cache of markdown generation results."""
+
+    def __init__(self, maxsize: int):
+        """Initialize the cache.
+
+        Args:
+            maxsize: Maximum number of results kept; 0 disables caching.
+        """
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._results: "OrderedDict[Hashable, MarkdownGenerationResult]" = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[MarkdownGenerationResult]:
+        """Return the cached result for a key, if any.
+
+        Args:
+            key: Cache key.
+
+        Returns:
+            Cached result, or None on a miss.
+        """
+        with self._lock:
+            result = self._results.get(key)
+            if result is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+                self._results.move_to_end(key)
+            return result
+
+    def put(self, key: Hashable, result: MarkdownGenerationResult):
+        """Store a result, evicting the least recently used one when full.
+
+        Args:
+            key: Cache key.
+            result: Result to store.
+        """
+        if not self.maxsize:
+            return
+        with self._lock:
+            self._results[key] = result
+            self._results.move_to_end(key)
+            if len(self._results) > self.maxsize:
+                self._results.popitem(last=False)
+
+    def info(self) -> Dict[str, int]:
+        """Return cache statistics.
+
+        Returns:
+            Dictionary with hits, misses, size and maxsize.
+        """
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "size": len(self._results),
+                "maxsize": self.maxsize,
+            }
+
+
 class MarkdownGenerator:
     """Generate markdown from HTML content."""
 
-    def __init__(self, options: Optional[Dict[str, Any]] = None):
+    def __init__(
+        self, options: Optional[Dict[str, Any]] = None, cache_size: int = 1024
+    ):
         """Initialize markdown generator.
 
         Args:
             options: HTML2Text options for markdown generation.
+            cache_size: Maximum number of results cached; 0 disables caching.
         """
         self.options = options or {}
+        self._cache = _ResultCache(cache_size)
+
+    def __getstate__(self) -> Dict[str, Any]:
+        """Pickle the options only, so rendering can be sent to worker processes.
+
+        Returns:
+            Picklable state.
+        """
+        return {"options": self.options}
+
+    def __setstate__(self, state: Dict[str, Any]):
+        """Restore a pickled generator without a result cache.
+
+        Args:
+            state: State from __getstate__.
+        """
+        self.options = state["options"]
+        self._cache = _ResultCache(0)
+
+    def cache_info(self) -> Dict[str, int]:
+        """Return result cache statistics.
+
+        Returns:
+            Dictionary with hits, misses, size and maxsize.
+        """
+        return self._cache.info()
+
+    @staticmethod
+    def _cache_key(
+        input_html: str,
+        base_url: str,
+        html2text_options: Dict[str, Any],
+        citations: bool,
+    ) -> Optional[Hashable]:
+        """Build the result cache key for a generation call.
+
+        Args:
+            input_html: The HTML content to process.
+            base_url: Base URL for URL joins.
+            html2text_options: Effective HTML2Text option overrides.
+            citations: Whether to generate citations.
+
+        Returns:
+            Cache key, or None if the call cannot be cached.
+        """
+        if not isinstance(input_html, str):
+            return None
+        key = (
+            hashlib.blake2b(
+                input_html.encode("utf-8", "surrogatepass"), digest_size=16
+            ).digest(),
+            base_url,
+            citations,
+            tuple(sorted(html2text_options.items())),
+        )
+        try:
+            hash(key)
+        except TypeError:
+            # Unhashable option values, such as a preserve_tags list
+            return None
+        return key
 
     def convert_links_to_citations(
         self, markdown: str, base_url: str = ""
@@ -178,42 +359,35 @@ class MarkdownGenerator:
         Returns:
             Tuple of (markdown with citations, references markdown).
         """
-        # Pattern to match markdown links: [text](url)
-        link_pattern = r"\[([^\]]+)\]\(([^)]+)\)"
+        # Every inline link contains "](", so link-free markdown skips the regex
+        if "](" not in markdown:
+            return markdown, ""
 
-        links = {}
-        link_counter = 1
+        # Citation number by URL, in order of first appearance
+        links: Dict[str, int] = {}
 
         def replace_link(match):
-            nonlocal link_counter
-            text = match.group(1)
-            url = match.group(2)
+            text, url = match.groups()
+
+            # Keep internal anchor links
+            if url[0] == "#":
+                return match.group(0)
 
             # Resolve relative URLs
-            if base_url and not url.startswith(("http://", "https://", "mailto:", "#")):
+            if base_url and not url.startswith(_UNRESOLVED_PREFIXES):
                 url = urljoin(base_url, url)
 
-            # Skip internal anchor links
-            if url.startswith("#"):
-                return f"[{text}]({url})"
-
-            # Check if we've seen this URL before
-            if url not in links:
-                links[url] = link_counter
-                link_counter += 1
-
-            citation_num = links[url]
+            citation_num = links.setdefault(url, len(links) + 1)
             return f"{text}[{citation_num}]"
 
         # Replace all links with citations
-        markdown_with_citations = re.sub(link_pattern, replace_link, markdown)
+        markdown_with_citations = _LINK_RE.sub(replace_link, markdown)
 
         # Generate references section
         if links:
-            references = ["## References\n"]
-            for url, num in sorted(links.items(), key=lambda x: x[1]):
-                references.append(f"{num}. {url}")
-            references_markdown = "\n".join(references)
+            references_markdown = "## References\n\n" + "\n".join(
+                f"{num}. {url}" for num, url in enumerate(links, 1)
+            )
         else:
             references_markdown = ""
 
@@ -246,31 +420,101 @@ class MarkdownGenerator:
 
         Returns:
             MarkdownGenerationResult: Result containing raw markdown, fit markdown,
-                                     fit HTML, and references markdown.
+                                     fit HTML, and references markdown. Results
+                                     of identical calls are cached and shared,
+                                     so callers must not modify them.
+        """
+        # Custom options override the defaults
+        html2text_options = html2text_options or options or self.options or {}
+
+        # Fit markdown depends on the filter's state, so it is never cached
+        key = None
+        if content_filter is None:
+            key = self._cache_key(input_html, base_url, html2text_options, citations)
+        if key is not None:
+            result = self._cache.get(key)
+            if result is not None:
+                return result
+
+        result = self._render_markdown(
+            input_html, base_url, html2text_options, content_filter, citations
+        )
+        if key is not None:
+            self._cache.put(key, result)
+        return result
+
+    async def generate_markdown_async(
+        self,
+        executor: Executor,
+        input_html: str,
+        base_url: str = "",
+        html2text_options: Optional[Dict[str, Any]] = None,
+        options: Optional[Dict[str, Any]] = None,
+        citations: bool = True,
+    ) -> MarkdownGenerationResult:
+        """Generate markdown from HTML on an executor.
+
+        The result cache is checked here; only misses are rendered on the
+        executor, which may be a process pool.
+
+        Args:
+            executor: Executor the conversion runs on.
+            input_html: The HTML content to process.
+            base_url: Base URL for URL joins.
+            html2text_options: HTML2Text options.
+            options: Additional options for markdown generation.
+            citations: Whether to generate citations.
+
+        Returns:
+            MarkdownGenerationResult, shared with identical calls.
+        """
+        html2text_options = html2text_options or options or self.options or {}
+
+        key = self._cache_key(input_html, base_url, html2text_options, citations)
+        if key is not None:
+            result = self._cache.get(key)
+            if result is not None:
+                return result
+
+        result = await asyncio.get_running_loop().run_in_executor(
+            executor,
+            partial(
+                self._render_markdown,
+                input_html,
+                base_url,
+                html2text_options,
+                None,
+                citations,
+            ),
+        )
+        if key is not None:
+            self._cache.put(key, result)
+        return result
+
+    def _render_markdown(
+        self,
+        input_html: str,
+        base_url: str,
+        html2text_options: Dict[str, Any],
+        content_filter: Optional[Any],
+        citations: bool,
+    ) -> MarkdownGenerationResult:
+        """Generate markdown from HTML, bypassing the result cache.
+
+        Args:
+            input_html: The HTML content to process.
+            base_url: Base URL for URL joins.
+            html2text_options: HTML2Text option overrides.
+            content_filter: Content filter for generating fit markdown.
+            citations: Whether to generate citations.
+
+        Returns:
+            MarkdownGenerationResult with the generated markdown.
         """
         try:
             # Initialize HTML2Text with default options for better conversion
             h = CustomHTML2Text(baseurl=base_url)
-            default_options = {
-                "body_width": 0,  # Disable text wrapping
-                "ignore_emphasis": False,
-                "ignore_links": False,
-                "ignore_images": False,
-                "protect_links": False,
-                "single_line_break": True,
-                "mark_code": True,
-                "escape_snob": False,
-            }
-
-            # Update with custom options if provided
-            if html2text_options:
-                default_options.update(html2text_options)
-            elif options:
-                default_options.update(options)
-            elif self.options:
-                default_options.update(self.options)
-
-            h.update_params(**default_options)
+            h.update_params(**{**_DEFAULT_HTML2TEXT_OPTIONS, **html2text_options})
 
             # Ensure we have valid input
             if not input_html:
@@ -284,8 +528,6 @@ class MarkdownGenerator:
             except Exception as e:
                 raw_markdown = f"Error converting HTML to markdown: {str(e)}"
 
-            raw_markdown = raw_markdown.replace("    ```", "```")
-
             # Convert links to citations
             markdown_with_citations: str = raw_markdown
             references_markdown: str = ""
@@ -1,11 +1,14 @@
 """FastAPI application for markdown generation service."""
 
 import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
 from contextlib import asynccontextmanager
 from typing import AsyncGenerator
 
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
 from shared.schemas.markdown_schemas import (
     MarkdownGenerationRequest,
@@ -36,11 +39,15 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     # Initialize markdown generator
     markdown_generator = MarkdownGenerator()
 
+    # html2text is pure Python, so convert on worker processes
+    app.state.executor = ProcessPoolExecutor(max_workers=os.cpu_count())
+
     logger.info("Markdown generation service started successfully")
 
     yield
 
     logger.info("Shutting down markdown generation service...")
+    app.state.executor.shutdown(wait=False, cancel_futures=True)
 
 
 # Create FastAPI app
@@ -49,6 +56,7 @@ app = FastAPI(
     description="Microservice for generating markdown from HTML content",
     version="0.1.0",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 # Add CORS middleware
@@ -63,17 +71,22 @@ app.add_middleware(
 @app.get("/health", response_model=HealthResponse)
 async def health_check() -> HealthResponse:
     """Health check endpoint."""
-    return HealthResponse(status="healthy", service="markdown-service")
+    return HealthResponse(
+        status="healthy",
+        service="markdown-service",
+        cache=markdown_generator.cache_info() if markdown_generator else None,
+    )
 
 
 @app.post("/generate", response_model=MarkdownGenerationResponse)
 async def generate_markdown(
-    request: MarkdownGenerationRequest,
+    request: MarkdownGenerationRequest, app_request: Request
 ) -> MarkdownGenerationResponse:
     """Generate markdown from HTML content.
 
     Args:
         request: Markdown generation request.
+        app_request: Incoming request, for the app's process pool.
 
     Returns:
         MarkdownGenerationResponse with generated markdown.
@@ -84,13 +97,13 @@ async def generate_markdown(
     try:
         logger.info(f"Generating markdown for {len(request.html)} bytes of HTML")
 
-        # Generate markdown
-        result = markdown_generator.generate_markdown(
+        # Generate markdown on the process pool so the event loop stays free
+        result = await markdown_generator.generate_markdown_async(
+            app_request.app.state.executor,
             input_html=request.html,
             base_url=request.base_url,
             html2text_options=request.html2text_options,
             citations=request.citations,
-            content_filter=None,  # Content filtering will be handled separately
         )
 
         logger.info("Markdown generation completed successfully")
@@ -1,28 +1,35 @@
 """Tests for markdown service API."""
 
+import httpx
 import pytest
-from fastapi.testclient import TestClient
+import pytest_asyncio
 from markdown_service.main import app
 
 
+@pytest_asyncio.fixture(scope="class", loop_scope="class")
+async def client():
+    """Create an async client, running the app lifespan once per class."""
+    async with app.router.lifespan_context(app):
+        async with httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app), base_url="http://test"
+        ) as client:
+            yield client
+
+
+@pytest.mark.asyncio(loop_scope="class")
 class TestMarkdownAPI:
     """Test markdown service API endpoints."""
 
-    @pytest.fixture
-    def client(self):
-        """Create test client."""
-        return TestClient(app)
-
-    def test_health_check(self, client):
+    async def test_health_check(self, client):
         """Test health check endpoint."""
-        response = client.get("/health")
+        response = await client.get("/health")
 
         assert response.status_code == 200
         data = response.json()
         assert data["status"] == "healthy"
         assert data["service"] == "markdown-service"
 
-    def test_generate_markdown_basic(self, client):
+    async def test_generate_markdown_basic(self, client):
         """Test basic markdown generation."""
         request_data = {
             "html": "<h1>Test</h1><p>Content</p>",
@@ -30,7 +37,7 @@ class TestMarkdownAPI:
             "citations": False,
         }
 
-        response = client.post("/generate", json=request_data)
+        response = await client.post("/generate", json=request_data)
 
         assert response.status_code == 200
         data = response.json()
@@ -41,7 +48,7 @@ class TestMarkdownAPI:
         assert "Test" in data["raw_markdown"]
         assert "Content" in data["raw_markdown"]
 
-    def test_generate_markdown_with_citations(self, client):
+    async def test_generate_markdown_with_citations(self, client):
         """Test markdown generation with citations."""
         request_data = {
             "html": '<p>Visit <a href="https://example.com">example</a></p>',
@@ -49,7 +56,7 @@ class TestMarkdownAPI:
             "citations": True,
         }
 
-        response = client.post("/generate", json=request_data)
+        response = await client.post("/generate", json=request_data)
 
         assert response.status_code == 200
         data = response.json()
@@ -58,7 +65,7 @@ class TestMarkdownAPI:
         assert "## References" in data["references_markdown"]
         assert "https://example.com" in data["references_markdown"]
 
-    def test_generate_markdown_with_base_url(self, client):
+    async def test_generate_markdown_with_base_url(self, client):
         """Test markdown generation with base URL."""
         request_data = {
             "html": '<a href="/page">Link</a>',
@@ -66,7 +73,7 @@ class TestMarkdownAPI:
             "citations": True,
         }
 
-        response = client.post("/generate", json=request_data)
+        response = await client.post("/generate", json=request_data)
 
         assert response.status_code == 200
         data = response.json()
@@ -74,7 +81,7 @@ class TestMarkdownAPI:
         # URL should be resolved
         assert "https://example.com/page" in data["references_markdown"]
 
-    def test_generate_markdown_with_options(self, client):
+    async def test_generate_markdown_with_options(self, client):
         """Test markdown generation with html2text options."""
         request_data = {
             "html": "<em>emphasis</em>",
@@ -85,33 +92,33 @@ class TestMarkdownAPI:
             "citations": False,
         }
 
-        response = client.post("/generate", json=request_data)
+        response = await client.post("/generate", json=request_data)
 
         assert response.status_code == 200
         data = response.json()
         assert "raw_markdown" in data
 
-    def test_generate_markdown_empty_html(self, client):
+    async def test_generate_markdown_empty_html(self, client):
         """Test handling of empty HTML."""
         request_data = {
             "html": "",
             "citations": False,
         }
 
-        response = client.post("/generate", json=request_data)
+        response = await client.post("/generate", json=request_data)
 
         assert response.status_code == 200
         data = response.json()
         assert data["raw_markdown"] == ""
 
-    def test_generate_markdown_invalid_request(self, client):
+    async def test_generate_markdown_invalid_request(self, client):
         """Test handling of invalid request."""
         # Missing required field
         request_data = {
             "base_url": "https://example.com",
         }
 
-        response = client.post("/generate", json=request_data)
+        response = await client.post("/generate", json=request_data)
 
         # Should return validation error
         assert response.status_code == 422
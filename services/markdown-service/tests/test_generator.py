@@ -1,5 +1,7 @@
 """Tests for markdown generator."""
 
+from concurrent.futures import ProcessPoolExecutor
+
 import pytest
 from markdown_service.generator import MarkdownGenerator, MarkdownGenerationResult
 
@@ -111,6 +113,51 @@ class TestMarkdownGenerator:
         assert isinstance(result, MarkdownGenerationResult)
         # Should handle gracefully
 
+    def test_result_cache(self):
+        """Test that identical calls reuse cached results."""
+        generator = MarkdownGenerator(cache_size=2)
+        html = "<p>Cached <b>content</b></p>"
+
+        result1 = generator.generate_markdown(html)
+        result2 = generator.generate_markdown(html)
+        result3 = generator.generate_markdown(
+            html, html2text_options={"ignore_emphasis": True}
+        )
+
+        # Same inputs share a result; different options do not
+        assert result2 is result1
+        assert result3 is not result1
+        assert result3.raw_markdown != result1.raw_markdown
+
+        # Least recently used results are evicted
+        generator.generate_markdown("<p>Other</p>")
+        assert generator.generate_markdown(html) is not result1
+        assert generator.cache_info() == {
+            "hits": 1,
+            "misses": 4,
+            "size": 2,
+            "maxsize": 2,
+        }
+
+    async def test_generate_markdown_async(self):
+        """Test rendering on a process pool with the cache kept locally."""
+        generator = MarkdownGenerator()
+        html = '<p>Visit <a href="/page">page</a></p>'
+
+        with ProcessPoolExecutor(max_workers=1) as executor:
+            result1 = await generator.generate_markdown_async(
+                executor, html, base_url="https://example.com"
+            )
+            result2 = await generator.generate_markdown_async(
+                executor, html, base_url="https://example.com"
+            )
+
+        assert result1 == generator.generate_markdown(
+            html, base_url="https://example.com"
+        )
+        assert result2 is result1
+        assert generator.cache_info()["hits"] == 2
+
 
 class TestConvertLinksToCitations:
     """Test link to citation conversion."""
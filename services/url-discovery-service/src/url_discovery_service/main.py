@@ -2,12 +2,15 @@
 
 import logging
 import re
+from functools import lru_cache
 from urllib.parse import urljoin, urlparse
-from typing import List
+from typing import Iterator, List, Optional, Pattern, Sequence, Tuple
 
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
-from bs4 import BeautifulSoup
+from fastapi.responses import ORJSONResponse
+from lxml import etree
+from selectolax.lexbor import LexborHTMLParser
 
 from shared.schemas.url_discovery_schemas import (
     URLDiscoveryRequest,
@@ -28,6 +31,7 @@ app = FastAPI(
     title="URL Discovery Service",
     description="Microservice for discovering and filtering URLs from HTML",
     version="0.1.0",
+    default_response_class=ORJSONResponse,
 )
 
 # Add CORS middleware
@@ -39,6 +43,86 @@ app.add_middleware(
 )
 
 
+def _netloc(url: str) -> Optional[str]:
+    """Return the network location of a URL.
+
+    Absolute http(s) URLs are sliced rather than parsed.
+
+    Args:
+        url: URL.
+
+    Returns:
+        Network location, or None if the URL cannot be parsed.
+    """
+    if url.startswith(("http://", "https://")):
+        return url.split("/", 3)[2].partition("?")[0].partition("#")[0]
+    try:
+        return urlparse(url).netloc
+    except ValueError:
+        return None
+
+
+def _origin(url: str) -> Optional[str]:
+    """Return the scheme and netloc of an http(s) URL, e.g. "https://host".
+
+    Args:
+        url: URL.
+
+    Returns:
+        Origin, or None if the URL is not an http(s) URL with a netloc.
+    """
+    try:
+        parsed = urlparse(url)
+    except ValueError:
+        return None
+    if parsed.scheme not in ("http", "https") or not parsed.netloc:
+        return None
+    return f"{parsed.scheme}://{parsed.netloc}"
+
+
+def _resolve_url(href: str, base_url: str, base_origin: Optional[str]) -> str:
+    """Resolve a link against the base URL, with the same result as urljoin.
+
+    Absolute http(s) links and plain root-relative paths are returned or
+    prefixed directly. Anything urljoin would rewrite or reject (dot or empty
+    segments, empty queries, fragments and params, tabs and newlines, brackets or
+    non-ASCII characters in absolute links) goes through urljoin.
+
+    Args:
+        href: Stripped link target.
+        base_url: Base URL for resolving relative links.
+        base_origin: Origin of the base URL, from _origin.
+
+    Returns:
+        Absolute URL.
+    """
+    if (
+        base_origin is not None
+        and "?#" not in href
+        and not href.endswith(("?", "#"))
+        and ";" not in href
+        and "\t" not in href
+        and "\n" not in href
+        and "\r" not in href
+    ):
+        if href.startswith(("http://", "https://")):
+            if (
+                href.isascii()
+                and "[" not in href
+                and "]" not in href
+                and _netloc(href)
+            ):
+                return href
+        elif (
+            href[:1] == "/"
+            and href[1:2] != "/"
+            and "/." not in href
+            and "//" not in href
+        ):
+            return base_origin + href
+    return urljoin(base_url, href)
+
+
 def is_same_domain(url1: str, url2: str) -> bool:
     """Check if two URLs are from the same domain."""
     try:
@@ -49,13 +133,160 @@ def is_same_domain(url1: str, url2: str) -> bool:
         return False
 
 
-def matches_pattern(url: str, pattern: str) -> bool:
-    """Check if URL matches regex pattern."""
+# Lexbor keeps <template> content out of the document tree, so documents with
+# templates go through lxml to still report the links inside them
+_TEMPLATE_RE = re.compile(r"<template", re.IGNORECASE)
+
+# Link text, skipping strings that are not rendered as text
+_LINK_TEXT = etree.XPath(
+    "descendant::text()[not(ancestor::script or ancestor::style"
+    " or ancestor::template)]"
+)
+
+# For documents lxml refuses as str because of an encoding declaration
+_UTF8_HTML_PARSER = etree.HTMLParser(encoding="utf-8")
+
+
+def _parse_html(html: str) -> Optional[etree._Element]:
+    """Parse an HTML document with lxml.
+
+    Args:
+        html: HTML content.
+
+    Returns:
+        Root element, or None for an empty document.
+    """
     try:
-        return bool(re.search(pattern, url))
-    except Exception as e:
+        return etree.HTML(html)
+    except ValueError:
+        # Unicode strings with an XML encoding declaration
+        return etree.HTML(html.encode("utf-8"), _UTF8_HTML_PARSER)
+
+
+def _link_text(link: etree._Element) -> Optional[str]:
+    """Return the stripped text of a link.
+
+    Args:
+        link: Anchor element.
+
+    Returns:
+        Text pieces stripped and joined, or None if empty.
+    """
+    return "".join(text.strip() for text in _LINK_TEXT(link)) or None
+
+
+def _iter_links(html: str) -> Iterator[Tuple[str, Optional[str], Optional[str]]]:
+    """Iterate over the links in an HTML document.
+
+    Parses with Lexbor, falling back to lxml for documents with templates.
+
+    Args:
+        html: HTML content.
+
+    Yields:
+        Tuples of (href, link text, title) for each <a> with an href.
+    """
+    if _TEMPLATE_RE.search(html):
+        root = _parse_html(html)
+        if root is None:
+            return
+        for link in root.iter("a"):
+            href = link.get("href")
+            if href is not None:
+                yield href, _link_text(link), link.get("title")
+        return
+
+    tree = LexborHTMLParser(html)
+    # Script and style text is not part of a link's text
+    tree.strip_tags(["script", "style"])
+    for link in tree.css("a[href]"):
+        attributes = link.attributes
+        yield (
+            # A valueless href is an empty one
+            attributes["href"] or "",
+            link.text(strip=True) or None,
+            attributes.get("title"),
+        )
+
+
+# Matches nothing; stands in for an invalid inclusion pattern
+_NEVER_MATCH = re.compile(r"(?!)")
+
+
+@lru_cache(maxsize=1024)
+def _compile_pattern(pattern: str) -> Optional[Pattern[str]]:
+    """Compile a regex pattern, reusing it across requests.
+
+    Args:
+        pattern: Regex pattern.
+
+    Returns:
+        Compiled pattern, or None if the pattern is invalid.
+    """
+    try:
+        return re.compile(pattern)
+    except re.error as e:
         logger.warning(f"Invalid regex pattern: {pattern}, error: {e}")
-        return False
+        return None
+
+
+def _compile_filters(
+    url_pattern: Optional[str], exclude_patterns: Optional[Sequence[str]]
+) -> Tuple[Optional[Pattern[str]], Tuple[Pattern[str], ...]]:
+    """Compile a request's inclusion and exclusion patterns.
+
+    Invalid patterns never match: an invalid inclusion pattern admits no URLs
+    and an invalid exclusion pattern excludes none.
+
+    Args:
+        url_pattern: Optional inclusion pattern.
+        exclude_patterns: Optional exclusion patterns.
+
+    Returns:
+        Tuple of (compiled inclusion pattern or None, compiled exclusions).
+    """
+    include_re = None
+    if url_pattern:
+        include_re = _compile_pattern(url_pattern) or _NEVER_MATCH
+
+    exclude_res = tuple(
+        compiled
+        for compiled in map(_compile_pattern, exclude_patterns or ())
+        if compiled is not None
+    )
+
+    return include_re, exclude_res
+
+
+def _passes_filters(
+    url: str,
+    include_re: Optional[Pattern[str]],
+    exclude_res: Sequence[Pattern[str]],
+) -> bool:
+    """Check a URL against compiled inclusion and exclusion patterns.
+
+    Args:
+        url: URL to check.
+        include_re: Optional compiled inclusion pattern.
+        exclude_res: Compiled exclusion patterns.
+
+    Returns:
+        True if the URL passes the filters, False otherwise.
+    """
+    for pattern in exclude_res:
+        if pattern.search(url):
+            return False
+
+    if include_re is not None:
+        return include_re.search(url) is not None
+
+    return True
+
+
+def matches_pattern(url: str, pattern: str) -> bool:
+    """Check if URL matches regex pattern."""
+    compiled = _compile_pattern(pattern)
+    return compiled is not None and compiled.search(url) is not None
 
 
 def should_include_url(
@@ -71,17 +302,7 @@ def should_include_url(
     if is_external and not include_external:
         return False
 
-    # Check exclusion patterns
-    if exclude_patterns:
-        for pattern in exclude_patterns:
-            if matches_pattern(url, pattern):
-                return False
-
-    # Check inclusion pattern
-    if url_pattern:
-        return matches_pattern(url, url_pattern)
-
-    return True
+    return _passes_filters(url, *_compile_filters(url_pattern, exclude_patterns))
 
 
 @app.get("/health", response_model=HealthResponse)
@@ -106,42 +327,44 @@ async def discover_urls(request: URLDiscoveryRequest) -> URLDiscoveryResponse:
     try:
         logger.info(f"Discovering URLs from HTML (base: {request.base_url})")
 
-        soup = BeautifulSoup(request.html, "lxml")
-        links = soup.find_all("a", href=True)
+        # Links are external unless they share the base URL's netloc
+        base_netloc = _netloc(request.base_url)
+        base_origin = _origin(request.base_url)
+
+        # Compile the filters once for all links
+        include_re, exclude_res = _compile_filters(
+            request.url_pattern, request.exclude_patterns
+        )
 
         internal_urls = []
         external_urls = []
 
-        for link in links:
-            href = link.get("href", "").strip()
+        for href, text, title in _iter_links(request.html):
+            href = href.strip()
             if not href or href.startswith(("#", "javascript:", "mailto:")):
                 continue
 
             # Resolve relative URLs
-            absolute_url = urljoin(request.base_url, href)
+            absolute_url = _resolve_url(href, request.base_url, base_origin)
 
             # Remove fragment
-            absolute_url = absolute_url.split("#")[0]
+            absolute_url = absolute_url.partition("#")[0]
 
             # Determine if external
-            is_external = not is_same_domain(absolute_url, request.base_url)
+            netloc = _netloc(absolute_url)
+            is_external = netloc is None or netloc != base_netloc
 
             # Check if should include
-            if not should_include_url(
-                absolute_url,
-                request.base_url,
-                is_external,
-                request.include_external,
-                request.url_pattern,
-                request.exclude_patterns,
-            ):
+            if is_external and not request.include_external:
+                continue
+            if not _passes_filters(absolute_url, include_re, exclude_res):
                 continue
 
             # Create URL info
             url_info = URLInfo(
                 href=absolute_url,
-                text=link.get_text(strip=True) or None,
-                title=link.get("title") or None,
+                text=text,
+                title=title or None,
                 is_external=is_external,
             )
 
@@ -36,6 +36,19 @@ class BrowserClient(BaseClient):
         )
         return BrowserResponse(**response_data)
 
+    async def get_artifact(self, artifact_url: str) -> bytes:
+        """Download a raw artifact returned by an artifacts-mode navigate.
+
+        Args:
+            artifact_url: html_url or screenshot_url from a BrowserResponse
+
+        Returns:
+            Raw HTML or PNG bytes
+        """
+        response = await self.client.get(artifact_url)
+        response.raise_for_status()
+        return response.content
+
     async def screenshot(self, url: str, **kwargs) -> BrowserResponse:
         """Capture a screenshot of a URL.
 
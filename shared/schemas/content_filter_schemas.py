@@ -20,6 +20,17 @@ class ContentFilterRequest(BaseModel):
     keep_only_tags: Optional[List[str]] = Field(
         default=None, description="Keep only these HTML tags (e.g., ['p', 'h1', 'h2'])"
     )
+    top_k: Optional[int] = Field(
+        default=None, ge=1, description="Return at most this many top-ranked blocks"
+    )
+
+
+class ContentFilterBatchRequest(BaseModel):
+    """Batch request for filtering several documents at once."""
+
+    items: List[ContentFilterRequest] = Field(
+        ..., min_length=1, description="Documents to filter"
+    )
 
 
 class FilteredBlock(BaseModel):
@@ -33,8 +33,22 @@ class DeepCrawlRequest(BaseModel):
     exclude_patterns: Optional[List[str]] = Field(
         default=None, description="List of regex patterns to exclude"
     )
+    concurrency: int = Field(
+        default=16, ge=1, le=64, description="Maximum number of pages crawled at once"
+    )
+    per_host_concurrency: int = Field(
+        default=4,
+        ge=1,
+        le=64,
+        description="Maximum number of pages crawled at once per host",
+    )
     score_threshold: Optional[float] = Field(
-        default=None, description="Minimum score threshold for URLs (best-first only)"
+        default=None,
+        description=(
+            "Minimum score threshold for URLs (best-first only). Scores run "
+            "from 1.0 for the start page down; depth-1 links score about "
+            "0.6-0.75"
+        ),
     )
     browser_config: Optional[Dict[str, Any]] = Field(
         default=None, description="Configuration for browser service"
@@ -42,6 +56,14 @@ class DeepCrawlRequest(BaseModel):
     scraping_config: Optional[Dict[str, Any]] = Field(
         default=None, description="Configuration for content scraping"
     )
+    browser_service_url: Optional[str] = Field(
+        default=None,
+        description="Allowlisted browser service to crawl with (default if unset)",
+    )
+    scraping_service_url: Optional[str] = Field(
+        default=None,
+        description="Allowlisted scraping service to crawl with (default if unset)",
+    )
 
 
 class CrawlResultItem(BaseModel):
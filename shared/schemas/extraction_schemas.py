@@ -37,6 +37,30 @@ class XPathExtractionRequest(BaseModel):
     )
 
 
+class CSSBatchExtractionRequest(BaseModel):
+    """Request for several CSS selectors applied to one document."""
+
+    html: str = Field(..., description="HTML content to extract from")
+    selectors: List[str] = Field(..., min_length=1, description="CSS selectors")
+    extract_text: bool = Field(default=True, description="Extract text content")
+    extract_html: bool = Field(default=False, description="Extract raw HTML")
+    extract_attributes: Optional[List[str]] = Field(
+        default=None, description="List of attributes to extract"
+    )
+
+
+class XPathBatchExtractionRequest(BaseModel):
+    """Request for several XPath expressions applied to one document."""
+
+    html: str = Field(..., description="HTML content to extract from")
+    xpaths: List[str] = Field(..., min_length=1, description="XPath expressions")
+    extract_text: bool = Field(default=True, description="Extract text content")
+    extract_html: bool = Field(default=False, description="Extract raw HTML")
+    extract_attributes: Optional[List[str]] = Field(
+        default=None, description="List of attributes to extract"
+    )
+
+
 class RegexExtractionRequest(BaseModel):
     """Request for regex extraction."""
 
@@ -69,6 +93,15 @@ class ExtractionResponse(BaseModel):
     count: int = Field(..., description="Number of results")
 
 
+class BatchExtractionResponse(BaseModel):
+    """Response from a batch extraction."""
+
+    results: Dict[str, List[ExtractionResult]] = Field(
+        ..., description="Extraction results by selector or expression"
+    )
+    count: int = Field(..., description="Total number of results")
+
+
 class HealthResponse(BaseModel):
     """Health check response."""
 
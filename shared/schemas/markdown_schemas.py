@@ -46,3 +46,6 @@ class HealthResponse(BaseModel):
 
     status: str = Field(default="healthy")
     service: str = Field(default="markdown-service")
+    cache: Optional[Dict[str, int]] = Field(
+        default=None, description="Result cache hits, misses, size and maxsize"
+    )
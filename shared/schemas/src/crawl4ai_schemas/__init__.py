@@ -2,15 +2,17 @@
 
 __version__ = "0.1.0"
 
-from .browser import BrowserRequest, BrowserResponse, PageAction
-from .scraping import ScrapingRequest, ScrapingResponse
+from .browser import BrowserBatchRequest, BrowserRequest, BrowserResponse, PageAction
+from .scraping import ScrapingBatchRequest, ScrapingRequest, ScrapingResponse
 from .extraction import ExtractionRequest, ExtractionResponse, ExtractionSchema
 from .filtering import FilteringRequest, FilteringResponse, FilterType
 
 __all__ = [
+    "BrowserBatchRequest",
     "BrowserRequest",
     "BrowserResponse",
     "PageAction",
+    "ScrapingBatchRequest",
     "ScrapingRequest",
     "ScrapingResponse",
     "ExtractionRequest",
@@ -1,7 +1,7 @@
 """Browser service API schemas."""
 
 from enum import Enum
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 from pydantic import BaseModel, Field, HttpUrl
 
 
@@ -46,20 +46,43 @@ class BrowserRequest(BaseModel):
         default=None, description="Custom headers"
     )
     proxy: Optional[str] = Field(default=None, description="Proxy URL")
+    artifacts: bool = Field(
+        default=False,
+        description="Return HTML/screenshot as one-shot artifact URLs instead of inline",
+    )
     metadata: Dict[str, Any] = Field(
         default_factory=dict, description="Additional metadata"
     )
 
 
+class BrowserBatchRequest(BaseModel):
+    """Batch of navigations sharing one browser configuration."""
+
+    # Every URL gets its own page, so a batch is capped like a crawl wave
+    urls: List[HttpUrl] = Field(
+        min_length=1, max_length=64, description="URLs to navigate to"
+    )
+    config: Dict[str, Any] = Field(
+        default_factory=dict,
+        description="BrowserRequest fields applied to every URL",
+    )
+
+
 class BrowserResponse(BaseModel):
     """Response from browser service."""
 
     success: bool = Field(description="Whether the action was successful")
     url: str = Field(description="Final URL after navigation")
     html: Optional[str] = Field(default=None, description="Page HTML content")
+    html_url: Optional[str] = Field(
+        default=None, description="URL serving the raw HTML (artifacts mode)"
+    )
     screenshot: Optional[str] = Field(
         default=None, description="Base64 encoded screenshot"
     )
+    screenshot_url: Optional[str] = Field(
+        default=None, description="URL serving the raw PNG screenshot (artifacts mode)"
+    )
     javascript_result: Optional[Any] = Field(
         default=None, description="Result of JavaScript execution"
     )
@@ -39,6 +39,14 @@ class ScrapingRequest(BaseModel):
     )
 
 
+class ScrapingBatchRequest(BaseModel):
+    """Batch of documents to scrape in one call."""
+
+    items: List[ScrapingRequest] = Field(
+        min_length=1, description="Scraping requests, answered in order"
+    )
+
+
 class ScrapingResponse(BaseModel):
     """Response from content scraping service."""
 